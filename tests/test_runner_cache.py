@@ -0,0 +1,71 @@
+import json
+import time
+
+import winecharm
+
+RunnerCache = winecharm.RunnerCache
+
+
+def make_runner(tmp_path, exit_code):
+    runner = tmp_path / "wine"
+    runner.write_text(f"#!/bin/sh\necho wine-9.0\nexit {exit_code}\n")
+    runner.chmod(0o755)
+    return runner
+
+
+def wait_for_revalidation(cache):
+    deadline = time.monotonic() + 10
+    while cache.revalidating and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_valid_probe_is_cached_and_saved(tmp_path):
+    runner = make_runner(tmp_path, 0)
+    cache = RunnerCache(tmp_path / "runner_cache.json")
+    entry = cache.validate(runner)
+    assert entry['valid'] and entry['version'] == "wine-9.0"
+    assert cache.validate(runner) is entry
+
+    cache.save()
+    saved = json.loads((tmp_path / "runner_cache.json").read_text())
+    assert saved[str(runner.resolve())]['valid']
+
+
+def test_failed_probe_is_not_saved(tmp_path):
+    runner = make_runner(tmp_path, 1)
+    cache = RunnerCache(tmp_path / "runner_cache.json")
+    assert not cache.validate(runner)['valid']
+
+    cache.save()
+    assert json.loads((tmp_path / "runner_cache.json").read_text()) == {}
+
+
+def test_failed_probe_is_revalidated(tmp_path):
+    runner = make_runner(tmp_path, 1)
+    cache = RunnerCache(tmp_path / "runner_cache.json")
+    assert not cache.validate(runner)['valid']
+
+    # The runner works now (say the failure was a timeout) while the cached entry
+    # still matches the binary
+    make_runner(tmp_path, 0)
+    cache.entries[str(runner.resolve())]['fingerprint'] = cache.fingerprint(runner)
+
+    assert not cache.validate(runner)['valid']  # answered from the cache...
+    wait_for_revalidation(cache)
+    assert cache.validate(runner)['valid']  # ...and probed again in the background
+
+
+def test_unreadable_cache_file_starts_empty(tmp_path):
+    cache_file = tmp_path / "runner_cache.json"
+    cache_file.write_text("{not json")
+    runner = make_runner(tmp_path, 0)
+    assert RunnerCache(cache_file).validate(runner)['valid']
+
+
+def test_unknown_runner_is_probed_in_the_background_without_wait(tmp_path):
+    runner = make_runner(tmp_path, 1)
+    cache = RunnerCache(tmp_path / "runner_cache.json")
+    probed = []
+    assert cache.validate(runner, wait=False, on_probed=probed.append) is None
+    wait_for_revalidation(cache)
+    assert len(probed) == 1 and not probed[0]['valid']
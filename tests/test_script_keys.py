@@ -0,0 +1,71 @@
+import types
+
+import winecharm
+
+WineCharmApp = winecharm.WineCharmApp
+
+
+def make_app(tmp_path, fingerprint_mode=True, script_list=None):
+    """Just the state identify_exe and get_script_key use, without GTK."""
+    return types.SimpleNamespace(
+        fingerprint_mode=fingerprint_mode,
+        script_list=script_list if script_list is not None else {},
+        hash_cache=winecharm.HashCache(tmp_path / "hash_cache.json"),
+        print_method_name=lambda: None,
+        on_hash_progress=None,
+        is_hash_cancelled=lambda: False,
+    )
+
+
+def make_exe(tmp_path):
+    exe = tmp_path / "game.exe"
+    exe.write_bytes(b"MZ" + bytes(range(256)) * 64)
+    return exe
+
+
+def yaml_data_for(full_sha256, fingerprint):
+    """The identity fields create_yaml_file writes into the .charm."""
+    data = {'sha256sum': full_sha256}
+    if fingerprint:
+        data['fingerprint'] = fingerprint
+    return data
+
+
+def test_same_exe_twice_in_fingerprint_mode_keeps_one_key(tmp_path):
+    app = make_app(tmp_path)
+    exe = make_exe(tmp_path)
+
+    first_key, full_sha256, fingerprint = WineCharmApp.identify_exe(app, exe)
+    assert first_key == fingerprint
+    app.script_list[first_key] = yaml_data_for(full_sha256, fingerprint)
+    assert WineCharmApp.get_script_key(app, app.script_list[first_key]) == first_key
+
+    second_key, full_sha256, fingerprint = WineCharmApp.identify_exe(app, exe)
+    assert second_key == first_key
+    assert WineCharmApp.get_script_key(app, yaml_data_for(full_sha256, fingerprint)) == first_key
+
+
+def test_exe_known_by_full_hash_keeps_full_hash_key_in_fingerprint_mode(tmp_path):
+    exe = make_exe(tmp_path)
+    # Created once without fingerprint mode: keyed by the full hash
+    app = make_app(tmp_path, fingerprint_mode=False)
+    first_key, full_sha256, fingerprint = WineCharmApp.identify_exe(app, exe)
+    assert fingerprint is None
+    app.script_list[first_key] = yaml_data_for(full_sha256, fingerprint)
+
+    # Created again in fingerprint mode
+    app.fingerprint_mode = True
+    second_key, full_sha256, fingerprint = WineCharmApp.identify_exe(app, exe)
+    assert second_key == first_key
+    assert fingerprint is None
+    data = yaml_data_for(full_sha256, fingerprint)
+    assert 'fingerprint' not in data
+    assert WineCharmApp.get_script_key(app, data) == first_key
+
+
+def test_get_script_key_prefers_existing_full_hash_key(tmp_path):
+    app = make_app(tmp_path, script_list={"f" * 64: {}})
+    data = {'sha256sum': "f" * 64, 'fingerprint': "a" * 64}
+    assert WineCharmApp.get_script_key(app, data) == "f" * 64
+    app.script_list = {}
+    assert WineCharmApp.get_script_key(app, data) == "a" * 64
@@ -0,0 +1,51 @@
+import pytest
+
+import winecharm
+
+
+@pytest.fixture
+def index():
+    index = winecharm.ScriptSearchIndex()
+    for key, progname in (("fallout", "Fallout 2"), ("minecraft", "Minecraft"),
+                          ("notepad", "Notepad++"), ("cafe", "Café Manager"),
+                          ("setup", "Setup Wizard")):
+        index.add(key, progname, f"{key}.exe", progname.replace(" ", "_"))
+    return index
+
+
+def test_empty_query_matches_everything(index):
+    assert index.search("") is None
+    assert index.search("   ") is None
+
+
+def test_ranks_exact_prefix_word_prefix_and_substring(index):
+    assert index.search("minecraft")["minecraft"] == 0
+    assert index.search("fall")["fallout"] == 1
+    assert index.search("wiz")["setup"] == 2
+    assert index.search("necra")["minecraft"] == 3
+
+
+def test_short_queries_match_substrings(index):
+    assert set(index.search("2")) == {"fallout"}
+    assert set(index.search("ft")) == {"minecraft"}
+    assert index.search("mi")["minecraft"] == 1
+
+
+def test_accents_and_case_are_ignored(index):
+    assert "cafe" in index.search("CAFE")
+    assert "cafe" in index.search("café")
+
+
+def test_fuzzy_matches_typos(index):
+    assert index.search("mincraft")["minecraft"] == 4
+
+
+def test_fuzzy_needs_two_shared_trigrams(index):
+    # "setx" shares only "set" with "Setup Wizard"
+    assert "setup" not in index.search("setx")
+
+
+def test_remove_drops_script(index):
+    index.remove("fallout")
+    assert "fallout" not in index.search("fallout")
+    assert "fallout" not in index.search("2")
@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 
-import gi
 import threading
 import subprocess
 import os
@@ -22,19 +21,1844 @@ import argparse
 import uuid
 import urllib.request
 import json
+import atexit
+import functools
+import concurrent.futures
+import collections
+import traceback
+import unicodedata
+
+from datetime import datetime, timedelta
+
+
+########## Launcher (no GTK)
+# Headless .charm launches and files forwarded to an already running instance
+# are handled here, before gi is imported, so desktop shortcuts start fast.
+
+WINECHARM_DIR = Path(os.path.expanduser("~/.var/app/io.github.fastrizwaan.WineCharm/data/winecharm")).resolve()
+SOCKET_FILE = WINECHARM_DIR / "winecharm_socket"
+GUI_FILE_EXTENSIONS = ['.exe', '.msi', '.bottle', '.prefix', '.wzt']
+INVALID_FILE_TYPE_MESSAGE = "Only .exe, .msi, .charm, .bottle, .prefix, or .wzt files are allowed."
+
+
+def parse_args():
+    """
+    Parse command-line arguments.
+    """
+    parser = argparse.ArgumentParser(description="WineCharm GUI application or headless mode for .charm files")
+    parser.add_argument('file', nargs='?', help="Path to the .exe, .msi, .charm, .bottle, .prefix, or .wzt file")
+    return parser.parse_args()
+
+
+def launch_charm_headless(file_path):
+    """
+    Launches the executable described by a .charm file without any GUI.
+
+    Returns:
+        int: The exit status for the launcher process.
+    """
+    try:
+        # Load the .charm file data
+        with open(file_path, 'r', encoding='utf-8') as file:
+            script_data = yaml.safe_load(file)
+
+        exe_file = script_data.get("exe_file")
+        if not exe_file:
+            print("Error: No executable file defined in the .charm script.")
+            return 1
+
+        # Prepare to launch the executable
+        exe_path = Path(exe_file).expanduser().resolve()
+        if not exe_path.exists():
+            print(f"Error: Executable '{exe_path}' not found.")
+            return 1
+
+        # Extract additional environment and arguments
+
+        # if .charm file has script_path use it
+        wineprefix_path_candidate = script_data.get('script_path')
+
+        if not wineprefix_path_candidate:  # script_path not found
+            # if .charm file has wineprefix in it, then use it
+            wineprefix_path_candidate = script_data.get('wineprefix')
+            if not wineprefix_path_candidate:  # if wineprefix not found
+                wineprefix_path_candidate = file_path  # use the current .charm file's path
+
+        # Resolve the final wineprefix path
+        wineprefix = Path(wineprefix_path_candidate).parent.expanduser().resolve()
+
+        env_vars = script_data.get("env_vars", "").strip()
+        script_args = script_data.get("args", "").strip()
+        runner = script_data.get("runner", "wine")
+
+        # Resolve runner path
+        if runner:
+            runner = Path(runner).expanduser().resolve()
+            runner_dir = str(runner.parent.expanduser().resolve())
+            path_env = f'export PATH="{runner_dir}:$PATH"'
+        else:
+            runner = "wine"
+            runner_dir = ""  # Or set a specific default if required
+            path_env = ""
+
+        # Prepare the command safely using shlex for quoting
+        exe_parent = shlex.quote(str(exe_path.parent.resolve()))
+        wineprefix = shlex.quote(str(wineprefix))
+        runner = shlex.quote(str(runner))
+
+        # Construct the command parts
+        command_parts = []
+
+        # Add path to runner if it exists
+        if path_env:
+            command_parts.append(f"{path_env}")
+
+        # Change to the executable's directory
+        command_parts.append(f"cd {exe_parent}")
+
+        # Add environment variables if present
+        if env_vars:
+            command_parts.append(f"{env_vars}")
+
+        # Add wineprefix and runner
+        command_parts.append(f"WINEPREFIX={wineprefix} {runner} {shlex.quote(str(exe_path))}")
+
+        # Add script arguments if present
+        if script_args:
+            command_parts.append(f"{script_args}")
+
+        # Join all the command parts
+        command = " && ".join(command_parts)
+
+        print(f"Executing: {command}")
+        subprocess.run(command, shell=True)
+        return 0
+
+    except Exception as e:
+        print(f"Error: Unable to launch the .charm script: {e}")
+        return 1
+
+
+def send_to_running_instance(message):
+    """
+    Sends a message to a running WineCharm instance over SOCKET_FILE.
+
+    Returns:
+        bool: True if an instance received the message.
+    """
+    if not SOCKET_FILE.exists():
+        return False
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(str(SOCKET_FILE))
+            client.sendall(message.encode())
+        return True
+    except (ConnectionRefusedError, FileNotFoundError):
+        print("No existing instance found, starting a new one.")
+        return False
+
+
+def run_without_gui(args):
+    """
+    Handles the command lines that never need a window: .charm files are launched
+    headless, other files are forwarded to a running instance if there is one.
+
+    Returns:
+        bool: True if the request was handled and no GUI should be started.
+    """
+    if not args.file:
+        return False
+
+    file_path = Path(args.file).expanduser().resolve()
+    file_extension = file_path.suffix.lower()
+
+    # If it's a .charm file, launch it without GUI
+    if file_extension == '.charm':
+        # Exit after headless execution to ensure no GUI elements are opened
+        sys.exit(launch_charm_headless(file_path))
+
+    if file_extension in GUI_FILE_EXTENSIONS:
+        # Send the file to an existing running instance
+        if send_to_running_instance(f"process_file||{args.file}"):
+            print(f"Sent file path to existing instance: {args.file}")
+            return True
+        return False
+
+    # Invalid file type, print error and let a running instance show the dialog
+    print(f"Invalid file type: {file_extension}. {INVALID_FILE_TYPE_MESSAGE}")
+    return send_to_running_instance(f"show_dialog||Invalid file type: {file_extension}||{INVALID_FILE_TYPE_MESSAGE}")
+
+
+if __name__ == "__main__":
+    cli_args = parse_args()
+    if run_without_gui(cli_args):
+        sys.exit(0)
+
+########## /Launcher
+
+
+########## Tracing
+
+class Tracer:
+    """
+    Opt-in span recorder that replaces the old unconditional print_method_name output.
+
+    Tracing is off by default and then costs a single attribute check per call.
+    It is turned on with WINECHARM_TRACE (1, or an output path ending in .json or
+    .jsonl) or with "trace: true" in Settings.yaml. When on, every WineCharmApp
+    method call is recorded as a span with its duration, thread and key arguments,
+    and the trace is written at exit as Chrome trace JSON (chrome://tracing,
+    ui.perfetto.dev) or as JSON lines.
+    """
+
+    # Arguments worth recording with a span
+    traced_args = ('script_key', 'script', 'file_path', 'prefixdir', 'wineprefix', 'step_text')
+
+    def __init__(self, max_events=1000000):
+        self.enabled = False
+        self.output_path = None
+        self.max_events = max_events
+        self.events = []
+        self.thread_names = {}
+        self.pid = os.getpid()
+        self.start_time = time.perf_counter()
+
+    def enable(self, output_path):
+        if self.enabled:
+            return
+        self.output_path = Path(output_path).expanduser()
+        self.enabled = True
+        atexit.register(self.flush)
+        print(f"Tracing enabled, writing trace to {self.output_path} at exit")
+
+    def now_us(self):
+        return (time.perf_counter() - self.start_time) * 1000000
+
+    def record(self, name, start_us, duration_us=None, args=None):
+        if len(self.events) >= self.max_events:
+            return
+        thread = threading.current_thread()
+        self.thread_names.setdefault(thread.ident, thread.name)
+        event = {"name": name, "ts": start_us, "pid": self.pid, "tid": thread.ident}
+        if duration_us is None:
+            event["ph"] = "i"
+            event["s"] = "t"
+        else:
+            event["ph"] = "X"
+            event["dur"] = duration_us
+        if args:
+            event["args"] = args
+        self.events.append(event)  # list.append is atomic, no lock needed
+
+    def instant(self, name, **args):
+        if self.enabled:
+            self.record(name, self.now_us(), None, args)
+
+    def span(self, name, **args):
+        """Context manager recording the enclosed block as a span."""
+        return TraceSpan(self, name, args)
+
+    def traced(self, func):
+        """Wraps func so every call is recorded as a span while tracing is enabled."""
+        name = func.__qualname__
+        try:
+            parameters = list(inspect.signature(func).parameters)
+        except (TypeError, ValueError):
+            parameters = []
+        arg_positions = [(index, param) for index, param in enumerate(parameters) if param in self.traced_args]
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not self.enabled:
+                return func(*args, **kwargs)
+            span_args = {}
+            for index, param in arg_positions:
+                value = kwargs[param] if param in kwargs else (args[index] if index < len(args) else None)
+                if value is not None:
+                    span_args[param] = str(value)[:200]
+            start = self.now_us()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(name, start, self.now_us() - start, span_args)
+
+        wrapper.__wrapped_for_trace__ = True
+        return wrapper
+
+    def instrument(self, cls):
+        """Wraps every regular method defined on cls with traced()."""
+        for attr_name, value in list(vars(cls).items()):
+            if attr_name.startswith('__') or attr_name == 'print_method_name':
+                continue
+            if inspect.isfunction(value) and not getattr(value, '__wrapped_for_trace__', False):
+                setattr(cls, attr_name, self.traced(value))
+
+    def flush(self):
+        """Writes the collected events to output_path (Chrome trace JSON or JSON lines)."""
+        if not self.output_path:
+            return
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid, "args": {"name": thread_name}}
+            for tid, thread_name in self.thread_names.items()
+        ]
+        events = metadata + list(self.events)
+        temp_path = self.output_path.with_name(self.output_path.name + ".tmp")
+        try:
+            self.output_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, 'w') as f:
+                if self.output_path.suffix == '.jsonl':
+                    for event in events:
+                        f.write(json.dumps(event, default=str) + "\n")
+                else:
+                    json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, default=str)
+            os.replace(temp_path, self.output_path)
+            print(f"Trace with {len(self.events)} events written to {self.output_path}")
+        except Exception as e:
+            print(f"Error writing trace file: {e}")
+
+
+class TraceSpan:
+    """Context manager returned by Tracer.span()."""
+    __slots__ = ('tracer', 'name', 'args', 'start')
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+        self.start = None
+
+    def __enter__(self):
+        if self.tracer.enabled:
+            self.start = self.tracer.now_us()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.start is not None:
+            self.tracer.record(self.name, self.start, self.tracer.now_us() - self.start, self.args)
+        return False
+
+
+def trace_output_path(value):
+    """Maps a WINECHARM_TRACE value or the trace setting to an output file, or None if off."""
+    if not value or str(value).lower() in ('0', 'false', 'no', 'off'):
+        return None
+    if str(value).lower() in ('1', 'true', 'yes', 'on'):
+        return WINECHARM_DIR / f"trace-{datetime.now().strftime('%Y%m%d%H%M%S')}.json"
+    return Path(value)
+
+
+TRACER = Tracer()
+
+if trace_output_path(os.environ.get("WINECHARM_TRACE")):
+    TRACER.enable(trace_output_path(os.environ.get("WINECHARM_TRACE")))
+
+########## /Tracing
+
+
+########## Stall watchdog
+
+class StallWatchdog:
+    """
+    Detects main loop stalls. beat() is run on the main loop every interval_ms; a
+    watcher thread notices when it is overdue by more than threshold_ms, takes the main
+    thread's stack at that moment, and the stall is recorded with its full duration
+    once the main loop turns over again. The last `history` stalls are kept.
+    """
+    def __init__(self, threshold_ms=100, interval_ms=50, history=50):
+        self.threshold = threshold_ms / 1000
+        self.interval = interval_ms / 1000
+        self.stalls = collections.deque(maxlen=history)
+        self.lock = threading.Lock()
+        self.last_beat = time.monotonic()
+        self.stall_stack = None  # stack of the stall in progress
+        self.main_thread_id = threading.main_thread().ident
+
+    def start(self, schedule):
+        """schedule(interval_ms, func) must call func repeatedly on the main loop."""
+        self.last_beat = time.monotonic()
+        schedule(int(self.interval * 1000), self.beat)
+        threading.Thread(target=self.watch, name="stall-watchdog", daemon=True).start()
+
+    def beat(self):
+        now = time.monotonic()
+        with self.lock:
+            stack = self.stall_stack
+            gap = now - self.last_beat - self.interval
+            self.stall_stack = None
+            self.last_beat = now
+        if stack is not None:
+            duration_ms = gap * 1000
+            self.stalls.append({
+                'time': datetime.now().strftime('%H:%M:%S'),
+                'duration_ms': round(duration_ms),
+                'stack': stack
+            })
+            print(f"Main loop stalled for {duration_ms:.0f} ms")
+            TRACER.instant("main-loop-stall", duration_ms=round(duration_ms))
+        return True
+
+    def watch(self):
+        while True:
+            time.sleep(self.interval / 2)
+            with self.lock:
+                overdue = time.monotonic() - self.last_beat - self.interval > self.threshold
+                if not overdue or self.stall_stack is not None:
+                    continue
+            frame = sys._current_frames().get(self.main_thread_id)
+            stack = ''.join(traceback.format_stack(frame)) if frame else "(main thread stack unavailable)"
+            with self.lock:
+                # The main loop may have caught up while the stack was taken
+                if time.monotonic() - self.last_beat - self.interval > self.threshold:
+                    self.stall_stack = stack
+
+    def report(self):
+        """Returns the recorded stalls as text, newest first."""
+        if not self.stalls:
+            return "No main loop stalls recorded."
+        return "\n".join(
+            f"{stall['time']}  {stall['duration_ms']} ms\n{stall['stack']}" for stall in reversed(self.stalls)
+        )
+
+
+def stall_threshold_ms(value):
+    """
+    Maps WINECHARM_STALL_MS or the stall-watchdog setting to a threshold in ms, or None
+    if the watchdog is off (the default). "1"/"on" uses 100 ms.
+    """
+    if not value or str(value).lower() in ('0', 'false', 'no', 'off'):
+        return None
+    if str(value).lower() in ('1', 'true', 'yes', 'on'):
+        return 100
+    try:
+        return max(1, int(value))
+    except ValueError:
+        return 100
+
+########## /Stall watchdog
+
+
+########## JSON cache files
+
+def load_json_dict(path, what):
+    """Returns the dict stored in the JSON file at path; {} if it is missing or unreadable."""
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"{what.capitalize()} unreadable, starting empty: {e}")
+        return {}
+
+
+def save_json_atomic(path, data, what):
+    """Writes data to path as JSON through a temporary file, so readers never see half a file."""
+    path = Path(path)
+    temp_file = path.with_name(path.name + ".tmp")
+    try:
+        with open(temp_file, 'w') as f:
+            json.dump(data, f)
+        os.replace(temp_file, path)
+    except Exception as e:
+        print(f"Error saving {what}: {e}")
+
+########## /JSON cache files
+
+
+########## Hash cache
+
+class HashCancelled(Exception):
+    """Raised when a hash computation is cancelled."""
+
+
+class HashCache:
+    """
+    SHA-256 digests of executables, cached on disk and keyed by
+    (device, inode, size, mtime_ns) so an unchanged file is never read twice.
+
+    sha256() hashes synchronously (call it from worker threads); submit() runs the
+    same work in a small thread pool and calls back with the result. Files are read
+    in large chunks so progress can be reported and the work cancelled in between.
+    """
+
+    chunk_size = 4 * 1024 * 1024
+
+    def __init__(self, cache_file, max_workers=2):
+        self.cache_file = Path(cache_file)
+        self.lock = threading.Lock()
+        self.entries = None  # loaded on first use
+        self.dirty = False
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hash")
+        atexit.register(self.save)
+
+    @staticmethod
+    def file_key(path):
+        stat = os.stat(path)
+        return f"{stat.st_dev}:{stat.st_ino}:{stat.st_size}:{stat.st_mtime_ns}", stat.st_size
+
+    def load(self):
+        if self.entries is None:
+            self.entries = load_json_dict(self.cache_file, "hash cache")
+
+    def save(self):
+        with self.lock:
+            if not self.dirty:
+                return
+            entries = dict(self.entries)
+            self.dirty = False
+        save_json_atomic(self.cache_file, entries, "hash cache")
+
+    def lookup(self, path):
+        """Returns the cached digest of path, or None if the file changed or was never hashed."""
+        try:
+            key, _ = self.file_key(path)
+        except OSError:
+            return None
+        with self.lock:
+            self.load()
+            return self.entries.get(key)
+
+    def sha256(self, path, progress=None, is_cancelled=None):
+        """
+        Returns the SHA-256 hex digest of path, from the cache when possible.
+
+        Args:
+            progress: Optional callable(bytes_done, bytes_total), called after every chunk.
+            is_cancelled: Optional callable; when it returns True, HashCancelled is raised.
+        """
+        key, size = self.file_key(path)
+        with self.lock:
+            self.load()
+            digest = self.entries.get(key)
+        if digest:
+            if progress:
+                progress(size, size)
+            return digest
+
+        with open(path, "rb") as f:
+            if progress is None and is_cancelled is None and hasattr(hashlib, "file_digest"):
+                digest = hashlib.file_digest(f, "sha256").hexdigest()
+            else:
+                sha256_hash = hashlib.sha256()
+                buffer = bytearray(self.chunk_size)
+                view = memoryview(buffer)
+                done = 0
+                while True:
+                    if is_cancelled and is_cancelled():
+                        raise HashCancelled(f"Hashing of {path} cancelled")
+                    read = f.readinto(buffer)
+                    if not read:
+                        break
+                    sha256_hash.update(view[:read])
+                    done += read
+                    if progress:
+                        progress(done, size)
+                digest = sha256_hash.hexdigest()
+
+        with self.lock:
+            self.entries[key] = digest
+            self.dirty = True
+        return digest
+
+    sample_size = 1024 * 1024
+
+    def fingerprint(self, path):
+        """
+        Returns a fast identity for path: SHA-256 over the file size and three sampled
+        chunks (head, middle, tail). Small files are hashed whole. Reads at most
+        3 * sample_size bytes, however large the file is.
+        """
+        size = os.stat(path).st_size
+        fingerprint_hash = hashlib.sha256(f"{size}:".encode())
+        with open(path, "rb") as f:
+            if size <= 3 * self.sample_size:
+                fingerprint_hash.update(f.read())
+            else:
+                for offset in (0, (size - self.sample_size) // 2, size - self.sample_size):
+                    f.seek(offset)
+                    fingerprint_hash.update(f.read(self.sample_size))
+        return fingerprint_hash.hexdigest()
+
+    def submit(self, path, callback, progress=None, is_cancelled=None):
+        """
+        Hashes path in the worker pool and calls callback(path, digest, error) from that
+        worker when done; digest is None on error or cancellation.
+
+        Returns:
+            concurrent.futures.Future
+        """
+        def job():
+            try:
+                digest = self.sha256(path, progress, is_cancelled)
+            except Exception as e:
+                callback(path, None, e)
+                return None
+            callback(path, digest, None)
+            return digest
+
+        return self.executor.submit(job)
+
+########## /Hash cache
+
+
+########## Runner cache
+
+class RunnerCache:
+    """
+    Results of `<runner> --version` probes, cached on disk by resolved runner path
+    together with the binary's (inode, size, mtime_ns).
+
+    validate() answers from the cache while the binary is unchanged and worked. When
+    it has changed or its last probe failed, the previous answer is returned and the
+    runner is probed again in the background; a runner never seen before is probed
+    synchronously unless the caller asks not to wait. Failed probes are not saved.
+    """
+
+    probe_timeout = 30
+
+    def __init__(self, cache_file):
+        self.cache_file = Path(cache_file)
+        self.lock = threading.Lock()
+        self.entries = None  # loaded on first use
+        self.dirty = False
+        self.revalidating = set()
+        atexit.register(self.save)
+
+    @staticmethod
+    def fingerprint(path):
+        stat = os.stat(path)
+        return f"{stat.st_ino}:{stat.st_size}:{stat.st_mtime_ns}"
+
+    def load(self):
+        if self.entries is None:
+            self.entries = load_json_dict(self.cache_file, "runner cache")
+
+    def save(self):
+        with self.lock:
+            if not self.dirty:
+                return
+            # A failed probe may have been a passing problem (a slow disk, a timeout),
+            # so only working runners are remembered across restarts
+            entries = {key: entry for key, entry in self.entries.items() if entry.get('valid')}
+            self.dirty = False
+        save_json_atomic(self.cache_file, entries, "runner cache")
+
+    def probe(self, runner_path):
+        """Runs `<runner> --version` and caches the result; returns the entry."""
+        key = str(Path(runner_path).resolve())
+        fingerprint = self.fingerprint(key)
+        try:
+            result = subprocess.run(
+                [str(runner_path), "--version"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                timeout=self.probe_timeout
+            )
+            entry = {'fingerprint': fingerprint, 'valid': result.returncode == 0,
+                     'version': result.stdout.strip(), 'error': result.stderr.strip()}
+        except Exception as e:
+            entry = {'fingerprint': fingerprint, 'valid': False, 'version': "", 'error': str(e)}
+        with self.lock:
+            self.load()
+            self.entries[key] = entry
+            self.dirty = True
+        return entry
+
+    def validate(self, runner_path, wait=True, on_probed=None):
+        """
+        Returns the cached entry ({'valid', 'version', 'error', ...}) for runner_path.
+        With wait=False a runner never seen before is probed in the background too:
+        None is returned and on_probed(entry), if given, is called from the probing
+        thread with the result.
+
+        Raises:
+            OSError: if runner_path does not exist.
+        """
+        key = str(Path(runner_path).resolve())
+        fingerprint = self.fingerprint(key)
+        with self.lock:
+            self.load()
+            entry = self.entries.get(key)
+            if entry is None and wait:
+                pass
+            elif entry is not None and entry.get('fingerprint') == fingerprint and entry.get('valid'):
+                return entry
+            elif key in self.revalidating:
+                return entry
+            else:
+                self.revalidating.add(key)
+        if entry is None and wait:
+            return self.probe(runner_path)
+
+        def revalidate():
+            try:
+                result = self.probe(runner_path)
+                if on_probed:
+                    on_probed(result)
+            finally:
+                with self.lock:
+                    self.revalidating.discard(key)
+        threading.Thread(target=revalidate, daemon=True).start()
+        return entry
+
+########## /Runner cache
+
+
+########## Wineserver pre-warm
+
+class WineserverPrewarmer:
+    """
+    Starts a persistent `wineserver -p<timeout>` for a prefix when a launch looks
+    likely (the script was selected or hovered), so the server is up and the prefix
+    registry loaded by the time the game starts. Without a launch the server exits
+    by itself once it has been idle for `timeout` seconds.
+
+    A prefix is warmed at most once per `interval` seconds, at most `max_prefixes`
+    warmed servers are alive at a time, and nothing is started while less than
+    `min_available_mb` of memory is available.
+    """
+    def __init__(self, timeout=60, interval=30, max_prefixes=3, min_available_mb=1024):
+        self.timeout = timeout
+        self.interval = interval
+        self.max_prefixes = max_prefixes
+        self.min_available_mb = min_available_mb
+        self.warmed = {}  # wineprefix -> time.monotonic() of the last warm-up
+        self.lock = threading.Lock()
+
+    def reserve(self, wineprefix):
+        """Returns True and records the warm-up if the limits allow warming wineprefix now."""
+        now = time.monotonic()
+        with self.lock:
+            self.warmed = {prefix: started for prefix, started in self.warmed.items()
+                           if now - started < max(self.timeout, self.interval)}
+            if wineprefix in self.warmed:
+                return False
+            alive = sum(1 for started in self.warmed.values() if now - started < self.timeout)
+            if alive >= self.max_prefixes:
+                return False
+            try:
+                if psutil.virtual_memory().available < self.min_available_mb * 1024 * 1024:
+                    return False
+            except Exception:
+                return False
+            self.warmed[wineprefix] = now
+            return True
+
+    def warm(self, wineprefix, wineserver, env_vars=""):
+        """
+        Starts the server for wineprefix with the given wineserver binary; blocks briefly.
+        env_vars are the script's shell assignments (WINEESYNC=1 ...), passed the way a
+        launch passes them, so the programs started later can use this server.
+        """
+        command = (
+            f"{env_vars} "
+            f"WINEPREFIX={shlex.quote(str(wineprefix))} "
+            f"{shlex.quote(str(wineserver))} -p{self.timeout}"
+        )
+        try:
+            # wineserver daemonizes once it is ready; an already running server makes it exit
+            subprocess.run(["sh", "-c", command],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                           start_new_session=True, timeout=30)
+            print(f"Pre-warmed wineserver for {wineprefix}")
+        except Exception as e:
+            print(f"Could not pre-warm wineserver for {wineprefix}: {e}")
+
+########## /Wineserver pre-warm
+
+
+########## Settings store
+
+class SettingsStore:
+    """
+    In-memory copy of Settings.yaml.
+
+    The file is read once, on first use. Changes notify the subscribers; writes are
+    debounced through schedule (GLib.timeout_add in the app), done atomically, and only
+    happen when the settings differ from what was last read or written, which also
+    covers changes made directly to the data dict.
+    """
+    def __init__(self, settings_file, schedule=None, delay_ms=500):
+        self.settings_file = Path(settings_file)
+        self.schedule = schedule
+        self.delay_ms = delay_ms
+        self.data = {}
+        self.loaded = False
+        self.file_exists = False
+        self.saved_data = {}  # content of the file as last read or written
+        self.save_scheduled = False
+        self.subscribers = []
+        self.lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def load(self):
+        """Returns the settings dict, reading the file only the first time."""
+        if self.loaded:
+            return self.data
+        self.loaded = True
+        try:
+            with open(self.settings_file, 'r') as settings_file:
+                self.data.update(yaml.safe_load(settings_file) or {})
+            self.saved_data = dict(self.data)
+            self.file_exists = True
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error loading settings: {e}")
+        return self.data
+
+    def exists(self):
+        self.load()
+        return self.file_exists
+
+    def subscribe(self, callback):
+        """callback(key, value) is called for every changed key."""
+        self.subscribers.append(callback)
+
+    def set(self, key, value):
+        self.update({key: value})
+
+    def update(self, values):
+        self.load()
+        changed = {key: value for key, value in values.items() if self.data.get(key, object()) != value}
+        self.data.update(changed)
+        self.mark_dirty(changed)
+
+    def replace(self, values):
+        """Makes the settings exactly values; keys not in values are dropped."""
+        self.load()
+        changed = {key: value for key, value in values.items() if self.data.get(key, object()) != value}
+        changed.update({key: None for key in self.data if key not in values})
+        self.data.clear()
+        self.data.update(values)
+        self.mark_dirty(changed)
+
+    def mark_dirty(self, changed):
+        for key, value in changed.items():
+            for callback in self.subscribers:
+                callback(key, value)
+        with self.lock:
+            if self.data == self.saved_data and self.file_exists:
+                return
+            if self.save_scheduled:
+                return
+            self.save_scheduled = self.schedule is not None
+        if self.schedule is not None:
+            self.schedule(self.delay_ms, self.flush)
+        else:
+            self.flush()
+
+    def flush(self):
+        """Writes the settings if they changed since the last write."""
+        with self.lock:
+            self.save_scheduled = False
+            if self.data == self.saved_data and self.file_exists:
+                return False
+            data = dict(self.data)
+            self.saved_data = data
+
+        temp_file = self.settings_file.with_name(self.settings_file.name + ".tmp")
+        try:
+            with open(temp_file, 'w') as settings_file:
+                yaml.dump(data, settings_file, default_flow_style=False, indent=4)
+            os.replace(temp_file, self.settings_file)
+            self.file_exists = True
+            print(f"Settings saved to {self.settings_file} with content:\n{data}")
+        except Exception as e:
+            print(f"Error saving settings: {e}")
+            try:
+                temp_file.unlink()
+            except OSError:
+                pass
+        return False
+
+########## /Settings store
+
+
+########## Progress reporting
+
+class ProgressReporter:
+    """
+    Progress of a long step-based operation (backup, bottle, restore, import).
+
+    Worker threads update it with plain attribute writes (set_total/advance), which
+    costs nothing on the main loop; the UI samples it at a fixed rate. The fraction
+    combines the finished steps with the progress inside the current step, when the
+    step reports a total (files or bytes). A total of None marks the current work as
+    running without a known size.
+    """
+    def __init__(self):
+        self.reset()
+
+    def reset(self, total_steps=1):
+        self.total_steps = max(1, total_steps)
+        self.steps_done = 0
+        self.step_text = ""
+        self.total = 0  # units of the current work (files, bytes); None if unknown
+        self.done = 0
+        self.started = time.monotonic()
+        self.last_fraction = 0.0
+
+    def begin_step(self, step_text, total_steps):
+        self.total_steps = max(1, total_steps)
+        self.step_text = step_text
+
+    def finish_step(self):
+        self.steps_done = min(self.steps_done + 1, self.total_steps)
+
+    def set_total(self, total):
+        self.done = 0
+        self.total = total
+
+    def advance(self, amount=1):
+        self.done += amount
+
+    def is_indeterminate(self):
+        return self.total is None
+
+    def fraction(self):
+        """Overall fraction; never goes backwards within one operation."""
+        total = self.total
+        within = self.done / total if total and self.done < total else 0.0
+        fraction = min(1.0, (self.steps_done + within) / self.total_steps)
+        self.last_fraction = max(self.last_fraction, fraction)
+        return self.last_fraction
+
+    def eta(self):
+        """Seconds left, estimated from the elapsed time, or None if too early to tell."""
+        fraction = self.last_fraction
+        elapsed = time.monotonic() - self.started
+        if fraction < 0.02 or elapsed < 2:
+            return None
+        return elapsed * (1 - fraction) / fraction
+
+
+def directory_size(path):
+    """Total size in bytes of the regular files under path; symlinks are not followed."""
+    total = 0
+    for root, dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def process_bytes_read(pid):
+    """Bytes read so far by a process (rchar in /proc/<pid>/io), or None if unavailable."""
+    try:
+        with open(f"/proc/{pid}/io") as f:
+            for line in f:
+                if line.startswith("rchar:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return None
+
+########## /Progress reporting
+
+
+########## Search index
+
+def normalize_search_text(text):
+    """Case-folds text and strips accents, so "Café" and "cafe" compare equal."""
+    text = unicodedata.normalize('NFKD', str(text)).casefold()
+    return ''.join(char for char in text if not unicodedata.combining(char))
+
+
+class ScriptSearchIndex:
+    """
+    In-memory search index over the script list.
+
+    For every script the progname, exe name and .charm stem are normalized once when the
+    script is added. Token and trigram postings map back to the script keys, so a query
+    only looks at scripts that can match instead of scanning the whole list.
+    """
+    fuzzy_threshold = 0.6  # share of query trigrams a fuzzy (typo) match must contain
+    fuzzy_min_trigrams = 2  # and never fewer than this many
+
+    def __init__(self):
+        self.fields = {}    # script_key -> (progname, exe name, stem)
+        self.tokens = {}    # token -> set of script keys
+        self.trigrams = {}  # trigram -> set of script keys
+
+    def clear(self):
+        self.fields.clear()
+        self.tokens.clear()
+        self.trigrams.clear()
+
+    @staticmethod
+    def split_tokens(fields):
+        return {token for field in fields for token in re.split(r'\W+', field) if token}
+
+    @staticmethod
+    def trigrams_of(text):
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    def add(self, script_key, progname, exe_name, stem):
+        self.remove(script_key)
+        fields = (normalize_search_text(progname), normalize_search_text(exe_name), normalize_search_text(stem))
+        self.fields[script_key] = fields
+        for token in self.split_tokens(fields):
+            self.tokens.setdefault(token, set()).add(script_key)
+        for field in fields:
+            for gram in self.trigrams_of(field):
+                self.trigrams.setdefault(gram, set()).add(script_key)
+
+    def remove(self, script_key):
+        fields = self.fields.pop(script_key, None)
+        if fields is None:
+            return
+        for token in self.split_tokens(fields):
+            keys = self.tokens.get(token)
+            if keys is not None:
+                keys.discard(script_key)
+                if not keys:
+                    del self.tokens[token]
+        for field in fields:
+            for gram in self.trigrams_of(field):
+                keys = self.trigrams.get(gram)
+                if keys is not None:
+                    keys.discard(script_key)
+                    if not keys:
+                        del self.trigrams[gram]
+
+    def search(self, query):
+        """
+        Returns {script_key: rank} for the scripts matching query (lower rank is a better
+        match), or None for an empty query, meaning every script matches.
+
+        Ranks: 0 exact field, 1 field prefix, 2 word prefix, 3 substring, 4 fuzzy.
+        Queries shorter than three characters have no trigrams; they are matched as
+        substrings by scanning the normalized fields.
+        """
+        query = normalize_search_text(query).strip()
+        if not query:
+            return None
+
+        results = {}
+        query_grams = self.trigrams_of(query)
+        if not query_grams:
+            for script_key in self.fields:
+                rank = self.rank(script_key, query)
+                if rank is not None:
+                    results[script_key] = rank
+            return results
+
+        overlap = {}
+        for gram in query_grams:
+            for script_key in self.trigrams.get(gram, ()):
+                overlap[script_key] = overlap.get(script_key, 0) + 1
+
+        needed = len(query_grams)
+        fuzzy_needed = max(self.fuzzy_min_trigrams, int(needed * self.fuzzy_threshold + 0.5))
+        for script_key, count in overlap.items():
+            if count == needed:
+                rank = self.rank(script_key, query)
+                if rank is not None:
+                    results[script_key] = rank
+                    continue
+            if count >= fuzzy_needed:
+                results[script_key] = 4
+        return results
+
+    def rank(self, script_key, query):
+        fields = self.fields[script_key]
+        if query in fields:
+            return 0
+        if any(field.startswith(query) for field in fields):
+            return 1
+        if any(token.startswith(query) for token in self.split_tokens(fields)):
+            return 2
+        if any(query in field for field in fields):
+            return 3
+        return None
+
+
+
+class ScriptFacets:
+    """
+    Facet membership of the scripts in script_list (runner, prefix, arch, running,
+    exe missing, new), kept as {facet: {value: set of script keys}}.
+
+    Scripts are added, removed and updated one at a time, so facet counts are always
+    current without scanning script_list, and a query only touches the key sets of
+    the selected values.
+    """
+    names = ("runner", "prefix", "arch", "running", "exe-missing", "new")
+
+    def __init__(self):
+        self.lock = threading.Lock()  # running state is updated from monitor threads
+        self.values = {name: {} for name in self.names}
+        self.memberships = {}  # script_key -> {facet: value}
+
+    def clear(self):
+        with self.lock:
+            self.values = {name: {} for name in self.names}
+            self.memberships.clear()
+
+    def _unset(self, script_key, facet):
+        value = self.memberships.get(script_key, {}).pop(facet, None)
+        if value is None:
+            return None
+        keys = self.values[facet].get(value)
+        if keys is not None:
+            keys.discard(script_key)
+            if not keys:
+                del self.values[facet][value]
+        return value
+
+    def add(self, script_key, memberships):
+        """Sets all facets of a script; facets with a None value are left unset."""
+        with self.lock:
+            for facet in list(self.memberships.get(script_key, ())):
+                self._unset(script_key, facet)
+            self.memberships[script_key] = {}
+            for facet, value in memberships.items():
+                if value is not None:
+                    self.memberships[script_key][facet] = value
+                    self.values[facet].setdefault(value, set()).add(script_key)
+
+    def remove(self, script_key):
+        with self.lock:
+            for facet in list(self.memberships.get(script_key, ())):
+                self._unset(script_key, facet)
+            self.memberships.pop(script_key, None)
+
+    def set(self, script_key, facet, value):
+        """Changes one facet of a known script. Returns True if its membership changed."""
+        with self.lock:
+            memberships = self.memberships.get(script_key)
+            if memberships is None or memberships.get(facet) == value:
+                return False
+            self._unset(script_key, facet)
+            if value is not None:
+                memberships[facet] = value
+                self.values[facet].setdefault(value, set()).add(script_key)
+            return True
+
+    def counts(self, facet):
+        with self.lock:
+            return {value: len(keys) for value, keys in self.values[facet].items()}
+
+    def query(self, selection):
+        """
+        Returns the keys matching selection ({facet: set of values}); values of one facet
+        are combined with OR, facets with AND. Returns None if nothing is selected.
+        """
+        with self.lock:
+            groups = []
+            for facet, selected in selection.items():
+                if not selected:
+                    continue
+                keys = set()
+                for value in selected:
+                    keys |= self.values[facet].get(value, set())
+                groups.append(keys)
+        if not groups:
+            return None
+        groups.sort(key=len)
+        return groups[0].intersection(*groups[1:])
+
+########## /Search index
+
+
+########## Script change bus
+
+class ScriptChangeBus:
+    """
+    Collects added/removed/changed events for script keys and delivers them merged,
+    once per main loop iteration, to the subscribers as (added, changed, removed).
+
+    emit() may be called from any thread; schedule (GLib.idle_add in the app) is
+    used to run flush() on the main loop.
+    """
+    def __init__(self, schedule):
+        self.schedule = schedule
+        self.subscribers = []
+        self.watchers = []
+        self.pending = {}  # script_key -> net event kind since the last flush
+        self.lock = threading.Lock()
+        self.scheduled = False
+
+    def subscribe(self, callback):
+        self.subscribers.append(callback)
+
+    def watch(self, callback):
+        """
+        Calls callback(kind, script_key) for every event, immediately and on the
+        emitting thread; for state that must never lag behind script_list.
+        """
+        self.watchers.append(callback)
+
+    def emit(self, kind, script_key):
+        for callback in self.watchers:
+            callback(kind, script_key)
+        with self.lock:
+            previous = self.pending.get(script_key)
+            if previous == 'added' and kind == 'removed':
+                del self.pending[script_key]  # came and went within one frame
+            elif previous == 'added':
+                pass  # still an addition as far as the view is concerned
+            elif previous == 'removed' and kind == 'added':
+                self.pending[script_key] = 'changed'
+            else:
+                self.pending[script_key] = kind
+            if self.scheduled:
+                return
+            self.scheduled = True
+        self.schedule(self.flush)
+
+    def discard(self):
+        """Drops pending events, e.g. after the view was built from the current state."""
+        with self.lock:
+            self.pending = {}
+
+    def flush(self):
+        with self.lock:
+            pending = self.pending
+            self.pending = {}
+            self.scheduled = False
+        if pending:
+            added = [key for key, kind in pending.items() if kind == 'added']
+            changed = [key for key, kind in pending.items() if kind == 'changed']
+            removed = [key for key, kind in pending.items() if kind == 'removed']
+            for callback in self.subscribers:
+                callback(added, changed, removed)
+        return False
+
+
+class ScriptList(dict):
+    """
+    The script_list dict (script_key -> script data); item assignment and removal are
+    reported to a ScriptChangeBus. Changes made inside a script's data dict are not seen
+    and have to be emitted by the caller.
+    """
+    def __init__(self, bus, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.bus = bus
+
+    def __setitem__(self, script_key, script_data):
+        kind = 'changed' if script_key in self else 'added'
+        super().__setitem__(script_key, script_data)
+        self.bus.emit(kind, script_key)
+
+    def __delitem__(self, script_key):
+        super().__delitem__(script_key)
+        self.bus.emit('removed', script_key)
+
+    def pop(self, script_key, *default):
+        if script_key not in self:
+            return super().pop(script_key, *default)
+        script_data = super().pop(script_key)
+        self.bus.emit('removed', script_key)
+        return script_data
+
+    def clear(self):
+        script_keys = list(self)
+        super().clear()
+        for script_key in script_keys:
+            self.bus.emit('removed', script_key)
+
+    def update(self, *args, **kwargs):
+        for script_key, script_data in dict(*args, **kwargs).items():
+            self[script_key] = script_data
+
+    def setdefault(self, script_key, default=None):
+        if script_key not in self:
+            self[script_key] = default
+        return self[script_key]
+
+########## /Script change bus
+
+
+########## Script records
+
+def resolve_script_path(path):
+    """Canonical form of a path from a .charm file, as a string."""
+    return str(Path(path).expanduser().resolve()) if path else ""
+
+
+class ScriptRecord:
+    """
+    Paths of one script resolved once (expanduser + resolve), so lookups do not touch
+    the filesystem. source holds the raw values they were resolved from.
+    """
+    __slots__ = ('script_key', 'script_path', 'wineprefix', 'exe_file', 'exe_name', 'runner', 'source')
+
+    FIELDS = ('script_path', 'exe_file', 'runner')
+
+    def __init__(self, script_key, script_data):
+        self.script_key = script_key
+        self.source = tuple(script_data.get(field) for field in self.FIELDS)
+        script_path, exe_file, runner = self.source
+        self.script_path = resolve_script_path(script_path)
+        # The prefix of a script is the directory of its .charm file
+        self.wineprefix = sys.intern(os.path.dirname(self.script_path))
+        self.exe_file = resolve_script_path(exe_file)
+        self.exe_name = os.path.basename(self.exe_file)
+        self.runner = sys.intern(resolve_script_path(runner))
+
+    def is_current(self, script_data):
+        return all(script_data.get(field) == value for field, value in zip(self.FIELDS, self.source))
+
+
+class ScriptIndex:
+    """
+    ScriptRecords for script_list with secondary indexes (prefix -> script keys,
+    exe path -> script keys). Kept up to date by watching the ScriptChangeBus.
+    """
+    def __init__(self, get_script_data):
+        self.get_script_data = get_script_data
+        self.records = {}
+        self.by_prefix = {}
+        self.by_exe = {}
+        self.lock = threading.Lock()
+
+    def rebuild(self, scripts):
+        with self.lock:
+            self.records = {}
+            self.by_prefix = {}
+            self.by_exe = {}
+            for script_key, script_data in scripts.items():
+                self._add(script_key, script_data)
+
+    def on_script_event(self, kind, script_key):
+        script_data = self.get_script_data(script_key) if kind != 'removed' else None
+        with self.lock:
+            self._remove(script_key)
+            if script_data is not None:
+                self._add(script_key, script_data)
+
+    def _add(self, script_key, script_data):
+        try:
+            record = ScriptRecord(script_key, script_data)
+        except (OSError, RuntimeError, TypeError) as e:
+            print(f"Could not index script {script_key}: {e}")
+            return None
+        self.records[script_key] = record
+        self.by_prefix.setdefault(record.wineprefix, set()).add(script_key)
+        self.by_exe.setdefault(record.exe_file, set()).add(script_key)
+        return record
+
+    def _remove(self, script_key):
+        record = self.records.pop(script_key, None)
+        if record is None:
+            return
+        for index, value in ((self.by_prefix, record.wineprefix), (self.by_exe, record.exe_file)):
+            keys = index.get(value)
+            if keys is not None:
+                keys.discard(script_key)
+                if not keys:
+                    del index[value]
+
+    def record(self, script_key):
+        """The ScriptRecord of a script; re-resolved if its data was edited in place."""
+        script_data = self.get_script_data(script_key)
+        with self.lock:
+            record = self.records.get(script_key)
+            if script_data is None:
+                return None
+            if record is None or not record.is_current(script_data):
+                self._remove(script_key)
+                record = self._add(script_key, script_data)
+            return record
+
+    def keys_for_prefix(self, wineprefix):
+        with self.lock:
+            return list(self.by_prefix.get(resolve_script_path(wineprefix), ()))
+
+    def keys_for_exe(self, exe_file):
+        with self.lock:
+            return list(self.by_exe.get(resolve_script_path(exe_file), ()))
+
+########## /Script records
+
+
+########## Process supervisor
+
+WINDOWS_EXECUTABLE_SUFFIXES = (".exe", ".msi", ".bat", ".com", ".lnk")
+
+# Processes Wine runs for every prefix; never counted as children of a launched program
+WINE_SYSTEM_PROCESSES = frozenset({
+    "start.exe", "winedbg.exe", "conhost.exe", "explorer.exe", "services.exe", "rpcss.exe",
+    "svchost.exe", "plugplay.exe", "winedevice.exe", "wineboot.exe", "tabtip.exe",
+    "rundll32.exe", "mscorsvw.exe", "cmd.exe",
+})
+
+
+def split_any_path(path):
+    """Components of a Unix or Windows path."""
+    return path.replace("\\", "/").split("/")
+
+
+def executable_names(name, cmdline):
+    """
+    Lower-case basenames a process can be recognised by: its name and the last
+    component of every argument that looks like a Windows executable.
+    Returns (basename, argument) pairs.
+    """
+    names = [(name.lower(), name)] if name else []
+    for arg in cmdline:
+        base = split_any_path(arg)[-1].lower()
+        if base.endswith(WINDOWS_EXECUTABLE_SUFFIXES):
+            names.append((base, arg))
+    return names
+
+
+class ProcessInfo:
+    __slots__ = ('pid', 'ppid', 'name', 'cmdline', 'wineprefix', 'unique_id', 'image', 'image_path')
+
+    def __init__(self, pid, ppid, name, cmdline, wineprefix, unique_id):
+        self.pid = pid
+        self.ppid = ppid
+        self.name = name
+        self.cmdline = cmdline
+        self.wineprefix = wineprefix
+        self.unique_id = unique_id
+        # The Windows executable the process runs (lower-case basename and as given).
+        # Wine puts its Windows path in argv[0]; the name is a fallback since the kernel
+        # truncates it to 15 characters
+        self.image, self.image_path = None, None
+        for path in cmdline[:1] + [name]:
+            base = split_any_path(path)[-1].lower()
+            if base.endswith(WINDOWS_EXECUTABLE_SUFFIXES):
+                self.image, self.image_path = base, path
+                break
+
+
+class ProcessSnapshot:
+    """
+    One pass over the process table, indexed by resolved WINEPREFIX, WINECHARM_UNIQUE_ID,
+    executable basename and parent PID. The environment, the expensive part, is read
+    only for processes that look like Wine processes (an .exe/.msi argument or a
+    wine* name); the other processes of a launch are reached through descendants().
+    """
+    def __init__(self):
+        self.taken = time.monotonic()
+        self.by_prefix = {}     # resolved WINEPREFIX -> [ProcessInfo]
+        self.by_unique_id = {}  # WINECHARM_UNIQUE_ID -> [ProcessInfo]
+        self.by_exe = {}        # lower-case exe basename -> [(ProcessInfo, argument)]
+        self.children = {}      # ppid -> [pid]
+        resolved_prefixes = {}
+
+        for proc in psutil.process_iter(['pid', 'ppid', 'name', 'cmdline']):
+            info = proc.info
+            name = info.get('name') or ""
+            cmdline = info.get('cmdline') or []
+            names = executable_names(name, cmdline)
+            self.children.setdefault(info.get('ppid'), []).append(info['pid'])
+            if not name.lower().startswith("wine") and not any(base.endswith(WINDOWS_EXECUTABLE_SUFFIXES) for base, _ in names):
+                continue
+
+            try:
+                environ = proc.environ()
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+            wineprefix = environ.get('WINEPREFIX', '')
+            if wineprefix not in resolved_prefixes:
+                resolved_prefixes[wineprefix] = resolve_script_path(wineprefix or "~/.wine")
+            process = ProcessInfo(info['pid'], info.get('ppid'), name, cmdline,
+                                  resolved_prefixes[wineprefix], environ.get('WINECHARM_UNIQUE_ID'))
+
+            self.by_prefix.setdefault(process.wineprefix, []).append(process)
+            if process.unique_id:
+                self.by_unique_id.setdefault(process.unique_id, []).append(process)
+            for base, arg in names:
+                self.by_exe.setdefault(base, []).append((process, arg))
+
+    def descendants(self, pid):
+        found = []
+        stack = list(self.children.get(pid, ()))
+        while stack:
+            child = stack.pop()
+            found.append(child)
+            stack.extend(self.children.get(child, ()))
+        return found
+
+    def pids_for_unique_id(self, unique_id):
+        return [process.pid for process in self.by_unique_id.get(unique_id, ())]
+
+    def script_pids(self, wineprefix, exe_name):
+        """PIDs (with descendants) of processes of exe_name running in wineprefix."""
+        pids = set()
+        for process, arg in self.by_exe.get(exe_name.lower(), ()):
+            if process.wineprefix == wineprefix and process.pid not in pids:
+                pids.add(process.pid)
+                pids.update(self.descendants(process.pid))
+        return sorted(pids)
+
+    def windows_children(self, unique_id, wineprefix, exe_parent_name):
+        """
+        PIDs of the Windows programs belonging to a launch: those carrying its
+        WINECHARM_UNIQUE_ID, plus those in its prefix started from the directory of
+        its executable. Wine's own system processes are left out.
+        """
+        pids = set()
+        candidates = list(self.by_unique_id.get(unique_id, ())) if unique_id else []
+        candidates += [process for process in self.by_prefix.get(wineprefix, ())
+                       if process.image_path and split_any_path(process.image_path)[-2:-1] == [exe_parent_name]]
+        for process in candidates:
+            if process.image and process.image not in WINE_SYSTEM_PROCESSES:
+                pids.add(process.pid)
+        return sorted(pids)
+
+    def find_exe(self, exe_name, exe_parent_name):
+        """PID of a process running exe_name from a directory named exe_parent_name, or None."""
+        for process, arg in self.by_exe.get(exe_name.lower(), ()):
+            parts = split_any_path(arg)
+            if len(parts) > 1 and parts[-2] == exe_parent_name:
+                return process.pid
+        return None
+
+
+class ProcessSupervisor:
+    """
+    Shares one ProcessSnapshot between all process queries made within max_age
+    seconds, so a burst of queries (an exit followed by a rescan) scans /proc once.
+    """
+    def __init__(self, max_age=1.0):
+        self.max_age = max_age
+        self.current = None
+        self.lock = threading.Lock()
 
-from datetime import datetime, timedelta
+    def snapshot(self, max_age=None):
+        max_age = self.max_age if max_age is None else max_age
+        with self.lock:
+            current = self.current
+            if current is None or time.monotonic() - current.taken > max_age:
+                with TRACER.span("process-snapshot"):
+                    current = self.current = ProcessSnapshot()
+            return current
+
+    def invalidate(self):
+        """Forces the next query to rescan, e.g. after a process was started or stopped."""
+        with self.lock:
+            self.current = None
+
+########## /Process supervisor
+
+
+import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Gdk', '4.0')
 gi.require_version('Adw', '1')
 
-from gi.repository import GLib, Gio, Gtk, Gdk, Adw, GdkPixbuf, Pango  # Add Pango here
+from gi.repository import GLib, Gio, GObject, Gtk, Gdk, Adw, GdkPixbuf, Pango  # Add Pango here
+
+
+class ScriptItem(GObject.Object):
+    """
+    Item of the script list model. Only the key is stored; the script data itself
+    stays in WineCharmApp.script_list and the per-row state in script_ui_data.
+    """
+    __gtype_name__ = "WineCharmScriptItem"
+
+    def __init__(self, script_key):
+        super().__init__()
+        self.script_key = script_key
+
+
+class ScriptWidgetProxy:
+    """
+    Stand-in for a row or row button kept in script_ui_data.
+
+    The script view recycles its widgets while scrolling, so code that keeps a
+    reference to a row (running_processes, the launch button, dialogs) talks to
+    this proxy instead. CSS classes, visibility, tooltip and icon are recorded
+    here and forwarded to whichever widget is currently bound to the script.
+    """
+    __slots__ = ('widget', 'css_classes', 'visible', 'tooltip', 'icon_name')
+
+    # CSS classes owned by the proxy and re-applied on every bind
+    managed_css_classes = ("highlighted", "highlight", "blue", "red")
+
+    def __init__(self, visible=True, tooltip=None, icon_name=None):
+        self.widget = None
+        self.css_classes = set()
+        self.visible = visible
+        self.tooltip = tooltip
+        self.icon_name = icon_name
+
+    def attach(self, widget):
+        self.widget = widget
+        for css_class in self.managed_css_classes:
+            if css_class in self.css_classes:
+                widget.add_css_class(css_class)
+            else:
+                widget.remove_css_class(css_class)
+        widget.set_visible(self.visible)
+        if self.tooltip is not None:
+            widget.set_tooltip_text(self.tooltip)
+        if self.icon_name is not None:
+            widget.set_child(Gtk.Image.new_from_icon_name(self.icon_name))
+
+    def detach(self, widget):
+        if self.widget is widget:
+            self.widget = None
+
+    def add_css_class(self, css_class):
+        self.css_classes.add(css_class)
+        if self.widget is not None:
+            self.widget.add_css_class(css_class)
+
+    def remove_css_class(self, css_class):
+        self.css_classes.discard(css_class)
+        if self.widget is not None:
+            self.widget.remove_css_class(css_class)
+
+    def has_css_class(self, css_class):
+        return css_class in self.css_classes
+
+    def set_visible(self, visible):
+        self.visible = visible
+        if self.widget is not None:
+            self.widget.set_visible(visible)
+
+    def get_visible(self):
+        return self.visible
+
+    def set_tooltip_text(self, tooltip):
+        self.tooltip = tooltip
+        if self.widget is not None:
+            self.widget.set_tooltip_text(tooltip)
+
+    def set_child(self, child):
+        # Row buttons only ever get an icon as child (see set_play_stop_button_state)
+        if isinstance(child, Gtk.Image):
+            self.icon_name = child.get_icon_name()
+        if self.widget is not None:
+            self.widget.set_child(child)
+
+
+class IconCache:
+    """
+    Two-level cache for script icons.
+
+    Decoded Gdk.Textures are kept in an in-memory LRU keyed by (path, mtime, size, pixel
+    size) and capped at max_bytes. Below it, pre-scaled PNG thumbnails (32 and 64 px) are
+    kept on disk, so drawing a row never decodes a full-size icon.
+
+    Icons that are not in memory are decoded by request() in worker threads. Requests
+    are served newest first, so the rows bound last (the ones on screen) come first.
+    """
+    thumbnail_sizes = (32, 64)
+
+    def __init__(self, thumbnail_dir, max_bytes=32 * 1024 * 1024, workers=2):
+        self.thumbnail_dir = Path(thumbnail_dir)
+        self.max_bytes = max_bytes
+        self.textures = collections.OrderedDict()  # key -> (texture, bytes)
+        self.total_bytes = 0
+        self.lock = threading.Lock()
+        self.workers = workers
+        self.worker_threads = []
+        self.pending = []  # stack of (path, pixel_size, callback, is_wanted)
+        self.pending_ready = threading.Condition()
+
+    def request(self, path, pixel_size, callback, is_wanted=None):
+        """
+        Decodes an icon in a worker thread and calls callback(texture or None) there.
+        Requests for which is_wanted() is False by the time they are reached are dropped.
+        """
+        with self.pending_ready:
+            self.pending.append((path, pixel_size, callback, is_wanted))
+            if len(self.worker_threads) < self.workers:
+                worker = threading.Thread(target=self.decode_worker, daemon=True)
+                self.worker_threads.append(worker)
+                worker.start()
+            self.pending_ready.notify()
+
+    def decode_worker(self):
+        while True:
+            with self.pending_ready:
+                while not self.pending:
+                    self.pending_ready.wait()
+                path, pixel_size, callback, is_wanted = self.pending.pop()
+            if is_wanted is not None and not is_wanted():
+                continue
+            try:
+                callback(self.load(path, pixel_size))
+            except Exception as e:
+                print(f"Error decoding icon {path}: {e}")
+
+    @staticmethod
+    def source_key(path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (str(path), stat.st_mtime_ns, stat.st_size)
+
+    def thumbnail_path(self, source_key, pixel_size):
+        path, mtime_ns, size = source_key
+        path_hash = hashlib.sha1(path.encode()).hexdigest()
+        return self.thumbnail_dir / f"{path_hash}-{mtime_ns}-{size}-{pixel_size}.png"
+
+    def write_thumbnails(self, path):
+        """
+        Writes the thumbnail variants of an icon, replacing those of older versions.
+        Safe to call from worker threads.
+        """
+        source_key = self.source_key(path)
+        if source_key is None:
+            return False
+        try:
+            self.thumbnail_dir.mkdir(parents=True, exist_ok=True)
+            path_hash = hashlib.sha1(source_key[0].encode()).hexdigest()
+            for old_thumbnail in self.thumbnail_dir.glob(f"{path_hash}-*.png"):
+                old_thumbnail.unlink(missing_ok=True)
+
+            largest = max(self.thumbnail_sizes)
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_size(str(path), largest, largest)
+            for pixel_size in self.thumbnail_sizes:
+                scaled = pixbuf.scale_simple(pixel_size, pixel_size, GdkPixbuf.InterpType.BILINEAR)
+                thumbnail = self.thumbnail_path(source_key, pixel_size)
+                temp_file = thumbnail.with_name(thumbnail.name + ".tmp")
+                scaled.savev(str(temp_file), "png", [], [])
+                os.replace(temp_file, thumbnail)
+            return True
+        except Exception as e:
+            print(f"Error writing thumbnails for {path}: {e}")
+            return False
+
+    def lookup(self, path, pixel_size):
+        """Returns the cached texture of an icon at pixel_size, or None."""
+        source_key = self.source_key(path)
+        if source_key is None:
+            return None
+        with self.lock:
+            entry = self.textures.get(source_key + (pixel_size,))
+            if entry is None:
+                return None
+            self.textures.move_to_end(source_key + (pixel_size,))
+            return entry[0]
+
+    def load(self, path, pixel_size):
+        """
+        Returns the texture of an icon at pixel_size, decoding it from its smallest
+        sufficient thumbnail (created first if missing). Returns None if the icon
+        cannot be read.
+        """
+        source_key = self.source_key(path)
+        if source_key is None:
+            return None
+        key = source_key + (pixel_size,)
+        with self.lock:
+            entry = self.textures.get(key)
+            if entry is not None:
+                self.textures.move_to_end(key)
+                return entry[0]
+
+        thumbnail_size = next((size for size in self.thumbnail_sizes if size >= pixel_size), max(self.thumbnail_sizes))
+        thumbnail = self.thumbnail_path(source_key, thumbnail_size)
+        try:
+            if not thumbnail.exists() and not self.write_thumbnails(path):
+                return None
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file(str(thumbnail))
+            if pixbuf.get_width() != pixel_size:
+                pixbuf = pixbuf.scale_simple(pixel_size, pixel_size, GdkPixbuf.InterpType.BILINEAR)
+            texture = Gdk.Texture.new_for_pixbuf(pixbuf)
+        except Exception as e:
+            print(f"Error loading icon {path}: {e}")
+            return None
+
+        self.store(key, texture, pixel_size * pixel_size * 4)
+        return texture
+
+    def store(self, key, texture, nbytes):
+        with self.lock:
+            old = self.textures.pop(key, None)
+            if old is not None:
+                self.total_bytes -= old[1]
+            self.textures[key] = (texture, nbytes)
+            self.total_bytes += nbytes
+            while self.total_bytes > self.max_bytes and len(self.textures) > 1:
+                _, (_, evicted_bytes) = self.textures.popitem(last=False)
+                self.total_bytes -= evicted_bytes
+
+
+class StartupScheduler:
+    """
+    Runs the startup phases one after another. Main-thread phases run from the main loop,
+    worker phases in a background thread; each phase starts when the previous one has
+    finished. The duration of every phase is kept in timings (ms) and traced.
+    """
+    def __init__(self):
+        self.phases = []  # (name, func, in_worker)
+        self.timings = {}
+        self.started = time.monotonic()
+
+    def add(self, name, func, worker=False):
+        self.phases.append((name, func, worker))
+
+    def record(self, name, begin):
+        self.timings[name] = (time.monotonic() - begin) * 1000
+
+    def start(self):
+        self.run_phase(0)
+        return False
+
+    def run_phase(self, index):
+        if index >= len(self.phases):
+            self.report()
+            return False
+        name, func, worker = self.phases[index]
+
+        def run():
+            begin = time.monotonic()
+            try:
+                with TRACER.span(f"startup:{name}"):
+                    func()
+            except Exception as e:
+                print(f"Startup phase {name} failed: {e}")
+            self.record(name, begin)
+            GLib.idle_add(self.run_phase, index + 1)
+
+        if worker:
+            threading.Thread(target=run, name=f"startup-{name}", daemon=True).start()
+        else:
+            run()
+        return False
 
+    def report(self):
+        phases = ", ".join(f"{name} {ms:.0f} ms" for name, ms in self.timings.items())
+        print(f"Startup finished in {(time.monotonic() - self.started) * 1000:.0f} ms ({phases})")
 
 
 class WineCharmApp(Gtk.Application):
+    @property
+    def script_list(self):
+        return self.script_records
+
+    @script_list.setter
+    def script_list(self, scripts):
+        """
+        Replacing script_list (e.g. {key: data, **self.script_list} to put a script first)
+        emits events only for the scripts that were added, removed or replaced.
+        """
+        old_scripts = getattr(self, 'script_records', None)
+        new_scripts = ScriptList(self.script_changes, scripts)
+        self.script_records = new_scripts
+        if old_scripts is None:
+            self.script_index.rebuild(new_scripts)
+            return
+        for script_key, script_data in new_scripts.items():
+            if script_key not in old_scripts:
+                self.script_changes.emit('added', script_key)
+            else:
+                old_data = old_scripts[script_key]
+                if old_data is not script_data and old_data != script_data:
+                    self.script_changes.emit('changed', script_key)
+        for script_key in old_scripts:
+            if script_key not in new_scripts:
+                self.script_changes.emit('removed', script_key)
+
     def __init__(self):
         self.count = 0
+        self.debug = os.environ.get("WINECHARM_DEBUG", "") not in ("", "0")
         self.log_file_path = os.path.expanduser('~/logfile.log')
         creation_date_and_time = datetime.now()
         log_message = f"=>{creation_date_and_time}\n" + "-"*50 + "\n"
@@ -48,7 +1872,6 @@ class WineCharmApp(Gtk.Application):
         Adw.init()
         
         # Move the global variables to instance attributes
-        self.debug = False
         self.version = "0.97"
         # Paths and directories
         self.winecharmdir = Path(os.path.expanduser("~/.var/app/io.github.fastrizwaan.WineCharm/data/winecharm")).resolve()
@@ -67,15 +1890,50 @@ class WineCharmApp(Gtk.Application):
         
         self.SOCKET_FILE = self.winecharmdir / "winecharm_socket"
         self.settings_file = self.winecharmdir / "Settings.yaml"
+        self.settings_store = SettingsStore(self.settings_file, GLib.timeout_add)
+        self.charm_catalog_file = self.winecharmdir / "charm_catalog.json"
+        self.charm_catalog_version = 1
+        self.icon_cache = IconCache(self.winecharmdir / "thumbnails")
+        self.default_icon_path = None
+        self.charm_catalog = None  # in-memory copy of the catalog index, loaded on first use
+        self.script_keys_by_path = {}  # resolved .charm path -> script_key
+        self.charm_monitors = {}  # watched directory -> Gio.FileMonitor
+        self.charm_monitor_root = None
+        self.pending_charm_changes = set()
+        self.charm_changes_source_id = None
+        self.search_index = ScriptSearchIndex()
+        self.search_ranks = None  # {script_key: rank} of the active search, None shows all scripts
+        self.script_facets = ScriptFacets()
+        self.facet_selection = {}  # facet -> set of selected values
+        self.facet_matches = None  # keys matching facet_selection, None when nothing is selected
+        self.prefix_arch_cache = {}  # wineprefix -> arch read from its system.reg
+        self.script_sort_keys = {}  # script_key -> {sort key: value}, refreshed with the script
+        self.sort_order = None  # (key, reverse) chosen in the sort menu
+        self.script_list_generation = 0  # bumped by every rebuild; stale batches stop
+        self.script_list_source_id = None  # idle source adding the remaining rows
+        self.script_list_pending = collections.deque()  # script keys still waiting for a row
+        self.script_batch_threshold = 100  # more new scripts than this are added in batches
+        # Turns the shortcuts left by programs that exited into scripts
+        self.shortcut_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="lnk-scan")
+        # Checks whether the exe files of new and changed scripts exist
+        self.exe_check_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="exe-check")
+        self.hash_cache = HashCache(self.winecharmdir / "hash_cache.json")
+        self.runner_cache = RunnerCache(self.winecharmdir / "runner_cache.json")
+        self.wineserver_prewarmer = WineserverPrewarmer()
+        self.hash_cancel_event = threading.Event()  # set on shutdown to abort running hashes
+        self.pending_charm_hashes = set()
         # Variables that need to be dynamically updated
         self.runner = ""  # which wine
         self.wine_version = ""  # runner --version
         self.template = ""  # default: WineCharm-win64, if not found in Settings.yaml
         self.arch = "win64"  # default: win
+        self.fingerprint_mode = False  # identify scripts by sampled fingerprint instead of full sha256
+        self.wineserver_prewarm = False  # start a prefix's wineserver when its script is selected
                 
         self.connect("activate", self.on_activate)
         self.connect("startup", self.on_startup)
         self.connect("open", self.on_open)
+        self.connect("shutdown", self.on_shutdown)
         
         # Initialize other attributes here
         self.new_scripts = set()  # Initialize new_scripts as an empty set
@@ -98,6 +1956,15 @@ class WineCharmApp(Gtk.Application):
         self.focus_event_timer_id = None        
         self.create_required_directories() # Create Required Directories
         self.icon_view = False
+        self.progress = ProgressReporter()
+        self.progress_source_id = None
+        # script_list mutations are reported here and applied to the view once per frame
+        self.script_changes = ScriptChangeBus(GLib.idle_add)
+        self.script_changes.subscribe(self.on_script_changes)
+        # Resolved paths and prefix/exe lookups for script_list
+        self.script_index = ScriptIndex(lambda script_key: self.script_list.get(script_key))
+        self.script_changes.watch(self.script_index.on_script_event)
+        self.process_supervisor = ProcessSupervisor()
         self.script_list = {}
         self.import_steps_ui = {}
         self.current_script = None
@@ -121,6 +1988,7 @@ class WineCharmApp(Gtk.Application):
             ("☠️ Kill all...", self.on_kill_all_clicked),
             ("🍾 Restore...", self.restore_from_backup),
             ("📥 Import Wine Directory", self.on_import_wine_directory_clicked),
+            ("🐢 Main Loop Stalls...", self.on_show_stalls_clicked),
             ("❓ Help...", self.on_help_clicked),
             ("📖 About...", self.on_about_clicked),
             ("🚪 Quit...", self.quit_app)
@@ -179,6 +2047,10 @@ class WineCharmApp(Gtk.Application):
         self.runner_data = None  # Will hold the runner data after fetching
         self.settings = self.load_settings()  # Add this line
 
+        # Tracing can also be switched on from Settings.yaml ("trace: true" or a file path)
+        self.on_setting_changed('trace', self.settings.get('trace'))
+        self.settings_store.subscribe(self.on_setting_changed)
+
         # Set keyboard accelerators
         self.set_accels_for_action("win.search", ["<Ctrl>f"])
         self.set_accels_for_action("win.open", ["<Ctrl>o"])
@@ -190,16 +2062,18 @@ class WineCharmApp(Gtk.Application):
         self.count = 0
 
     def print_method_name(self):
-        self.count = self.count + 1 
-        current_frame = sys._getframe(1)  # Get the caller's frame
-        method_name = current_frame.f_code.co_name
-        print(f"=>{self.count} {method_name}")
-        # uncomment below to write to log file
-        # log_message = f"=>{self.count} {method_name}\n"
+        """
+        Marks entry into the calling method. This is a no-op unless tracing is enabled
+        (see Tracer) or self.debug is set, in which case the old "=>count name" line is printed.
+        """
+        if not (TRACER.enabled or self.debug):
+            return
+        method_name = sys._getframe(1).f_code.co_name  # Get the caller's name
+        TRACER.instant(method_name)
+        if self.debug:
+            self.count = self.count + 1
+            print(f"=>{self.count} {method_name}")
 
-        # with open(self.log_file_path, 'a') as log_file:
-        #     log_file.write(log_message)
-        
     def ensure_directory_exists(self, directory):
         self.print_method_name()
         directory = Path(directory)  # Ensure it's a Path object
@@ -306,14 +2180,48 @@ class WineCharmApp(Gtk.Application):
             print(f"Error retrieving process list: {e}")
 
         # Optionally, clear the running processes dictionary
+        for script_key, process_info in list(self.running_processes.items()):
+            self.stop_watching_processes(process_info)
+            self.set_running_facet(script_key, False)
         self.running_processes.clear()
-        GLib.timeout_add_seconds(0.5, self.load_script_list)
+        # Shortcuts created by the killed programs are picked up by the .charm monitors
+        GLib.timeout_add_seconds(0.5, self.request_catalog_refresh)
 
     def on_help_clicked(self, action=None, param=None):
         self.print_method_name()
         print("Help action triggered")
         # You can add code here to show a help dialog or window.
 
+    def on_show_stalls_clicked(self, action=None, param=None):
+        self.print_method_name()
+        """
+        Shows the main loop stalls recorded by the watchdog, with the main thread's stack.
+        """
+        watchdog = getattr(self, 'stall_watchdog', None)
+        report = watchdog.report() if watchdog else "The stall watchdog is off. Set WINECHARM_STALL_MS (e.g. 100) or \"stall-watchdog: 100\" in Settings.yaml to enable it."
+
+        dialog = Adw.AlertDialog(
+            heading="Main Loop Stalls",
+            body=f"Times the interface was blocked for more than {watchdog.threshold * 1000:.0f} ms" if watchdog else ""
+        )
+
+        scrolled_window = Gtk.ScrolledWindow()
+        scrolled_window.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
+        scrolled_window.set_min_content_width(640)
+        scrolled_window.set_min_content_height(480)
+
+        report_view = Gtk.TextView()
+        report_view.set_editable(False)
+        report_view.set_monospace(True)
+        report_view.get_buffer().set_text(report)
+        scrolled_window.set_child(report_view)
+        dialog.set_extra_child(scrolled_window)
+
+        dialog.add_response("close", "Close")
+        dialog.set_default_response("close")
+        dialog.set_close_response("close")
+        dialog.present(self.window)
+
     def on_about_clicked(self, action=None, param=None):
         self.print_method_name()
         about_dialog = Adw.AboutWindow(
@@ -334,8 +2242,23 @@ class WineCharmApp(Gtk.Application):
         self.print_method_name()
         self.quit()
 
+    def on_shutdown(self, app):
+        self.print_method_name()
+        # Abort hashes still running in workers so exiting is not delayed by large files
+        self.hash_cancel_event.set()
+        self.hash_cache.executor.shutdown(wait=False, cancel_futures=True)
+        self.hash_cache.save()
+        self.settings_store.flush()
+
 
     def get_default_icon_path(self):
+        #self.print_method_name()
+        if self.default_icon_path is not None:
+            return self.default_icon_path
+        self.default_icon_path = self.find_default_icon_path()
+        return self.default_icon_path
+
+    def find_default_icon_path(self):
         #self.print_method_name()
         xdg_data_dirs = os.getenv("XDG_DATA_DIRS", "").split(":")
         icon_relative_path = "icons/hicolor/128x128/apps/org.winehq.Wine.png"
@@ -349,36 +2272,85 @@ class WineCharmApp(Gtk.Application):
         return Path("/app/share/icons/hicolor/128x128/apps/org.winehq.Wine.png")
 
     def on_startup(self, app):
+        """
+        Builds the window and schedules everything else to run after the first frame:
+        the catalog is loaded and the required programs and running processes are checked
+        in worker threads, so the window does not wait for them.
+        """
+        # Optionally report operations that still block the GTK thread
+        threshold_ms = stall_threshold_ms(os.environ.get("WINECHARM_STALL_MS") or self.settings.get('stall-watchdog'))
+        if threshold_ms:
+            self.stall_watchdog = StallWatchdog(threshold_ms)
+            self.stall_watchdog.start(GLib.timeout_add)
+
+        self.startup = StartupScheduler()
+        self.startup_missing_programs = []
+        self.startup_running_scripts = {}
+        begin = time.monotonic()
         self.create_main_window()
         # Clear or initialize the script list
         self.set_dynamic_variables()
-        self.script_list = {}
-        self.load_script_list()
-        self.create_script_list()
 
         if not self.template:
             self.template = getattr(self, f'default_template_{self.arch}')
             self.template = self.expand_and_resolve_path(self.template)
+        self.startup.record("critical-ui", begin)
 
+        self.startup.add("catalog", self.load_script_list, worker=True)
+        self.startup.add("script-view", self.on_startup_catalog_loaded)
+        self.startup.add("background-checks", self.run_startup_checks, worker=True)
+        self.startup.add("checks-ui", self.on_startup_checks_done)
+        # Start fetching runner URLs in the background
+        self.startup.add("network-refresh", self.maybe_fetch_runner_urls, worker=True)
+        # Low priority runs after GTK has laid out and drawn the window
+        GLib.idle_add(self.startup.start, priority=GLib.PRIORITY_LOW)
 
-        missing_programs = self.check_required_programs()
+    def on_startup_catalog_loaded(self):
+        self.print_method_name()
+        # The whole catalog arrives at once; build the view in frame-budgeted batches
+        # instead of applying it as one change set
+        self.create_script_list()
+        self.start_charm_monitoring()
+
+    def run_startup_checks(self):
+        self.print_method_name()
+        """
+        Startup checks that do not touch the UI; runs in a worker thread.
+        """
+        self.startup_missing_programs = self.check_required_programs()
+        self.startup_running_scripts = self.find_running_scripts()
+        self.validate_runners()
+
+    def validate_runners(self):
+        self.print_method_name()
+        """
+        Probes the runners used by the scripts that the runner cache has not seen yet,
+        so launching them does not wait for 'runner --version'. Runs in a worker thread.
+        """
+        runners = {str(data.get('runner') or '').strip() for data in list(self.script_list.values())}
+        for runner in runners:
+            try:
+                runner_path = Path(runner).expanduser() if runner else self.find_command_in_path("wine")
+                if runner_path and runner_path.exists():
+                    self.runner_cache.validate(runner_path)
+            except Exception as e:
+                print(f"Could not validate runner {runner}: {e}")
+
+    def on_startup_checks_done(self):
+        self.print_method_name()
+        missing_programs = self.startup_missing_programs
         if missing_programs:
             self.show_missing_programs_dialog(missing_programs)
         else:
             if not self.template.exists():
                 self.initialize_template(self.template, self.on_template_initialized)
             else:
-                self.set_dynamic_variables()
                 # Process the command-line file if the template already exists
                 if self.command_line_file:
                     print("Template exists. Processing command-line file after UI initialization.")
                     self.process_cli_file_later(self.command_line_file)
-        # After loading scripts and building the UI, check for running processes
-        self.set_dynamic_variables()
-        self.check_running_processes_on_startup()
-
-        # Start fetching runner URLs asynchronously
-        threading.Thread(target=self.maybe_fetch_runner_urls).start()
+        # After loading scripts and building the UI, mark the running ones
+        self.apply_running_scripts(self.startup_running_scripts)
 
     def remove_symlinks_and_create_directories(self, wineprefix):
         """
@@ -484,8 +2456,6 @@ class WineCharmApp(Gtk.Application):
                             raise subprocess.CalledProcessError(process.returncode, command)
                     
                     GLib.idle_add(self.mark_step_as_done, step_text)
-                    if hasattr(self, 'progress_bar'):
-                        GLib.idle_add(lambda: self.progress_bar.set_fraction(index / self.total_steps))
                     
                 except subprocess.CalledProcessError as e:
                     print(f"Error initializing template: {e}")
@@ -537,7 +2507,7 @@ class WineCharmApp(Gtk.Application):
                 print("Trying to process file inside on template initialized")
 
                 GLib.idle_add(self.show_processing_spinner, "Processing...")
-                self.process_cli_file(self.command_line_file)
+                threading.Thread(target=self.process_cli_file, args=(self.command_line_file,)).start()
             elif file_extension in ['.wzt', '.bottle', '.prefix']:
                 print("B"*100)
                 self.restore_prefix_bottle_wzt_tar_zst(self.command_line_file)
@@ -552,7 +2522,7 @@ class WineCharmApp(Gtk.Application):
         # If not called from settings create script list else go to settings
         if not self.called_from_settings:
             self.reconnect_open_button()
-            GLib.timeout_add_seconds(0.5, self.create_script_list)
+            GLib.timeout_add_seconds(0.5, self.show_script_list)
         
         if self.called_from_settings:
             GLib.idle_add(lambda: self.replace_open_button_with_settings())
@@ -579,7 +2549,7 @@ class WineCharmApp(Gtk.Application):
                 print("Trying to process file inside on template initialized")
 
                 GLib.idle_add(self.show_processing_spinner, "Processing")
-                self.process_cli_file_in_thread(file_path)
+                threading.Thread(target=self.process_cli_file_in_thread, args=(file_path,)).start()
             elif file_extension in ['.wzt', '.bottle', '.prefix']:
                 print("B"*100)
                 GLib.idle_add(self.show_processing_spinner, "Restoring")
@@ -592,7 +2562,7 @@ class WineCharmApp(Gtk.Application):
                 self.command_line_file = None
                 return False
 
-        self.create_script_list()
+        self.show_script_list()
 
     def set_open_button_label(self, label_text):
         self.print_method_name()
@@ -624,12 +2594,8 @@ class WineCharmApp(Gtk.Application):
                 # Default for bottle creation
                 total_steps = 8
             
-            current_step = len(self.step_boxes) + 1
-            progress = current_step / total_steps
-            
-            # Update progress bar
-            self.progress_bar.set_fraction(progress)
-            self.progress_bar.set_text(f"Step {current_step}/{total_steps}")
+            # The progress bar is updated from self.progress by sample_progress
+            self.progress.begin_step(step_text, total_steps)
             
             # Create step box
             step_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
@@ -650,6 +2616,7 @@ class WineCharmApp(Gtk.Application):
 
             
             # Add to flowbox
+            self.set_scrolled_content(self.flowbox_viewport)
             flowbox_child = Gtk.FlowBoxChild()
             flowbox_child.set_child(step_box)
             self.flowbox.append(flowbox_child)
@@ -662,6 +2629,7 @@ class WineCharmApp(Gtk.Application):
         """
         Mark a step as completed in the flowbox
         """
+        self.progress.finish_step()
         if hasattr(self, 'step_boxes'):
             for step_box, step_spinner, step_label in self.step_boxes:
                 if step_label.get_text() == step_text:
@@ -737,12 +2705,14 @@ class WineCharmApp(Gtk.Application):
     def set_dynamic_variables(self):
         self.print_method_name()
         # Check if Settings.yaml exists and set the template and arch accordingly
-        if self.settings_file.exists():
+        if self.settings_store.exists():
             settings = self.load_settings()  # Assuming load_settings() returns a dictionary
             self.template = self.expand_and_resolve_path(settings.get('template', self.default_template_win64))
             self.arch = settings.get('arch', "win64")
             self.icon_view = settings.get('icon_view', False)
             self.single_prefix = settings.get('single-prefix', False)
+            self.fingerprint_mode = settings.get('fingerprint-mode', False)
+            self.wineserver_prewarm = settings.get('wineserver-prewarm', False)
         else:
             self.template = self.expand_and_resolve_path(self.default_template_win64)
             self.arch = "win64"
@@ -750,12 +2720,18 @@ class WineCharmApp(Gtk.Application):
             self.template = self.default_template_win64  # Set template to the initialized one
             self.icon_view = False
             self.single_prefix = False
+            self.fingerprint_mode = False
+            self.wineserver_prewarm = False
 
+        # Only written if this changed anything
         self.save_settings()
 
     def save_settings(self):
         self.print_method_name()
-        """Save current settings to the Settings.yaml file."""
+        """
+        Save current settings to the Settings.yaml file. The settings store writes the
+        file shortly afterwards (coalescing repeated saves), and only if something changed.
+        """
         settings = {
             'template': self.replace_home_with_tilde_in_path(str(self.template)),
             'arch': self.arch,
@@ -763,23 +2739,25 @@ class WineCharmApp(Gtk.Application):
             'wine_debug': "WINEDEBUG=fixme-all DXVK_LOG_LEVEL=none",
             'env_vars': '',
             'icon_view': self.icon_view,
-            'single-prefix': self.single_prefix
+            'single-prefix': self.single_prefix,
+            'fingerprint-mode': self.fingerprint_mode,
+            'wineserver-prewarm': self.wineserver_prewarm
         }
+        if self.settings.get('trace'):
+            settings['trace'] = self.settings['trace']
+        if self.settings.get('stall-watchdog'):
+            settings['stall-watchdog'] = self.settings['stall-watchdog']
 
-        try:
-            with open(self.settings_file, 'w') as settings_file:
-                yaml.dump(settings, settings_file, default_flow_style=False, indent=4)
-            print(f"Settings saved to {self.settings_file} with content:\n{settings}")
-        except Exception as e:
-            print(f"Error saving settings: {e}")
+        self.settings_store.replace(settings)
 
     def load_settings(self):
         self.print_method_name()
-        """Load settings from the Settings.yaml file."""
-        if self.settings_file.exists():
-            with open(self.settings_file, 'r') as settings_file:
-                settings = yaml.safe_load(settings_file) or {}
-
+        """
+        Load settings from the Settings.yaml file. The file is read once; later calls
+        return the in-memory settings.
+        """
+        settings = self.settings_store.load()
+        if self.settings_store.exists():
             # Expand and resolve paths when loading
             self.template = self.expand_and_resolve_path(settings.get('template', self.default_template_win64))
             self.runner = self.expand_and_resolve_path(settings.get('runner', ''))
@@ -787,10 +2765,17 @@ class WineCharmApp(Gtk.Application):
             self.icon_view = settings.get('icon_view', False)
             self.env_vars = settings.get('env_vars', '')
             self.single_prefix = settings.get('single-prefix', False)
-            return settings
+            self.fingerprint_mode = settings.get('fingerprint-mode', False)
+            self.wineserver_prewarm = settings.get('wineserver-prewarm', False)
 
-        # If no settings file, return an empty dictionary
-        return {}
+        # The same dict is returned every time, so self.settings stays current
+        return settings
+
+    def on_setting_changed(self, key, value):
+        #self.print_method_name()
+        if key == 'trace' and not TRACER.enabled and trace_output_path(value):
+            TRACER.enable(trace_output_path(value))
+            TRACER.instrument(WineCharmApp)
         
     def set_open_button_icon_visible(self, visible):
         self.print_method_name()
@@ -953,6 +2938,15 @@ class WineCharmApp(Gtk.Application):
         self.search_entry_box.set_hexpand(True)
         self.search_entry.set_hexpand(True)
 
+        # Facet filter (runner, prefix, arch, ...) next to the search entry
+        self.facet_button = Gtk.MenuButton()
+        self.facet_button.set_icon_name("view-more-symbolic")
+        self.facet_button.set_tooltip_text("Filter")
+        self.facet_popover = Gtk.Popover()
+        self.facet_popover.connect("show", self.populate_facet_popover)
+        self.facet_button.set_popover(self.facet_popover)
+        self.search_entry_box.append(self.facet_button)
+
         self.main_frame = Gtk.Frame()
         self.main_frame.set_margin_top(0)
         self.vbox.append(self.main_frame)
@@ -974,7 +2968,20 @@ class WineCharmApp(Gtk.Application):
 
         self.flowbox.set_homogeneous(True)
         self.flowbox.set_selection_mode(Gtk.SelectionMode.NONE)
-        self.scrolled.set_child(self.flowbox)
+        # The flowbox only holds processing steps; scripts live in self.script_view
+        self.flowbox_viewport = Gtk.Viewport()
+        self.flowbox_viewport.set_child(self.flowbox)
+
+        # Script list: a model-backed grid that only builds widgets for visible items
+        self.script_store = Gio.ListStore(item_type=ScriptItem)
+        # Searching only changes the filter and sorter; the store itself is left alone
+        self.script_filter = Gtk.CustomFilter.new(self.script_filter_func)
+        self.script_filter_model = Gtk.FilterListModel(model=self.script_store)
+        self.script_search_sorter = Gtk.CustomSorter.new(self.script_search_sort_func, None)
+        self.script_sort_model = Gtk.SortListModel(model=self.script_filter_model)
+        self.script_view = Gtk.GridView(model=Gtk.NoSelection(model=self.script_sort_model))
+        self.update_script_view_layout()
+        self.scrolled.set_child(self.script_view)
 
         key_controller = Gtk.EventControllerKey()
         key_controller.connect("key-pressed", self.on_key_pressed)
@@ -1037,20 +3044,41 @@ class WineCharmApp(Gtk.Application):
         reverse = reverse_str == "True"
 
         print(f"Sorting by {key} {'descending' if reverse else 'ascending'}")
-        
-        def sort_key(item):
-            _, value = item
-            if key == 'mtime':
-                # Convert to float for proper numerical comparison
-                return float(value.get(key, 0))
-            else:
-                # For string values, convert to lowercase for case-insensitive sorting
-                val = value.get(key, '')
-                return val.lower() if isinstance(val, str) else val
 
-        sorted_scripts = sorted(self.script_list.items(), key=sort_key, reverse=reverse)
-        self.script_list = {key: value for key, value in sorted_scripts}
-        GLib.idle_add(self.create_script_list)
+        # The order is applied to the model in place; rows keep their highlight and state
+        self.sort_order = (key, reverse)
+        self.sort_script_store()
+
+    def get_script_sort_key(self, script_key, key):
+        #self.print_method_name()
+        sort_keys = self.script_sort_keys.get(script_key)
+        if sort_keys is None:
+            return 0.0 if key == 'mtime' else ''
+        if key not in sort_keys:
+            # Keys other than the menu ones are taken from the script data when first used
+            value = self.script_list.get(script_key, {}).get(key, '')
+            sort_keys[key] = value.lower() if isinstance(value, str) else str(value)
+        return sort_keys[key]
+
+    def sort_items(self, items):
+        #self.print_method_name()
+        """
+        Sorts script items by the cached sort keys of the current sort order.
+        """
+        if self.sort_order is None:
+            return items
+        key, reverse = self.sort_order
+        return sorted(items, key=lambda item: self.get_script_sort_key(item.script_key, key), reverse=reverse)
+
+    def sort_script_store(self):
+        self.print_method_name()
+        """
+        Reorders the items of self.script_store by the current sort order. The same items
+        are put back, so only the visible cells are rebound.
+        """
+        count = self.script_store.get_n_items()
+        items = [self.script_store.get_item(position) for position in range(count)]
+        self.script_store.splice(0, count, self.sort_items(items))
 
     def create_open_actions(self):
         self.print_method_name()
@@ -1219,47 +3247,58 @@ class WineCharmApp(Gtk.Application):
         self.print_method_name()
         """
         Filters the script list based on the search term and updates the UI accordingly.
+        Matching is done by self.search_index; the script view is filtered and ordered
+        by rank through its filter and sort models, no items are rebuilt.
         
         Parameters:
             search_term (str): The term to search for within exe_name, script_name (script_path.stem), or progname.
         """
-        # Normalize the search term for case-insensitive matching
-        search_term = search_term.lower()
-        
-        # Clear the existing flowbox to prepare for the filtered scripts
-        self.flowbox.remove_all()
-        
-        # Flag to check if any scripts match the search term
-        found_match = False
-        
-        # Iterate over all scripts in self.script_list using script_key and script_data
-        for script_key, script_data in list(self.script_list.items()):
-            # Resolve the script path, executable name, and get the progname
-            script_path = Path(script_data['script_path']).expanduser().resolve()
-            exe_name = Path(script_data['exe_file']).expanduser().resolve().name
-            progname = script_data.get('progname', '').lower()  # Fallback to empty string if 'progname' is missing
-            
-            # Check if the search term is present in the exe_name, script_name (stem), or progname
-            if (search_term in exe_name.lower() or 
-                search_term in script_path.stem.lower() or 
-                search_term in progname):
-                found_match = True
-                
-                # Create a script row. Ensure that create_script_row accepts script_key and script_data
-                row = self.create_script_row(script_key, script_data)
-                
-                # Append the created row to the flowbox for display
-                self.flowbox.append(row)
-                
-                # If the script is currently running, update the UI to reflect its running state
-                if script_key in self.running_processes:
-                    #self.update_ui_for_running_process(script_key, row, self.running_processes)
-                    self.update_ui_for_running_process(self.running_processes)
+        # Processing steps may be on screen; bring the script list back first
+        if self.scrolled.get_child() is not self.script_view:
+            self.show_script_list()
 
+        ranks = self.search_index.search(search_term)
+        self.apply_script_filter(ranks)
 
-        if not found_match:
+        if ranks is not None and not ranks:
             print(f"No matches found for search term: {search_term}")
 
+    def apply_script_filter(self, ranks):
+        #self.print_method_name()
+        """
+        Shows only the scripts in ranks, best match first, or all scripts if ranks is None.
+        The facet selection is applied on top.
+        """
+        self.search_ranks = ranks
+        self.refresh_script_filter()
+
+    def refresh_script_filter(self):
+        #self.print_method_name()
+        ranks = self.search_ranks
+        if ranks is None and self.facet_matches is None:
+            self.script_filter_model.set_filter(None)
+            self.script_sort_model.set_sorter(None)
+            return
+        self.script_filter_model.set_filter(self.script_filter)
+        self.script_filter.changed(Gtk.FilterChange.DIFFERENT)
+        if ranks is None:
+            self.script_sort_model.set_sorter(None)
+            return
+        self.script_sort_model.set_sorter(self.script_search_sorter)
+        self.script_search_sorter.changed(Gtk.SorterChange.DIFFERENT)
+
+    def script_filter_func(self, item):
+        #self.print_method_name()
+        return ((self.search_ranks is None or item.script_key in self.search_ranks)
+                and (self.facet_matches is None or item.script_key in self.facet_matches))
+
+    def script_search_sort_func(self, item_a, item_b, user_data):
+        #self.print_method_name()
+        if self.search_ranks is None:
+            return 0
+        rank_a = self.search_ranks.get(item_a.script_key, 5)
+        rank_b = self.search_ranks.get(item_b.script_key, 5)
+        return (rank_a > rank_b) - (rank_a < rank_b)
 
     def on_open_button_clicked(self, button):
         self.print_method_name()
@@ -1339,7 +3378,7 @@ class WineCharmApp(Gtk.Application):
             else:
                 GLib.idle_add(self.hide_processing_spinner)
             
-            GLib.timeout_add_seconds(0.5, self.create_script_list)
+            GLib.timeout_add_seconds(0.5, self.show_script_list)
 
     def on_back_button_clicked(self, button):
         self.print_method_name()
@@ -1375,7 +3414,7 @@ class WineCharmApp(Gtk.Application):
         self.remove_accelerator_context()
             
         # Restore the script list
-        self.create_script_list()
+        self.show_script_list()
         
     def remove_accelerator_context(self):
         # Cleanup accelerator group when leaving options view
@@ -1507,7 +3546,7 @@ class WineCharmApp(Gtk.Application):
         self.launch_button.set_size_request(450, 36)
 
         #yaml_info = self.extract_yaml_info(script)
-        script_key = script_data['sha256sum']  # Use sha256sum as the key
+        script_key = self.get_script_key(script_data)  # Use sha256sum (or fingerprint) as the key
 
         if script_key in self.running_processes:
             launch_icon = Gtk.Image.new_from_icon_name("media-playback-stop-symbolic")
@@ -1570,43 +3609,381 @@ class WineCharmApp(Gtk.Application):
 ############################### 1050 - 1682 ########################################
     def create_script_list(self):
         self.print_method_name()
-        # Clear the flowbox
+        """
+        Rebuilds the script list model from self.script_list. No widgets are built here;
+        self.script_view creates and recycles them only for the items that are visible.
+        """
+        # The model is built from the current script_list; earlier changes are included
+        self.script_changes.discard()
+
+        # A rebuild supersedes any population still in progress
+        self.script_list_generation += 1
+        if self.script_list_source_id is not None:
+            GLib.source_remove(self.script_list_source_id)
+            self.script_list_source_id = None
+
+        # Rebuild the script list
+        self.script_ui_data = {}  # Use script_data to hold all script-related data
+        self.search_index.clear()
+        self.script_facets.clear()
+        self.script_sort_keys = {}
+        self.facet_matches = None
+        self.apply_script_filter(None)
+        self.script_store.remove_all()
+        self.set_scrolled_content(self.script_view)
+
+        # Rows are created in sort order: the first screenful now, the rest in idle
+        # batches that each stay within a frame budget
+        pending = self.script_list_pending = collections.deque(self.presort_script_keys(list(self.script_list)))
+        generation = self.script_list_generation
+        if self.populate_script_list_batch(pending, generation, min_items=60):
+            self.script_list_source_id = GLib.idle_add(self.populate_script_list_batch, pending, generation)
+
+    def queue_script_rows(self, script_keys):
+        self.print_method_name()
+        """
+        Hands new script keys to the batched population, for change sets too large to
+        create in one frame. Their rows are appended and the store sorted when done.
+        """
+        self.script_list_pending.extend(self.presort_script_keys(script_keys))
+        if self.script_list_source_id is None:
+            self.script_list_source_id = GLib.idle_add(
+                self.populate_script_list_batch, self.script_list_pending, self.script_list_generation
+            )
+
+    def presort_script_keys(self, script_keys):
+        #self.print_method_name()
+        """
+        Orders script keys by the current sort order using only their script data, so
+        rows can be added in their final order before they are indexed.
+        """
+        if self.sort_order is None:
+            return script_keys
+        key, reverse = self.sort_order
+
+        def sort_value(script_key):
+            value = self.script_list.get(script_key, {}).get(key)
+            if key == 'mtime':
+                return float(value or 0.0)
+            return str(value or '').lower()
+        return sorted(script_keys, key=sort_value, reverse=reverse)
+
+    def populate_script_list_batch(self, pending, generation, min_items=0, budget=0.008):
+        #self.print_method_name()
+        """
+        Creates rows for pending script keys until the frame budget (seconds) is used
+        up, at least min_items of them, and appends them to the model. Returns True
+        while rows remain, so it can serve as an idle callback.
+        """
+        if generation != self.script_list_generation:
+            return False
+
+        deadline = time.monotonic() + budget
+        items = []
+        while pending and (len(items) < min_items or time.monotonic() < deadline):
+            script_key = pending.popleft()
+            script_data = self.script_list.get(script_key)
+            # Scripts removed meanwhile are skipped; ones added by a change already have a row
+            if script_data is None or script_key in self.script_ui_data:
+                continue
+            try:
+                items.append(self.create_script_row(script_key, script_data))
+            except Exception as e:
+                print(f"Error creating row for {script_key}: {e}")
+        self.script_store.splice(self.script_store.get_n_items(), 0, items)
+        self.check_exe_files(item.script_key for item in items)
+
+        if pending:
+            return True
+
+        self.script_list_source_id = None
+        # Sort keys not in the script data (e.g. a missing mtime) are known only now
+        if self.sort_order is not None:
+            self.sort_script_store()
+        # Keep the facet selection and search across rebuilds
+        if any(self.facet_selection.values()):
+            self.refresh_facet_filter()
+        if self.search_ranks is not None:
+            self.filter_script_list(self.search_entry.get_text())
+        return False
+
+    def show_step_flowbox(self):
+        #self.print_method_name()
+        """
+        Empties the step flowbox and puts it on screen so processing steps can be
+        appended to it. The script model stays as it is and keeps receiving changes.
+        """
         self.flowbox.remove_all()
+        self.set_scrolled_content(self.flowbox_viewport)
+
+    def show_script_list(self):
+        self.print_method_name()
+        """
+        Puts the script list back on screen (after processing steps or an options page),
+        with no row clicked and no search applied. Nothing is rebuilt; pending changes
+        are applied first.
+        """
+        self.script_changes.flush()
+        for data in self.script_ui_data.values():
+            if data['is_clicked_row']:
+                data['is_clicked_row'] = False
+                data['row'].remove_css_class("blue")
+                self.hide_buttons(data['play_button'], data['options_button'])
+        self.apply_script_filter(None)
+        self.set_scrolled_content(self.script_view)
+        return False
+
+    def set_scrolled_content(self, widget):
+        #self.print_method_name()
+        if self.scrolled.get_child() is not widget:
+            self.scrolled.set_child(widget)
+
+    def update_script_view_layout(self):
+        self.print_method_name()
+        """
+        Installs a fresh item factory for the current view mode (icon or list). Setting the
+        factory rebinds the visible items, so the model does not need to be rebuilt.
+        """
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self.on_script_item_setup)
+        factory.connect("bind", self.on_script_item_bind)
+        factory.connect("unbind", self.on_script_item_unbind)
+
+        self.script_view.set_max_columns(8 if self.icon_view else 4)
+        self.script_view.set_factory(factory)
+
+    def create_script_row(self, script_key, script_data):
+        #self.print_method_name()
+        """
+        Registers the UI state for a script and returns its list model item.
+
+        The row, play button and options button stored in self.script_ui_data are
+        ScriptWidgetProxy objects; they are attached to real widgets by the script
+        view factory whenever the script scrolls into view.
+
+        Args:
+            script_key (str): The unique key for the script (e.g., sha256sum).
+            script_data (dict): Data associated with the script.
+
+        Returns:
+            ScriptItem: The item to add to self.script_store.
+        """
+        script = Path(script_data['script_path']).expanduser()
+        self.index_script(script_key, script_data)
+
+        row = ScriptWidgetProxy()
+        play_button = ScriptWidgetProxy(visible=False, tooltip="Play", icon_name="media-playback-start-symbolic")
+        options_button = ScriptWidgetProxy(visible=False, tooltip="Options")
+
+        is_running = script_key in self.running_processes
+        self.update_row_highlight(row, is_running)
+        if is_running:
+            self.set_play_stop_button_state(play_button, True)
+
+        # **Store references in self.script_ui_data**
+        self.script_ui_data[script_key] = {
+            'row': row,  # Proxy for the overlay that contains the row UI
+            'play_button': play_button,  # The play button for the row
+            'options_button': options_button,  # The options button
+            'highlighted': is_running,
+            'is_running': is_running,
+            'is_clicked_row': False,
+            'script_path': script
+        }
+
+        return ScriptItem(script_key)
+
+    def index_script(self, script_key, script_data):
+        #self.print_method_name()
+        """
+        Adds a script to the search index and the facets, replacing older entries.
+        """
+        script = Path(script_data['script_path']).expanduser()
+        exe_file = Path(script_data['exe_file']).expanduser()
+        self.search_index.add(
+            script_key,
+            script_data.get('progname', ''),
+            exe_file.name,
+            script.stem
+        )
+
+        wineprefix = Path(script_data.get('wineprefix') or script.parent).expanduser()
+        runner = script_data.get('runner') or ""
+        mtime = script_data.get('mtime')
+        if mtime is None:
+            try:
+                mtime = script.stat().st_mtime
+            except OSError:
+                mtime = time.time()
+        self.script_sort_keys[script_key] = {
+            'progname': str(script_data.get('progname', '')).lower(),
+            'wineprefix': str(script_data.get('wineprefix', '')).lower(),
+            'mtime': float(mtime)
+        }
+        self.script_facets.add(script_key, {
+            'runner': Path(runner).expanduser().parent.parent.name if runner else "System Wine",
+            'prefix': wineprefix.name,
+            'arch': self.get_prefix_arch(wineprefix),
+            'running': True if script_key in self.running_processes else None,
+            # Checked off the main loop by check_exe_files
+            'exe-missing': None,
+            'new': True if script.stem in self.new_scripts else None
+        })
+
+    def get_prefix_arch(self, wineprefix):
+        #self.print_method_name()
+        """
+        Returns the architecture of a wineprefix from its system.reg, read once per prefix.
+        """
+        wineprefix = str(wineprefix)
+        arch = self.prefix_arch_cache.get(wineprefix)
+        if arch is None:
+            arch = self.get_template_arch(wineprefix) if (Path(wineprefix) / "system.reg").exists() else "unknown"
+            self.prefix_arch_cache[wineprefix] = arch
+        return arch
+
+    def set_running_facet(self, script_key, is_running):
+        #self.print_method_name()
+        """
+        Updates the running facet of a script; safe to call from worker threads.
+        """
+        if self.script_facets.set(script_key, 'running', True if is_running else None):
+            if self.facet_selection.get('running'):
+                GLib.idle_add(self.refresh_facet_filter)
+
+    def refresh_facet_filter(self):
+        #self.print_method_name()
+        self.facet_matches = self.script_facets.query(self.facet_selection)
+        self.refresh_script_filter()
+        if self.facet_matches is None:
+            self.facet_button.remove_css_class("accent")
+        else:
+            self.facet_button.add_css_class("accent")
+        return False
 
-        # Rebuild the script list
-        self.script_ui_data = {}  # Use script_data to hold all script-related data
+    def mark_script_new(self, stem, script_key=None):
+        #self.print_method_name()
+        """
+        Records a script as new; safe to call from worker threads. Scripts indexed
+        afterwards get the 'new' facet from self.new_scripts; pass script_key for one
+        that is already in the list.
+        """
+        self.new_scripts.add(stem)
+        if script_key and self.script_facets.set(script_key, 'new', True):
+            if self.facet_selection.get('new'):
+                GLib.idle_add(self.refresh_facet_filter)
 
-        # Iterate over self.script_list
-        for script_key, script_data in list(self.script_list.items()):
-            row = self.create_script_row(script_key, script_data)
-            if row:
-                self.flowbox.append(row)
+    def check_exe_files(self, script_keys):
+        #self.print_method_name()
+        """
+        Updates the 'exe-missing' facet of the given scripts. Their exe files are
+        checked in a worker thread and the result applied by on_exe_missing_checked.
+        """
+        script_keys = list(script_keys)
+        if not script_keys:
+            return
 
-            # After row creation, highlight if the process is running
-            if script_key in self.running_processes:
-                self.update_row_highlight(row, True)
-                self.script_ui_data[script_key]['highlighted'] = True
-                self.script_ui_data[script_key]['is_running'] = True  # Set is_running to True
-            else:
-                self.update_row_highlight(row, False)
-                self.script_ui_data[script_key]['highlighted'] = False
-                self.script_ui_data[script_key]['is_running'] = False  # Ensure is_running is False
+        def check():
+            missing = {}
+            for script_key in script_keys:
+                record = self.script_index.record(script_key)
+                missing[script_key] = True if record is None or not os.path.exists(record.exe_file) else None
+            GLib.idle_add(self.on_exe_missing_checked, missing)
 
+        self.exe_check_executor.submit(check)
 
-    def create_script_row(self, script_key, script_data):
+    def on_exe_missing_checked(self, missing):
         #self.print_method_name()
+        changed = False
+        for script_key, value in missing.items():
+            changed |= self.script_facets.set(script_key, 'exe-missing', value)
+        if changed:
+            if self.facet_selection.get('exe-missing'):
+                self.refresh_facet_filter()
+            if self.facet_popover.get_visible():
+                self.populate_facet_popover(self.facet_popover)
+        return False
+
+    def populate_facet_popover(self, popover):
+        self.print_method_name()
         """
-        Creates a row for a given script in the UI, including the play and options buttons.
+        Fills the facet popover with a check button per facet value and its current count.
+        """
+        titles = {
+            'runner': "Runner",
+            'prefix': "Prefix",
+            'arch': "Architecture",
+            'running': "Running",
+            'exe-missing': "Exe missing",
+            'new': "New"
+        }
+        vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
+        vbox.set_margin_top(6)
+        vbox.set_margin_bottom(6)
+        vbox.set_margin_start(6)
+        vbox.set_margin_end(6)
+
+        # Yes/no facets go together under one heading
+        flag_facets = [facet for facet in ('running', 'exe-missing', 'new') if self.script_facets.counts(facet)]
+        if flag_facets:
+            label = Gtk.Label(label="Show Only", xalign=0)
+            label.add_css_class("heading")
+            vbox.append(label)
+            for facet in flag_facets:
+                count = self.script_facets.counts(facet).get(True, 0)
+                self.add_facet_check(vbox, facet, True, f"{titles[facet]} ({count})")
+
+        for facet in ('runner', 'prefix', 'arch'):
+            counts = self.script_facets.counts(facet)
+            if len(counts) < 2 and not self.facet_selection.get(facet):
+                continue  # Nothing to choose between
+            label = Gtk.Label(label=titles[facet], xalign=0)
+            label.add_css_class("heading")
+            label.set_margin_top(6)
+            vbox.append(label)
+            for value, count in sorted(counts.items(), key=lambda item: str(item[0]).lower()):
+                self.add_facet_check(vbox, facet, value, f"{value} ({count})")
+
+        clear_button = Gtk.Button(label="Clear Filters")
+        clear_button.set_margin_top(6)
+        clear_button.set_sensitive(any(self.facet_selection.values()))
+        clear_button.connect("clicked", self.on_facet_clear_clicked)
+        vbox.append(clear_button)
+
+        scrolled = Gtk.ScrolledWindow()
+        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+        scrolled.set_propagate_natural_height(True)
+        scrolled.set_max_content_height(400)
+        scrolled.set_child(vbox)
+        popover.set_child(scrolled)
+
+    def add_facet_check(self, box, facet, value, label):
+        #self.print_method_name()
+        check = Gtk.CheckButton(label=label)
+        check.set_active(value in self.facet_selection.get(facet, ()))
+        check.connect("toggled", self.on_facet_toggled, facet, value)
+        box.append(check)
 
-        Args:
-            script_key (str): The unique key for the script (e.g., sha256sum).
-            script_data (dict): Data associated with the script.
+    def on_facet_toggled(self, check, facet, value):
+        self.print_method_name()
+        selected = self.facet_selection.setdefault(facet, set())
+        if check.get_active():
+            selected.add(value)
+        else:
+            selected.discard(value)
+        self.refresh_facet_filter()
 
-        Returns:
-            Gtk.Overlay: The overlay containing the row UI.
-        """
-        script = Path(script_data['script_path']).expanduser()
+    def on_facet_clear_clicked(self, button):
+        self.print_method_name()
+        self.facet_selection = {}
+        self.facet_popover.popdown()
+        self.refresh_facet_filter()
 
+    def on_script_item_setup(self, factory, list_item):
+        #self.print_method_name()
+        """
+        Builds the widgets of one recyclable script cell for the current view mode.
+        """
         # Create the main button for the row
         button = Gtk.Button()
         button.set_hexpand(True)
@@ -1614,115 +3991,178 @@ class WineCharmApp(Gtk.Application):
         button.add_css_class("flat")
         button.add_css_class("normal-font")
 
-        # Extract the program name or fallback to the script stem
-        label_text, label2_text, label3_text = "", "", ""
-        label_text = script_data.get('progname', '').replace('_', ' ') or script.stem.replace('_', ' ')
-
         # Create an overlay to add play and options buttons
         overlay = Gtk.Overlay()
         overlay.set_child(button)
 
+        icon_image = Gtk.Image()
         if self.icon_view:
             # Icon view mode: Larger icon size and vertically oriented layout
-            icon = self.load_icon(script, 64, 64)
-            icon_image = Gtk.Image.new_from_paintable(icon)
             button.set_size_request(160, 100)
             icon_image.set_pixel_size(64)
             hbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
-
-            # Create a box to hold both buttons in vertical orientation
             buttons_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-
-            # Apply text wrapping logic for the label
-            label1, label2, label3 = self.wrap_text_at_20_chars(label_text)
-            label = Gtk.Label(label=label1)
-            if label2:
-                label2 = Gtk.Label(label=label2)
-            if label3:
-                label3 = Gtk.Label(label=label3)
+            # Up to three wrapped lines (see wrap_text_at_20_chars)
+            labels = [Gtk.Label() for _ in range(3)]
         else:
             # Non-icon view mode: Smaller icon size and horizontally oriented layout
-            icon = self.load_icon(script, 32, 32)
-            icon_image = Gtk.Image.new_from_paintable(icon)
             button.set_size_request(450, 36)
             icon_image.set_pixel_size(32)
             hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
-
-            # Create a box to hold both buttons in horizontal orientation
             buttons_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-
-            # Use a single line label for non-icon view
-            label = Gtk.Label(label=label_text)
+            label = Gtk.Label()
             label.set_xalign(0)
             label.set_ellipsize(Pango.EllipsizeMode.END)
-            label2 = Gtk.Label(label="")
-            label3 = Gtk.Label(label="")
+            labels = [label]
 
-        # Set up the label and icon in the button
         hbox.append(icon_image)
-        hbox.append(label)
-        if self.icon_view and label2:
-            hbox.append(label2)
-        if self.icon_view and label3:
-            hbox.append(label3)
-
+        for label in labels:
+            hbox.append(label)
         button.set_child(hbox)
 
-        # Apply bold styling to the label if the script is new
-        if script.stem in self.new_scripts:
-            label.set_markup(f"<b>{label.get_text()}</b>")
-            if label2:
-                label2.set_markup(f"<b>{label2.get_text()}</b>")
-
-            if label3:
-                label3.set_markup(f"<b>{label3.get_text()}</b>")
-            
         buttons_box.set_margin_end(6)  # Adjust this value to prevent overlapping
 
-        # Play button
         play_button = Gtk.Button.new_from_icon_name("media-playback-start-symbolic")
-        play_button.set_tooltip_text("Play")
-        if self.icon_view:
-            play_button.set_size_request(50, 40)
-        else:
-            play_button.set_size_request(50, -1)
-        
+        play_button.set_size_request(50, 40 if self.icon_view else -1)
         play_button.set_visible(False)  # Initially hidden
         buttons_box.append(play_button)
 
-        # Options button
         options_button = Gtk.Button.new_from_icon_name("emblem-system-symbolic")
-        options_button.set_tooltip_text("Options")
         options_button.set_visible(False)  # Initially hidden
         buttons_box.append(options_button)
 
-        # Add the buttons box to the overlay
         overlay.add_overlay(buttons_box)
         buttons_box.set_halign(Gtk.Align.END)
         buttons_box.set_valign(Gtk.Align.CENTER)
 
-        # **Store references in self.script_ui_data**
-        self.script_ui_data[script_key] = {
-            'row': overlay,  # The overlay that contains the row UI
-            'play_button': play_button,  # The play button for the row
-            'options_button': options_button,  # The options button
-            'highlighted': False,  # Initially not highlighted
-            'is_running': False,  # Not running initially
-            'is_clicked_row': False,
-            'script_path': script
-        }
+        # Keep references for bind/unbind; script_key is set while the cell is bound
+        overlay.script_key = None
+        overlay.icon_request = None  # token of the pending icon decode for this cell
+        overlay.icon_image = icon_image
+        overlay.labels = labels
+        overlay.play_button = play_button
+        overlay.options_button = options_button
+
+        play_button.connect("clicked", self.on_script_cell_play_clicked, overlay)
+        options_button.connect("clicked", self.on_script_cell_options_clicked, overlay)
+        button.connect("clicked", self.on_script_cell_clicked, overlay)
+
+        # Hovering a cell can pre-warm the wineserver of its prefix
+        overlay.hover_source = None
+        motion = Gtk.EventControllerMotion()
+        motion.connect("enter", self.on_script_cell_enter, overlay)
+        motion.connect("leave", self.on_script_cell_leave, overlay)
+        overlay.add_controller(motion)
+
+        list_item.set_child(overlay)
+
+    def on_script_item_bind(self, factory, list_item):
+        #self.print_method_name()
+        """
+        Fills a recycled cell with the script's icon and label and attaches the
+        script's row proxies to the cell's widgets.
+        """
+        overlay = list_item.get_child()
+        script_key = list_item.get_item().script_key
+        script_data = self.script_list.get(script_key)
+        ui_state = self.script_ui_data.get(script_key)
+        if script_data is None or ui_state is None:
+            return
+
+        overlay.script_key = script_key
+        script = Path(script_data['script_path']).expanduser()
+
+        # Extract the program name or fallback to the script stem
+        label_text = script_data.get('progname', '').replace('_', ' ') or script.stem.replace('_', ' ')
+
+        if self.icon_view:
+            self.set_cell_icon(overlay, script, 64)
+            texts = self.wrap_text_at_20_chars(label_text)
+        else:
+            self.set_cell_icon(overlay, script, 32)
+            texts = [label_text]
+
+        # Apply bold styling to the label if the script is new
+        is_new = script.stem in self.new_scripts
+        for label, text in zip(overlay.labels, texts):
+            if is_new and text:
+                label.set_markup(f"<b>{GLib.markup_escape_text(text)}</b>")
+            else:
+                label.set_text(text)
+            label.set_visible(bool(text) or label is overlay.labels[0])
+
+        ui_state['row'].attach(overlay)
+        ui_state['play_button'].attach(overlay.play_button)
+        ui_state['options_button'].attach(overlay.options_button)
+
+    def set_cell_icon(self, overlay, script, pixel_size):
+        #self.print_method_name()
+        """
+        Shows the script's icon in a cell if it is already decoded; otherwise shows the
+        default icon and decodes the real one in the background.
+        """
+        icon_path = script.parent / (script.stem + ".png")
+        texture = self.icon_cache.lookup(icon_path, pixel_size)
+        if texture is not None:
+            overlay.icon_request = None
+            overlay.icon_image.set_from_paintable(texture)
+            return
+
+        overlay.icon_image.set_from_paintable(self.icon_cache.load(self.get_default_icon_path(), pixel_size))
+        if not icon_path.exists():
+            overlay.icon_request = None
+            return
 
-        # Connect the play button to toggle the script's running state
-        play_button.connect("clicked", lambda btn: self.toggle_play_stop(script_key, play_button, overlay))
+        token = object()
+        overlay.icon_request = token
+        self.icon_cache.request(
+            icon_path,
+            pixel_size,
+            lambda texture: GLib.idle_add(self.on_cell_icon_loaded, overlay, token, texture),
+            lambda: overlay.icon_request is token
+        )
 
-        # Connect the options button to show the script's options
-        options_button.connect("clicked", lambda btn: self.show_options_for_script(self.script_ui_data[script_key], overlay, script_key))
+    def on_cell_icon_loaded(self, overlay, token, texture):
+        #self.print_method_name()
+        # The cell may have been recycled for another script meanwhile
+        if overlay.icon_request is token:
+            overlay.icon_request = None
+            if texture is not None:
+                overlay.icon_image.set_from_paintable(texture)
+        return False
 
+    def on_script_item_unbind(self, factory, list_item):
+        #self.print_method_name()
+        overlay = list_item.get_child()
+        ui_state = self.script_ui_data.get(overlay.script_key)
+        if ui_state:
+            ui_state['row'].detach(overlay)
+            ui_state['play_button'].detach(overlay.play_button)
+            ui_state['options_button'].detach(overlay.options_button)
+        if overlay.hover_source is not None:
+            GLib.source_remove(overlay.hover_source)
+            overlay.hover_source = None
+        overlay.script_key = None
+        overlay.icon_request = None
+
+    def on_script_cell_play_clicked(self, button, overlay):
+        self.print_method_name()
+        ui_state = self.script_ui_data.get(overlay.script_key)
+        if ui_state:
+            # Connect the play button to toggle the script's running state
+            self.toggle_play_stop(overlay.script_key, ui_state['play_button'], ui_state['row'])
+
+    def on_script_cell_options_clicked(self, button, overlay):
+        self.print_method_name()
+        ui_state = self.script_ui_data.get(overlay.script_key)
+        if ui_state:
+            self.show_options_for_script(ui_state, ui_state['row'], overlay.script_key)
+
+    def on_script_cell_clicked(self, button, overlay):
         # Event handler for button click (handles row highlighting)
-        button.connect("clicked", lambda *args: self.on_script_row_clicked(script_key))
+        if overlay.script_key is not None:
+            self.on_script_row_clicked(overlay.script_key)
 
-        return overlay
-       
     def show_buttons(self, play_button, options_button):
         self.print_method_name()
         play_button.set_visible(True)
@@ -1777,6 +4217,8 @@ class WineCharmApp(Gtk.Application):
             row.add_css_class("blue")
             self.show_buttons(play_button, options_button)
             print(f"Highlighting clicked row for script_key: {script_key} with 'blue'")
+            # A launch is likely now; start the prefix's wineserver if enabled
+            self.prewarm_wineserver(script_key)
         else:
             # Remove highlight and hide buttons for the current row if it's not running
             row.remove_css_class("blue")
@@ -1878,6 +4320,9 @@ class WineCharmApp(Gtk.Application):
 
         # Handle wineprefix and process linked files if necessary
         process_info = self.running_processes.pop(script_key, None)
+        self.set_running_facet(script_key, False)
+        if process_info:
+            self.stop_watching_processes(process_info)
         
         # Initialize variables
         exe_name = None
@@ -1895,37 +4340,18 @@ class WineCharmApp(Gtk.Application):
                     # Get parent script's runner
                     script_data = self.script_list.get(script_key, {})
                     parent_runner = script_data.get('runner', '')
-                    self.create_scripts_for_lnk_files(wineprefix, parent_runner)
-                    self.find_and_remove_wine_created_shortcuts()
+                    # Reading the shortcuts and hashing the exes they point to can take
+                    # long (a large installer); the new scripts arrive through the change bus
+                    self.shortcut_executor.submit(self.create_scripts_for_lnk_files_in_worker, wineprefix, parent_runner)
 
         # Only proceed if exe_name and exe_parent_name are defined
+        # A process just exited, so the process table has to be read again; the rescan
+        # at the end of this method shares the same snapshot
+        self.process_supervisor.invalidate()
         if exe_name and exe_parent_name:
             # Check if any processes with the same exe_name and exe_parent_name are still running
-            is_still_running = False
-            new_pid = None
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-                try:
-                    proc_name = proc.info['name']
-                    proc_cmdline = proc.info['cmdline'] or []
-
-                    # Check if process name matches the target executable name
-                    if proc_name.lower() == exe_name.lower() or any(exe_name.lower() in arg.lower() for arg in proc_cmdline):
-                        # Extract parent directory names from command-line arguments
-                        for arg in proc_cmdline:
-                            if exe_name.lower() in arg.lower():
-                                proc_exe_path = Path(arg)
-                                proc_exe_parent_name = proc_exe_path.parent.name
-
-                                # Compare parent directory names
-                                if proc_exe_parent_name == exe_parent_name:
-                                    # Process matches
-                                    is_still_running = True
-                                    new_pid = proc.pid
-                                    break
-                        if is_still_running:
-                            break
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                    continue
+            new_pid = self.process_supervisor.snapshot().find_exe(exe_name, exe_parent_name)
+            is_still_running = new_pid is not None
 
             if is_still_running:
                 # The process has respawned or is still running
@@ -1941,10 +4367,11 @@ class WineCharmApp(Gtk.Application):
                     "pid": new_pid,  # Update with the new PID
                     "unique_id": unique_id
                 }
+                self.set_running_facet(script_key, True)
                 print(f"Process with exe_name {exe_name} and parent directory '{exe_parent_name}' is still running (respawned).")
 
                 # Start monitoring the new process
-                threading.Thread(target=self.monitor_external_process, args=(script_key, new_pid), daemon=True).start()
+                self.monitor_pids(script_key, [new_pid])
 
                 # Update UI elements
                 ui_state['is_running'] = True
@@ -2011,8 +4438,6 @@ class WineCharmApp(Gtk.Application):
             )
             return None
 
-        self.debug = True  # Enable debugging
-
         # Generate a unique ID for the process
         unique_id = str(uuid.uuid4())
         env = os.environ.copy()
@@ -2070,6 +4495,11 @@ class WineCharmApp(Gtk.Application):
                     env=env
                 )
 
+                # The watches of an earlier run must not end this one
+                previous = self.running_processes.get(script_key)
+                if previous:
+                    self.stop_watching_processes(previous)
+
                 self.running_processes[script_key] = {
                     "process": process,
                     "unique_id": unique_id,
@@ -2081,6 +4511,7 @@ class WineCharmApp(Gtk.Application):
                     "runner": str(runner_path),
                     "wineprefix": str(wineprefix)
                 }
+                self.set_running_facet(script_key, True)
                 
                 # Set the current runner for all the following scripts which will be created by this script's exe_file
                 self.runner_to_use = runner_path
@@ -2093,8 +4524,8 @@ class WineCharmApp(Gtk.Application):
                 if ui_state:
                     ui_state['is_running'] = True
 
-                threading.Thread(target=self.monitor_process, args=(script_key,), daemon=True).start()
-                GLib.timeout_add_seconds(5, self.get_child_pid_async, script_key)
+                self.monitor_process(script_key)
+                self.get_child_pid_async(script_key)
 
         except Exception as e:
             error_message = f"Error launching script: {e}"
@@ -2127,8 +4558,6 @@ class WineCharmApp(Gtk.Application):
         Returns:
             Path or str: The resolved runner path or command.
         """
-        self.debug = True  # Enable debugging
-
         # Get the runner from the script data, fallback to 'wine' if not provided
         runner = script_data.get('runner', '').strip()
         if not runner:
@@ -2164,45 +4593,54 @@ class WineCharmApp(Gtk.Application):
             print(f"Resolved runner path: {runner_path}")
 
         try:
-            # Check if the runner works by running 'runner --version'
-            result = subprocess.run(
-                [str(runner_path), "--version"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                env=os.environ.copy()
+            # Check if the runner works; 'runner --version' is only run again when the
+            # runner binary changed. A runner not checked before is launched right away
+            # and checked in the background, so the UI never waits for the probe
+            result = self.runner_cache.validate(
+                runner_path, wait=False,
+                on_probed=lambda entry: self.on_runner_probed(runner_path, entry)
             )
-            if result.returncode != 0:
-                raise Exception(result.stderr.strip())
-            if self.debug:
-                print(f"Runner version: {result.stdout.strip()}")
+            if result is None:
+                print(f"Checking runner {runner_path} in the background")
+            elif not result['valid']:
+                raise Exception(result['error'])
+            elif self.debug:
+                print(f"Runner version: {result['version']}")
         except Exception as e:
             raise RuntimeError(f"Failed to run '{runner_path} --version'. Error: {e}")
 
         return runner_path
 
+    def on_runner_probed(self, runner_path, entry):
+        #self.print_method_name()
+        """
+        Called from the runner cache's probing thread after a background check that
+        get_runner did not wait for; reports a runner that does not work.
+        """
+        if not entry['valid']:
+            print(f"Runner {runner_path} failed its check: {entry['error']}")
+            GLib.idle_add(
+                self.show_info_dialog,
+                "Runner Error",
+                f"'{runner_path} --version' failed. Error: {entry['error']}"
+            )
+
     def find_command_in_path(self, command):
         self.print_method_name()
         """
         Checks if a command exists in the system's PATH.
         Returns the absolute path if found, otherwise None.
         """
-        self.debug = True
         if self.debug:
             print(f"Looking for command: {command} in PATH")
 
         try:
-            result = subprocess.run(
-                ["which", command],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
+            found = shutil.which(command)
             if self.debug:
-                print(f"'which' result for {command}: returncode={result.returncode}, stdout={result.stdout.strip()}, stderr={result.stderr.strip()}")
+                print(f"'which' result for {command}: {found}")
 
-            if result.returncode == 0:
-                path = Path(result.stdout.strip())
+            if found:
+                path = Path(found)
                 if path.exists():
                     if self.debug:
                         print(f"Command found: {path}")
@@ -2215,8 +4653,6 @@ class WineCharmApp(Gtk.Application):
 
         if self.debug:
             print(f"Command '{command}' not found in PATH")
-        
-        self.debug = True
         return None
 
 
@@ -2343,6 +4779,11 @@ class WineCharmApp(Gtk.Application):
 
     def monitor_process(self, script_key):
         self.print_method_name()
+        """
+        Calls on_child_process_exited from the main loop when the launched process
+        exits; GLib reaps the child, so no thread has to block in wait(). The source
+        is kept in running_processes[script_key]['child_watch'].
+        """
         process_info = self.running_processes.get(script_key)
         if not process_info:
             return
@@ -2351,14 +4792,30 @@ class WineCharmApp(Gtk.Application):
         if not process:
             return
 
-        process.wait()  # Wait for the process to complete
-        return_code = process.returncode
+        process_info["child_watch"] = GLib.child_watch_add(
+            GLib.PRIORITY_DEFAULT, process.pid, self.on_child_process_exited, (script_key, process_info)
+        )
+
+    def on_child_process_exited(self, pid, wait_status, data):
+        self.print_method_name()
+        script_key, process_info = data
+        process_info.pop("child_watch", None)
+        if process_info.get("discovery_wake"):
+            # The launcher may just have handed over to the program; look for it now
+            self.process_supervisor.invalidate()
+            process_info["discovery_wake"].set()
+        return_code = os.waitstatus_to_exitcode(wait_status)
+        # The child is already reaped; tell Popen so it never waits for it
+        process_info["process"].returncode = return_code
+
+        if self.running_processes.get(script_key) is not process_info:
+            print(f"Ignoring the exit of PID {pid}; its run of {script_key} is over")
+            return
 
         # Check if the process was manually stopped
         manually_stopped = process_info.get("manually_stopped", False)
 
-        # Update the UI in the main thread
-        GLib.idle_add(self.process_ended, script_key)
+        self.process_ended(script_key)
 
         if return_code != 0 and not manually_stopped:
             # Handle error code 2 (cancelled by the user) gracefully
@@ -2367,131 +4824,157 @@ class WineCharmApp(Gtk.Application):
                 return
 
             # Show error dialog only if the process was not stopped manually
-            script = process_info.get('script')
             wineprefix = process_info.get('wineprefix')
             exe_file = process_info.get('exe_file')
 
             log_file_path = Path(wineprefix) / f"{exe_file.stem}.log"
             error_message = f"The script failed with error code {return_code}."
 
-            # Show the error dialog
-            GLib.idle_add(
-                self.show_error_with_log_dialog,
+            self.show_error_with_log_dialog(
                 "Command Execution Error",
                 error_message,
                 log_file_path
             )
 
+    def monitor_pids(self, script_key, pids):
+        self.print_method_name()
+        """
+        Calls process_ended once all of pids have exited. The PIDs are not our
+        children, so each one is watched through a pidfd (readable when the process
+        exits) on the main loop; without pidfd support (Linux < 5.3) they are checked
+        once a second instead. The watches are kept in
+        running_processes[script_key]['watches'] as pid -> (source ID, pidfd or None).
+        """
+        process_info = self.running_processes.get(script_key)
+        if not process_info:
+            return
+
+        watches = process_info.setdefault("watches", {})
+        for pid in pids:
+            if pid in watches:
+                continue
+            try:
+                pidfd = os.pidfd_open(pid)
+            except ProcessLookupError:
+                continue  # already gone
+            except (AttributeError, OSError):
+                source_id = GLib.timeout_add_seconds(1, self.on_monitored_pid_polled, script_key, pid, process_info)
+                watches[pid] = (source_id, None)
+                continue
+            source_id = GLib.unix_fd_add_full(GLib.PRIORITY_DEFAULT, pidfd, GLib.IOCondition.IN,
+                                              self.on_monitored_pid_exited, (script_key, pid, process_info))
+            watches[pid] = (source_id, pidfd)
+
+        if not watches:
+            GLib.idle_add(self.monitored_pid_ended, script_key, None, process_info)
+
+    def on_monitored_pid_exited(self, pidfd, condition, data):
+        #self.print_method_name()
+        script_key, pid, process_info = data
+        process_info.get("watches", {}).pop(pid, None)
+        os.close(pidfd)
+        self.monitored_pid_ended(script_key, pid, process_info)
+        return False
+
+    def on_monitored_pid_polled(self, script_key, pid, process_info):
+        #self.print_method_name()
+        if psutil.pid_exists(pid):
+            return True
+        process_info.get("watches", {}).pop(pid, None)
+        self.monitored_pid_ended(script_key, pid, process_info)
+        return False
+
+    def monitored_pid_ended(self, script_key, pid, process_info):
+        #self.print_method_name()
+        # A stopped or relaunched script has a new entry; the old run's exits don't count
+        if self.running_processes.get(script_key) is not process_info:
+            return False
+        if not process_info.get("watches"):
+            self.process_ended(script_key)
+        return False
+
+    def on_untracked_child_exited(self, pid, wait_status, process):
+        #self.print_method_name()
+        # Reaped by GLib; nothing else to do for a run that is no longer tracked
+        process.returncode = os.waitstatus_to_exitcode(wait_status)
 
+    def stop_watching_processes(self, process_info):
+        #self.print_method_name()
+        """
+        Removes the child watch and the pidfd/poll sources of a run and closes its
+        pidfds, so nothing of it fires after a stop or a relaunch.
+        """
+        source_id = process_info.pop("child_watch", None)
+        if source_id:
+            GLib.source_remove(source_id)
+            # The launcher still has to be reaped once it exits, or it stays a zombie
+            process = process_info.get("process")
+            if process and process.poll() is None:
+                GLib.child_watch_add(GLib.PRIORITY_DEFAULT, process.pid, self.on_untracked_child_exited, process)
+        for source_id, pidfd in process_info.pop("watches", {}).values():
+            GLib.source_remove(source_id)
+            if pidfd is not None:
+                os.close(pidfd)
 
     def get_child_pid_async(self, script_key):
         self.print_method_name()
-        # Run get_child_pid in a separate thread
+        """
+        Finds the Windows processes started by a launch (launchers often hand over to
+        the real program and exit) and adds them to running_processes[script_key]['pids'].
+        Children can appear at any time, so a worker keeps polling the process table
+        until the run is over (its process group and the children found so far are
+        gone). The polls thin out to one a second while nothing new turns up and share
+        the supervisor's snapshot with other process queries; the launcher exiting
+        (the usual hand-over point) triggers a rescan right away.
+        """
         if script_key not in self.running_processes:
             print("Process already ended, nothing to get child PID for")
             return False
 
         process_info = self.running_processes[script_key]
-        pid = process_info.get('pid')
-        script = process_info.get('script')
-        wineprefix = Path(process_info.get('wineprefix')).expanduser().resolve()
-        exe_file = Path(process_info.get('exe_file', '')).expanduser().resolve()
-        exe_name = process_info.get('exe_name')
-
-        try:
-            # Get the runner from the script data
-            runner_path = self.get_runner(process_info)
-            runner_dir = runner_path.parent.resolve()
-            path_env = f'export PATH="{shlex.quote(str(runner_dir))}:$PATH"'
-        except Exception as e:
-            print(f"Error getting runner: {e}")
-            return False
-
-        exe_name = shlex.quote(str(exe_name))
-        runner_dir = shlex.quote(str(runner_dir))
-
-        print("="*100)
-        print(f"runner = {runner_path}")
-        print(f"exe_file = {exe_file}")
-        print(f"exe_name = {exe_name}")
+        unique_id = process_info.get('unique_id')
+        wineprefix = resolve_script_path(process_info.get('wineprefix'))
+        exe_parent = Path(process_info.get('exe_file', '')).expanduser().resolve().parent.name
+        pgid = process_info.get('pgid')
+        # Set by on_child_process_exited
+        wake = process_info['discovery_wake'] = threading.Event()
+
+        def process_group_exists():
+            try:
+                os.killpg(pgid, 0)
+            except ProcessLookupError:
+                return False
+            except (OSError, TypeError):
+                pass  # not ours to signal, or no group was recorded
+            return True
 
         def run_get_child_pid():
             self.print_method_name()
-            try:
-                print("---------------------------------------------")
-                print(f"Looking for child processes of: {exe_name}")
-
-                # Prepare command to filter processes using winedbg
-                if path_env:
-                    winedbg_command_with_grep = (
-                        f"export PATH={shlex.quote(str(runner_dir))}:$PATH; "
-                        f"WINEPREFIX={shlex.quote(str(wineprefix))} winedbg --command 'info proc' | "
-                        f"grep -A9 \"{exe_name}\" | grep -v 'grep' | grep '_' | "
-                        f"grep -v 'start.exe'    | grep -v 'winedbg.exe' | grep -v 'conhost.exe' | "
-                        f"grep -v 'explorer.exe' | grep -v 'services.exe' | grep -v 'rpcss.exe' | "
-                        f"grep -v 'svchost.exe'   | grep -v 'plugplay.exe' | grep -v 'winedevice.exe' | "
-                        f"cut -f2- -d '_' | tr \"'\" ' '"
-                    )
-                else:
-                    winedbg_command_with_grep = (
-                        f"WINEPREFIX={shlex.quote(str(wineprefix))} winedbg --command 'info proc' | "
-                        f"grep -A9 \"{exe_name}\" | grep -v 'grep' | grep '_' | "
-                        f"grep -v 'start.exe'    | grep -v 'winedbg.exe' | grep -v 'conhost.exe' | "
-                        f"grep -v 'explorer.exe' | grep -v 'services.exe' | grep -v 'rpcss.exe' | "
-                        f"grep -v 'svchost.exe'   | grep -v 'plugplay.exe' | grep -v 'winedevice.exe' | "
-                        f"cut -f2- -d '_' | tr \"'\" ' '"
-                    )
-                if self.debug:
-                    print("---------run_get_child_pid's winedbg_command_with_grep---------------")
-                    print(winedbg_command_with_grep)
-                    print("--------/run_get_child_pid's winedbg_command_with_grep---------------")
-
-                winedbg_output_filtered = subprocess.check_output(winedbg_command_with_grep, shell=True, text=True).strip().splitlines()
-                if self.debug:
-                    print("--------- run_get_child_pid's winedbg_output_filtered ---------------")
-                    print(winedbg_output_filtered)
-                    print("---------/run_get_child_pid's winedbg_output_filtered ---------------")
-
-                # Retrieve the parent directory name and search for processes
-                exe_parent = exe_file.parent.name
-                child_pids = set()
-
-                for filtered_exe in winedbg_output_filtered:
-                    filtered_exe = filtered_exe.strip()
-                    cleaned_exe_parent_name = re.escape(exe_parent)
-
-                    # Command to get PIDs for matching processes
-                    pgrep_command = (
-                        f"ps -ax --format pid,command | grep \"{filtered_exe}\" | "
-                        f"grep \"{cleaned_exe_parent_name}\" | grep -v 'grep' | "
-                        f"sed 's/^ *//g' | cut -f1 -d ' '"
-                    )
-                    if self.debug:
-                        print("--------- run_get_child_pid's pgrep_command ---------------")
-                        print(f"{pgrep_command}")
-                        print("---------/run_get_child_pid's pgrep_command ---------------")
-                    pgrep_output = subprocess.check_output(pgrep_command, shell=True, text=True).strip()
-                    child_pids.update(pgrep_output.splitlines())
-
-                    if self.debug:
-                        print("--------- run_get_child_pid's pgrep_output ---------------")
-                        print(f"{pgrep_output}")
-                        print("---------/run_get_child_pid's pgrep_output ---------------")
-
-                        print("--------- run_get_child_pid's child_pids pgrep_output.splitlines() ---------------")
-                        print(f"{pgrep_output.splitlines()}")
-                        print("---------/run_get_child_pid's child_pids pgrep_output.splitlines() ---------------")
-
-                if child_pids:
+            known_pids = set()
+            interval = 0.5
+            # process_ended replaces the entry when the program respawns; the run is the
+            # same as long as the unique ID is
+            while self.running_processes.get(script_key, {}).get('unique_id') == unique_id:
+                try:
+                    snapshot = self.process_supervisor.snapshot(max_age=interval)
+                    child_pids = set(snapshot.windows_children(unique_id, wineprefix, exe_parent))
+                except Exception as e:
+                    print(f"Error looking for child processes: {e}")
+                    return
+                if child_pids - known_pids:
+                    known_pids |= child_pids
                     print(f"Found child PIDs: {child_pids}\n")
                     GLib.idle_add(self.add_child_pids_to_running_processes, script_key, child_pids)
+                    interval = 0.5
                 else:
-                    print(f"No child process found for {exe_name}")
-
-            except subprocess.CalledProcessError as e:
-                print(f"Error executing command: {e}")
-            except Exception as e:
-                print(f"Unexpected error: {e}")
+                    interval = min(interval * 2, 1.0)
+                if not child_pids and not process_group_exists():
+                    break  # nothing of the launch is left to start new children
+                if wake.wait(interval):
+                    wake.clear()
+                    interval = 0.5
+            if not known_pids:
+                print(f"No child process found for {process_info.get('exe_name')}")
 
         # Start the background thread
         threading.Thread(target=run_get_child_pid, daemon=True).start()
@@ -2533,23 +5016,26 @@ class WineCharmApp(Gtk.Application):
         runner = process_info.get("runner") or "wine"
         runner_dir = Path(runner).expanduser().resolve().parent
         pids = process_info.get("pids", [])
+        process = process_info.get("process")
+        pgid = process_info.get("pgid")
 
         if unique_id:
-            # Terminate processes by unique_id
-            pids_to_terminate = []
-            for proc in psutil.process_iter(['pid', 'environ']):
-                try:
-                    env = proc.environ()
-                    if env.get('WINECHARM_UNIQUE_ID') == unique_id:
-                        pids_to_terminate.append(proc.pid)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
+            # Terminate processes by unique_id. Only Wine processes are checked for it,
+            # so the sh -c wrapper and other helpers are taken from the launch's process tree
+            snapshot = self.process_supervisor.snapshot(max_age=0)
+            pids_to_terminate = set(snapshot.pids_for_unique_id(unique_id))
+            if process:
+                pids_to_terminate.update(snapshot.descendants(process.pid))
 
             if not pids_to_terminate:
                 print(f"No processes found with unique ID {unique_id}")
-                return
 
-            pids = pids_to_terminate
+            pids = sorted(pids_to_terminate)
+
+        if pgid:
+            # The launch runs in its own session; its process group also holds the
+            # processes that have left the process tree
+            self.signal_process_group(pgid, signal.SIGTERM)
 
         if pids:
             for pid in pids:
@@ -2567,7 +5053,7 @@ class WineCharmApp(Gtk.Application):
                         print(f"Successfully sent SIGKILL to process with PID {pid}")
                     except Exception as e:
                         print(f"Error sending SIGKILL to process with PID {pid}: {e}")
-        else:
+        elif not pgid:
             print(f"No PIDs found to terminate for script_key: {script_key}")
             # Fallback to wineserver -k
             try:
@@ -2581,68 +5067,72 @@ class WineCharmApp(Gtk.Application):
             except Exception as e:
                 print(f"Error terminating processes in Wine prefix {wineprefix}: {e}")
 
+        if pgid:
+            self.signal_process_group(pgid, signal.SIGKILL)
+
+        self.stop_watching_processes(process_info)
         self.running_processes.pop(script_key, None)
-        GLib.idle_add(self.process_ended, script_key)
+        self.set_running_facet(script_key, False)
+        # Skipped if the script is launched again before this runs
+        GLib.idle_add(lambda: script_key not in self.running_processes and self.process_ended(script_key))
 
 
 
 
-    def monitor_external_process(self, script_key, pid):
+    def signal_process_group(self, pgid, sig):
         self.print_method_name()
         try:
-            proc = psutil.Process(pid)
-            proc.wait()  # Wait for the process to terminate
-        except psutil.NoSuchProcess:
-            pass
-        finally:
-            # Process has ended; update the UI in the main thread
-            GLib.idle_add(self.process_ended, script_key)
+            os.killpg(pgid, sig)
+            print(f"Successfully sent {signal.Signals(sig).name} to process group {pgid}")
+        except ProcessLookupError:
+            pass  # the group has already exited
+        except Exception as e:
+            print(f"Error sending {signal.Signals(sig).name} to process group {pgid}: {e}")
 
     def check_running_processes_on_startup(self):
         self.print_method_name()
         if not hasattr(self, 'script_ui_data') or not self.script_ui_data:
             return
-        for script_key, script_data in list(self.script_list.items()):
-            wineprefix = Path(script_data['script_path']).parent.expanduser().resolve()
-            target_exe_path = Path(script_data['exe_file']).expanduser().resolve()
-            target_exe_name = target_exe_path.name
-            runner = script_data.get('runner', 'wine')
-
-            is_running = False
-            running_pids = []  # List to store all PIDs associated with the script
-
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'environ']):
-                try:
-                    proc_name = proc.info['name']
-                    proc_cmdline = proc.cmdline() or []
-                    proc_environ = proc.environ()
-                    proc_wineprefix = proc_environ.get('WINEPREFIX', '')
+        self.apply_running_scripts(self.find_running_scripts())
 
-                    # Check if the process is using the same wineprefix
-                    if Path(proc_wineprefix).expanduser().resolve() != wineprefix:
-                        continue
-
-                    # Check if process name matches the target executable name
-                    if proc_name == target_exe_name or any(target_exe_name in arg for arg in proc_cmdline):
-                        is_running = True
-                        # Collect the PID of the process
-                        running_pids.append(proc.pid)
-                        # Also collect PIDs of child processes
-                        child_pids = [child.pid for child in proc.children(recursive=True)]
-                        running_pids.extend(child_pids)
-                        # Continue to find all processes matching the criteria
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess, KeyError):
-                    continue
+    def find_running_scripts(self):
+        self.print_method_name()
+        """
+        Scans the processes for running scripts without touching the UI, so it can run in
+        a worker thread.
 
+        Returns:
+            dict: script_key -> (wineprefix, runner, exe name, list of PIDs or None if not running)
+        """
+        # One scan of the process table serves every script
+        snapshot = self.process_supervisor.snapshot()
+        found = {}
+        for script_key, script_data in list(self.script_list.items()):
+            record = self.script_index.record(script_key)
+            if record is None:
+                continue
+            runner = script_data.get('runner', 'wine')
+            running_pids = snapshot.script_pids(record.wineprefix, record.exe_name)
             if running_pids:
-                # Remove duplicates
-                running_pids = list(set(running_pids))
                 print(f"Found running PIDs for script_key {script_key}: {running_pids}")
 
+            found[script_key] = (Path(record.wineprefix), runner, record.exe_name, running_pids or None)
+        return found
+
+    def apply_running_scripts(self, found):
+        self.print_method_name()
+        """
+        Updates running_processes and the rows from the result of find_running_scripts.
+        Scripts whose rows are not populated yet are only recorded; create_script_row
+        shows them as running.
+        """
+        for script_key, (wineprefix, runner, target_exe_name, running_pids) in found.items():
+            is_running = running_pids is not None
+            script_data = self.script_list.get(script_key)
             ui_state = self.script_ui_data.get(script_key)
-            if ui_state:
-                row = ui_state.get('row')
-                play_button = ui_state.get('play_button')
+            if script_data:
+                row = ui_state.get('row') if ui_state else None
+                play_button = ui_state.get('play_button') if ui_state else None
 
                 if is_running:
                     if script_key not in self.running_processes:
@@ -2656,13 +5146,18 @@ class WineCharmApp(Gtk.Application):
                             "exe_name": target_exe_name,
                             "pids": running_pids  # Store the list of PIDs
                         }
-                        self.update_ui_for_running_script_on_startup(script_key)
-                        # Start a thread to monitor the processes
-                        threading.Thread(target=self.monitor_multiple_processes, args=(script_key, running_pids), daemon=True).start()
+                        self.set_running_facet(script_key, True)
+                        if ui_state:
+                            self.update_ui_for_running_script_on_startup(script_key)
+                        # Watch the processes from the main loop
+                        self.monitor_pids(script_key, running_pids)
                 else:
                     # Remove script from running processes and reset UI
                     if script_key in self.running_processes:
-                        self.running_processes.pop(script_key, None)
+                        self.stop_watching_processes(self.running_processes.pop(script_key))
+                        self.set_running_facet(script_key, False)
+                    if not ui_state:
+                        continue
                     ui_state['is_running'] = False
                     # Do NOT reset 'is_clicked_row' here
                     if row:
@@ -2673,18 +5168,6 @@ class WineCharmApp(Gtk.Application):
                         self.set_play_stop_button_state(play_button, False)
                         play_button.set_tooltip_text("Play")
 
-    def monitor_multiple_processes(self, script_key, pids):
-        self.print_method_name()
-        try:
-            procs = [psutil.Process(pid) for pid in pids if psutil.pid_exists(pid)]
-            psutil.wait_procs(procs)
-        except Exception as e:
-            print(f"Error monitoring processes for script_key {script_key}: {e}")
-        finally:
-            # Processes have ended; update the UI in the main thread
-            GLib.idle_add(self.process_ended, script_key)
-
-       
     def update_ui_for_running_script_on_startup(self, script_key):
         self.print_method_name()
         ui_state = self.script_ui_data.get(script_key)
@@ -2722,6 +5205,8 @@ class WineCharmApp(Gtk.Application):
             self.process_ended(script_key)
 
         # Update `self.running_processes` to reflect currently running processes
+        for script_key in set(self.running_processes) | set(current_running_processes):
+            self.set_running_facet(script_key, script_key in current_running_processes)
         self.running_processes = current_running_processes
 
     def update_ui_for_running_process(self, current_running_processes):
@@ -2838,13 +5323,8 @@ class WineCharmApp(Gtk.Application):
         exe_name = exe_file.stem
         exe_no_space = exe_name.replace(" ", "_")
 
-        # Calculate SHA256 hash
-        sha256_hash = hashlib.sha256()
-        with open(exe_file, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        sha256sum = sha256_hash.hexdigest()[:10]
-        script_key = sha256_hash.hexdigest()
+        script_key, full_sha256, fingerprint = self.identify_exe(exe_file)
+        sha256sum = script_key[:10]
         # string to path
         self.template = Path(self.template).expanduser().resolve()
         print(f"         => create_yaml_file -> self.template = {self.template}")
@@ -2939,16 +5419,22 @@ class WineCharmApp(Gtk.Application):
             'wineprefix': self.replace_home_with_tilde_in_path(str(prefix_dir)),
             'progname': progname,
             'args': "",
-            'sha256sum': sha256_hash.hexdigest(),
+            'sha256sum': full_sha256,
             'runner': runner_to_use,  # Use the determined runner
             'wine_debug': "WINEDEBUG=fixme-all DXVK_LOG_LEVEL=none",
             'env_vars': ""
         }
 
+        if fingerprint:
+            yaml_data['fingerprint'] = fingerprint
+
         # Write the new YAML file
         with open(yaml_file_path, 'w') as yaml_file:
             yaml.dump(yaml_data, yaml_file, default_flow_style=False, width=1000)
 
+        if not full_sha256:
+            self.schedule_full_hash(yaml_file_path, exe_file)
+
         # Update yaml_data with resolved paths
         yaml_data['exe_file'] = str(exe_file.expanduser().resolve())
         yaml_data['script_path'] = str(yaml_file_path.expanduser().resolve())
@@ -2958,24 +5444,46 @@ class WineCharmApp(Gtk.Application):
         #self.create_desktop_entry(progname, yaml_file_path, icon_path, prefix_dir)
 
         # Add the new script data directly to self.script_list
-        self.new_scripts.add(yaml_file_path.stem)
+        self.mark_script_new(yaml_file_path.stem)
 
-        # Add or update script row in UI
-        self.script_list[script_key] = yaml_data
-        # Update the UI row for the renamed script
-        row = self.create_script_row(script_key, yaml_data)
-        if row:
-            self.flowbox.prepend(row)
-        # 
+        # Add or update script; the script change bus adds the row on the main thread,
+        # since this method runs in a worker thread
+        self.script_list.pop(script_key, None)
         self.script_list = {script_key: yaml_data, **self.script_list}
-        self.script_ui_data[script_key]['script_path'] = yaml_data['script_path']
-        #script_data['script_path'] = yaml_data['script_path']
         
         print(f"Created new charm file: {yaml_file_path} with script_key {script_key}")
         
-        GLib.idle_add(self.create_script_list)
+        GLib.idle_add(self.show_script_list)
+
 
 
+    def identify_exe(self, exe_file):
+        self.print_method_name()
+        """
+        Works out the script_list key of an exe being added.
+
+        Returns:
+            tuple: (script_key, full sha256 or None if not computed yet, fingerprint to
+            store in the .charm or None). In fingerprint mode the key is the sampled
+            fingerprint, unless the exe is already known by its full hash; then that
+            key is kept and no fingerprint is stored, so get_script_key finds it again.
+        """
+        if self.fingerprint_mode:
+            # Sampled fingerprint now, full SHA256 later in the background
+            fingerprint = self.hash_cache.fingerprint(exe_file)
+            full_sha256 = self.hash_cache.lookup(exe_file)
+            if full_sha256 and full_sha256 in self.script_list:
+                return full_sha256, full_sha256, None
+            return fingerprint, full_sha256, fingerprint
+
+        # Calculate SHA256 hash (cached; cancellable with the Cancel button or on shutdown)
+        full_sha256 = self.hash_cache.sha256(
+            exe_file,
+            progress=self.on_hash_progress,
+            is_cancelled=self.is_hash_cancelled
+        )
+        self.hash_cache.save()
+        return full_sha256, full_sha256, None
 
     def extract_icon(self, exe_file, wineprefix, exe_no_space, progname):
         self.print_method_name()
@@ -2998,6 +5506,8 @@ class WineCharmApp(Gtk.Application):
             if png_files:
                 best_png = png_files[0]
                 shutil.move(best_png, icon_path)
+                # Pre-scale the list/grid sizes now, off the UI thread
+                self.icon_cache.write_thumbnails(icon_path)
 
         finally:
             # Clean up only the temporary files created, not the directory itself
@@ -3090,6 +5600,19 @@ class WineCharmApp(Gtk.Application):
 
         self.find_and_remove_wine_created_shortcuts()
          
+    def create_scripts_for_lnk_files_in_worker(self, wineprefix, parent_runner=None):
+        self.print_method_name()
+        """
+        create_scripts_for_lnk_files for the shortcut worker, which runs one prefix at a
+        time so a shortcut is never turned into a script twice.
+        """
+        try:
+            self.create_scripts_for_lnk_files(wineprefix, parent_runner)
+        except HashCancelled as e:
+            print(e)
+        except Exception as e:
+            print(f"Error creating scripts for shortcuts in {wineprefix}: {e}")
+
     def extract_exe_files_from_lnk(self, lnk_files, wineprefix):
         self.print_method_name()
         exe_files = []
@@ -3250,7 +5773,7 @@ class WineCharmApp(Gtk.Application):
             backup_file = dialog.save_finish(result)
             if backup_file:
                 self.on_back_button_clicked(None)
-                self.flowbox.remove_all()
+                self.show_step_flowbox()
                 backup_path = backup_file.get_path()  # Get the backup file path
                 print(f"Backup will be saved to: {backup_path}")
                 
@@ -3417,9 +5940,15 @@ class WineCharmApp(Gtk.Application):
 
         print(f"Running backup command: {' '.join(tar_command)}")
 
+        # tar reads every file once, so the bytes it has read track the archive progress
+        self.progress.set_total(directory_size(wineprefix) or None)
+
         process = subprocess.Popen(tar_command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         
         while process.poll() is None:
+            bytes_read = process_bytes_read(process.pid)
+            if bytes_read is not None:
+                self.progress.done = bytes_read
             if self.stop_processing:
                 process.terminate()
                 try:
@@ -3940,7 +6469,7 @@ class WineCharmApp(Gtk.Application):
             backup_file = dialog.save_finish(result)
             if backup_file:
                 self.on_back_button_clicked(None)
-                self.flowbox.remove_all()
+                self.show_step_flowbox()
                 backup_path = backup_file.get_path()  # Get the backup file path
                 print(f"Backup will be saved to: {backup_path}")
 
@@ -3964,17 +6493,16 @@ class WineCharmApp(Gtk.Application):
         if not current_username:
             raise Exception("Unable to determine the current username from the environment.")
 
-        script_data = self.extract_yaml_info(script_key)
-        if not script_data:
+        record = self.script_index.record(script_key)
+        if record is None:
             raise Exception("Script data not found.")
 
-        exe_file = Path(script_data['exe_file']).expanduser().resolve()
-        exe_file = Path(str(exe_file).replace("%USERNAME%", current_username))
+        exe_file = Path(record.exe_file.replace("%USERNAME%", current_username))
         exe_path = exe_file.parent
         tar_game_dir_name = exe_path.name
         tar_game_dir_path = exe_path.parent
 
-        runner = self.expand_and_resolve_path(script_data['runner'])
+        runner = Path(record.runner) if record.runner else None
 
         # Build tar command with transforms
         tar_command = [
@@ -4011,9 +6539,15 @@ class WineCharmApp(Gtk.Application):
 
         print(f"Running create bottle command: {' '.join(tar_command)}")
 
+        # tar reads every file once, so the bytes it has read track the archive progress
+        self.progress.set_total(sum(directory_size(Path(path) / name) for _, path, name in sources) or None)
+
         process = subprocess.Popen(tar_command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         
         while process.poll() is None:
+            bytes_read = process_bytes_read(process.pid)
+            if bytes_read is not None:
+                self.progress.done = bytes_read
             if self.stop_processing:
                 process.terminate()
                 try:
@@ -4219,7 +6753,7 @@ class WineCharmApp(Gtk.Application):
         exe_file = Path(script_data['exe_file']).expanduser().resolve()
         progname = script_data['progname']
         script_args = script_data['args']
-        script_key = script_data['sha256sum']  # Use sha256sum as the key
+        script_key = self.get_script_key(script_data)  # Use sha256sum (or fingerprint) as the key
         env_vars = script_data.get('env_vars', '')   # Ensure env_vars is initialized if missing
         
         # Split the env_vars string into individual variable assignments
@@ -4303,7 +6837,7 @@ class WineCharmApp(Gtk.Application):
         self.print_method_name()
         wineprefix = Path(script).parent
         self.run_winetricks_script("vkd3d dxvk", wineprefix)
-        self.create_script_list()
+        self.show_script_list()
 
     def open_filemanager(self, script, script_key, *args):
         self.count = 0
@@ -4340,24 +6874,13 @@ class WineCharmApp(Gtk.Application):
 
 ########################################  delete wineprefix
     def load_icon(self, script, x, y):
-        icon_name = script.stem + ".png"
-        icon_dir = script.parent
-        icon_path = icon_dir / icon_name
-        default_icon_path = self.get_default_icon_path()
-
-        try:
-            # Load the icon at a higher resolution
-            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_size(str(icon_path), 128, 128)
-            # Scale down to the desired size
-            scaled_pixbuf = pixbuf.scale_simple(x, y, GdkPixbuf.InterpType.BILINEAR)
-            return Gdk.Texture.new_for_pixbuf(scaled_pixbuf)
-        except Exception:
-            try:
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_size(str(default_icon_path), 128, 128)
-                scaled_pixbuf = pixbuf.scale_simple(x, y, GdkPixbuf.InterpType.BILINEAR)
-                return Gdk.Texture.new_for_pixbuf(scaled_pixbuf)
-            except Exception:
-                return None
+        #self.print_method_name()
+        """
+        Returns the texture of a script's icon at x pixels (falling back to the default
+        icon) from self.icon_cache.
+        """
+        icon_path = script.parent / (script.stem + ".png")
+        return self.icon_cache.load(icon_path, x) or self.icon_cache.load(self.get_default_icon_path(), x)
 
     def create_icon_title_widget(self, script):
         self.print_method_name()
@@ -4496,12 +7019,7 @@ class WineCharmApp(Gtk.Application):
         Returns:
             A list of script_keys corresponding to the given wineprefix.
         """
-        script_keys = []
-        for script_key, script_data in list(self.script_list.items()):
-            script_path = Path(script_data['script_path']).expanduser().resolve()
-            if script_path.parent == wineprefix:
-                script_keys.append(script_key)
-        return script_keys
+        return self.script_index.keys_for_prefix(wineprefix)
 
 
     def show_delete_shortcut_confirmation(self, script, script_key, button, *args):
@@ -4613,8 +7131,8 @@ class WineCharmApp(Gtk.Application):
                                 print(f"Removed script {script_key} from ui_data")
 
                             # Optionally update the UI (e.g., refresh the script list or view)
-                            self.load_script_list()
-                            self.create_script_list()  # Update the UI to reflect changes
+                            self.request_catalog_refresh()
+                            self.show_script_list()  # Update the UI to reflect changes
                         else:
                             print(f"Shortcut file does not exist: {charm_file}")
                     except Exception as e:
@@ -4638,9 +7156,10 @@ class WineCharmApp(Gtk.Application):
         Returns:
             The corresponding script_key from script_list, if found.
         """
-        for script_key, script_data in list(self.script_list.items()):
-            script_path = Path(script_data['script_path']).expanduser().resolve()
-            if script_path == shortcut_file:
+        shortcut_file = resolve_script_path(shortcut_file)
+        for script_key in self.script_index.keys_for_prefix(os.path.dirname(shortcut_file)):
+            record = self.script_index.record(script_key)
+            if record and record.script_path == shortcut_file:
                 return script_key
         return None
 
@@ -4841,7 +7360,7 @@ class WineCharmApp(Gtk.Application):
                     yaml.dump(script_data, file, default_flow_style=False, width=1000)
                     
                 # Ensure that script_data still contains the same sha256sum
-                existing_sha256sum = script_data.get('sha256sum')
+                existing_sha256sum = self.get_script_key(script_data)
 
                 # Extract icon and create desktop entry
                 exe_file = Path(script_data['exe_file'])  # Assuming exe_file exists in script_data
@@ -4862,14 +7381,9 @@ class WineCharmApp(Gtk.Application):
 
 
 
-                    # Update the script_list with the updated script_data
+                    # Update the script_list with the updated script_data; the row follows via the change bus
                     self.script_list[script_key] = script_data
 
-                    # Update the UI row for the renamed script
-                    row = self.create_script_row(script_key, script_data)
-                    if row:
-                        self.flowbox.prepend(row)
-
                     print(f"Removed old script_key {script_key} from script_list")
 
                 if script_key in self.script_ui_data:
@@ -4883,10 +7397,8 @@ class WineCharmApp(Gtk.Application):
                 # Add the updated script data to self.script_list using the existing sha256sum
                 self.script_list[existing_sha256sum] = script_data
                 
-                row = self.create_script_row(existing_sha256sum, script_data)
-                
                 # Mark the script as new and update the UI
-                self.new_scripts.add(new_script_path.stem)
+                self.mark_script_new(new_script_path.stem, existing_sha256sum)
 
                 # Add or update script row in UI
                 self.script_list = {existing_sha256sum: script_data, **self.script_list}
@@ -4976,9 +7488,9 @@ class WineCharmApp(Gtk.Application):
         filter_model.append(file_filter)
         file_dialog.set_filters(filter_model)
 
-        file_dialog.open(self.window, None, lambda dlg, res: self.on_change_icon_response(dlg, res, script_path))
+        file_dialog.open(self.window, None, lambda dlg, res: self.on_change_icon_response(dlg, res, script_path, script_key))
 
-    def on_change_icon_response(self, dialog, result, script_path):
+    def on_change_icon_response(self, dialog, result, script_path, script_key=None):
         self.print_method_name()
         try:
             file = dialog.open_finish(result)
@@ -4991,7 +7503,7 @@ class WineCharmApp(Gtk.Application):
                     self.extract_and_change_icon(script_path, file_path)
                 # Update the icon in the title bar
                 self.headerbar.set_title_widget(self.create_icon_title_widget(script_path))
-                self.new_scripts.add(script_path.stem)
+                self.mark_script_new(script_path.stem, script_key)
         except GLib.Error as e:
             if e.domain != 'gtk-dialog-error-quark' or e.code != 2:
                 print(f"An error occurred: {e}")
@@ -5184,7 +7696,7 @@ class WineCharmApp(Gtk.Application):
         finally:
             print("hide_processing_spinner")
             GLib.idle_add(self.hide_processing_spinner)
-            GLib.timeout_add_seconds(0.5, self.create_script_list)
+            GLib.timeout_add_seconds(0.5, self.show_script_list)
 
     def on_confirm_action(self, button, script, action_type, parent, original_button):
         self.print_method_name()
@@ -5374,7 +7886,7 @@ class WineCharmApp(Gtk.Application):
             else:
                 GLib.timeout_add_seconds(1, self.hide_processing_spinner)
                 
-            GLib.timeout_add_seconds(0.5, self.create_script_list)
+            GLib.timeout_add_seconds(0.5, self.show_script_list)
 
     def initialize_app(self):
         
@@ -5390,7 +7902,7 @@ class WineCharmApp(Gtk.Application):
         self.print_method_name()
 
         # Clear existing content
-        self.flowbox.remove_all()
+        self.show_step_flowbox()
 
         if hasattr(self, 'progress_bar'):
             self.vbox.remove(self.progress_bar)
@@ -5402,13 +7914,18 @@ class WineCharmApp(Gtk.Application):
         # Add progress bar
         self.progress_bar = Gtk.ProgressBar()
         self.progress_bar.add_css_class("header-progress")
-        self.progress_bar.set_show_text(False)
+        self.progress_bar.set_show_text(True)
         self.progress_bar.set_margin_top(0)
         self.progress_bar.set_margin_bottom(0)
         self.progress_bar.set_fraction(0.0)
         #self.progress_bar.set_size_request(420, -1)
         self.vbox.prepend(self.progress_bar)
-        self.flowbox.remove_all()
+        self.show_step_flowbox()
+
+        # Workers only update self.progress; the bar is refreshed from it at a fixed rate
+        self.progress.reset()
+        if self.progress_source_id is None:
+            self.progress_source_id = GLib.timeout_add(100, self.sample_progress)
         
         # Update button label
         self.set_open_button_label(label_text)
@@ -5421,10 +7938,38 @@ class WineCharmApp(Gtk.Application):
         self.view_toggle_button.set_sensitive(False)
         self.menu_button.set_sensitive(False)
 
+    def sample_progress(self):
+        #self.print_method_name()
+        """
+        Shows the state of self.progress in the progress bar; runs every 100 ms while
+        an operation is in progress.
+        """
+        if not hasattr(self, 'progress_bar'):
+            self.progress_source_id = None
+            return False
+        progress = self.progress
+        text = f"Step {min(progress.steps_done + 1, progress.total_steps)}/{progress.total_steps}"
+        if progress.is_indeterminate():
+            self.progress_bar.pulse()
+        else:
+            fraction = progress.fraction()
+            self.progress_bar.set_fraction(fraction)
+            text += f" · {fraction * 100:.0f}%"
+            eta = progress.eta()
+            if eta is not None:
+                minutes, seconds = divmod(int(eta), 60)
+                text += f" · about {minutes}:{seconds:02d} left"
+        self.progress_bar.set_text(text)
+        return True
+
     def hide_processing_spinner(self):
         self.print_method_name()
         """Restore UI state after process completion with safe widget removal"""
         try:
+            if self.progress_source_id is not None:
+                GLib.source_remove(self.progress_source_id)
+                self.progress_source_id = None
+
             if hasattr(self, 'progress_bar'):
                 self.vbox.remove(self.progress_bar)
                 del self.progress_bar
@@ -5483,11 +8028,8 @@ class WineCharmApp(Gtk.Application):
         icon_name = "view-grid-symbolic" if self.icon_view else "view-list-symbolic"
         button.set_child(Gtk.Image.new_from_icon_name(icon_name))
 
-        # Update the maximum children per line in the flowbox based on the current view state
-        max_children_per_line = 8 if self.icon_view else 4
-        self.flowbox.set_max_children_per_line(max_children_per_line)
-        # Recreate the script list with the new view
-        self.create_script_list()
+        # Swap the item factory; the script view rebinds visible items in the new layout
+        self.update_script_view_layout()
         GLib.idle_add(self.save_settings)
 
 ############# IMPORT Wine Directory
@@ -5621,7 +8163,7 @@ class WineCharmApp(Gtk.Application):
         backup_dir = dst.parent / f"{dst.name}_backup_{int(time.time())}"
         
         # Clear the flowbox and initialize progress UI
-        GLib.idle_add(self.flowbox.remove_all)
+        GLib.idle_add(self.show_step_flowbox)
         
         steps = [
             ("Backing up existing directory", lambda: self.backup_existing_directory(dst, backup_dir)),
@@ -5648,7 +8190,6 @@ class WineCharmApp(Gtk.Application):
                     try:
                         step_func()
                         GLib.idle_add(self.mark_step_as_done, step_text)
-                        GLib.idle_add(lambda: self.progress_bar.set_fraction(index / self.total_steps))
                     except Exception as step_error:
                         if "Operation cancelled by user" in str(step_error):
                             GLib.idle_add(lambda: self.handle_import_cancellation(dst, backup_dir))
@@ -5695,9 +8236,8 @@ class WineCharmApp(Gtk.Application):
         #    self.open_button.disconnect(self.open_button_handler_id)
 
         self.reconnect_open_button()
-        self.load_script_list()
-        # Restore the script list in the flowbox
-        GLib.idle_add(self.create_script_list)
+        # New .charm files were applied by the monitors; just show the list again
+        GLib.idle_add(self.show_script_list)
 
         print("Wine directory import completed and script list restored.")
 
@@ -5717,7 +8257,7 @@ class WineCharmApp(Gtk.Application):
             self.create_scripts_for_exe_files(dst)
             print(f"Scripts created for .exe files in {dst}")
 
-            GLib.idle_add(self.create_script_list)
+            GLib.idle_add(self.show_script_list)
         finally:
             GLib.idle_add(self.enable_open_button)
             GLib.idle_add(self.hide_processing_spinner)
@@ -5755,7 +8295,7 @@ class WineCharmApp(Gtk.Application):
             print(f"User chose to overwrite the directory: {dest_dir}")
             
             # Clear the flowbox now because the user chose to overwrite
-            GLib.idle_add(self.flowbox.remove_all)
+            GLib.idle_add(self.show_step_flowbox)
             
             # Delete the existing directory and start the import process
             try:
@@ -5771,7 +8311,7 @@ class WineCharmApp(Gtk.Application):
             # If canceled, restore the UI to its original state
             self.reconnect_open_button()
             self.hide_processing_spinner()
-            GLib.idle_add(self.create_script_list)
+            GLib.idle_add(self.show_script_list)
             # No need to restore the script list as it wasn't cleared
 
     def on_cancel_import_wine_direcotory_dialog_response(self, dialog, response):
@@ -5918,7 +8458,7 @@ class WineCharmApp(Gtk.Application):
             #self.reconnect_open_button()
             #self.load_script_list()
             ## Restore the script list in the flowbox
-            GLib.idle_add(self.create_script_list)
+            GLib.idle_add(self.show_script_list)
 
     def disconnect_open_button(self):
         self.print_method_name()
@@ -6088,6 +8628,9 @@ class WineCharmApp(Gtk.Application):
             with self.process_lock:
                 self.current_process = copy_process
 
+            # cp does not report progress; the progress bar pulses while it runs
+            self.progress.set_total(None)
+
             # Monitor process and handle cancellation
             while copy_process.poll() is None:
                 if self.stop_processing:
@@ -6099,10 +8642,6 @@ class WineCharmApp(Gtk.Application):
                     print("Operation cancelled by user")
                     return
 
-                # Pulse progress bar if available
-                if hasattr(self, 'progress_bar'):
-                    GLib.idle_add(lambda: self.progress_bar.pulse())
-
                 time.sleep(0.1)  # Reduce CPU usage
 
             # Handle completion
@@ -6110,10 +8649,6 @@ class WineCharmApp(Gtk.Application):
                 error_msg = copy_process.stderr.read().decode() if copy_process.stderr else "Unknown error"
                 raise RuntimeError(f"Copy failed with code {copy_process.returncode}: {error_msg}")
 
-            # Final progress update
-            if hasattr(self, 'progress_bar'):
-                GLib.idle_add(lambda: self.progress_bar.set_fraction(1.0))
-
         except Exception as e:
             print(f"Copy error: {str(e)}")
             if dst_path.exists():
@@ -6122,6 +8657,7 @@ class WineCharmApp(Gtk.Application):
         finally:
             with self.process_lock:
                 self.current_process = None
+            self.progress.set_total(0)
 
     def disable_open_button(self):
         self.print_method_name()
@@ -6154,6 +8690,9 @@ class WineCharmApp(Gtk.Application):
         Loads all .charm files from the specified directory (or the default self.prefixes_dir)
         into the self.script_list dictionary.
 
+        Files whose path, mtime and size match an entry in the charm catalog index are taken
+        from the index instead of being parsed again; only new or changed files are read.
+
         Args:
             prefixdir (str or Path, optional): The directory to search for .charm files.
                                                Defaults to self.prefixes_dir.
@@ -6161,89 +8700,526 @@ class WineCharmApp(Gtk.Application):
         if prefixdir is None:
             prefixdir = self.prefixes_dir
 
-        # Clear existing script list when loading from default directory
+        # Build the new list aside and assign it once, so only real differences are emitted.
+        # Start empty when loading from the default directory
         if prefixdir == self.prefixes_dir:
-            self.script_list = {}
+            script_list = {}
+            self.script_keys_by_path = {}
+        else:
+            script_list = dict(self.script_list)
+
+        catalog = self.load_charm_catalog()
+        catalog_changed = False
+        seen_paths = set()
+        parsed_count = 0
 
         # Find all .charm files in the directory
         scripts = self.find_charm_files(prefixdir)
 
         for script_file in scripts:
+            catalog_key = str(script_file)
+            seen_paths.add(catalog_key)
             try:
-                with open(script_file, 'r') as f:
-                    script_data = yaml.safe_load(f)
-
-                if not isinstance(script_data, dict):
-                    print(f"Warning: Invalid format in {script_file}, skipping.")
+                script_data, parsed = self.load_charm_entry(script_file, catalog)
+                if parsed:
+                    parsed_count += 1
+                    catalog_changed = True
+                if script_data is None:
                     continue
 
-                # Ensure required keys are present and correctly populated
-                updated = False
-                required_keys = ['exe_file', 'script_path', 'wineprefix', 'sha256sum']
+                # Use 'sha256sum' (or the fingerprint) as the key in script_list
+                script_key = self.get_script_key(script_data)
+                self.script_keys_by_path[catalog_key] = script_key
+                if prefixdir == self.prefixes_dir:
+                    script_list[script_key] = script_data
+                else:
+                    script_list = {script_key: script_data, **script_list}
 
-                # Initialize script_path to the current .charm file path if missing
-                if 'script_path' not in script_data:
-                    script_data['script_path'] = self.replace_home_with_tilde_in_path(str(script_file))
-                    updated = True
-                    print(f"Warning: script_path missing in {script_file}. Added default value.")
+            except Exception as e:
+                print(f"Error loading script {script_file}: {e}")
+
+        # Drop index entries for .charm files that no longer exist under prefixdir
+        scanned_root = str(Path(prefixdir).expanduser().resolve())
+        for catalog_key in list(catalog):
+            if catalog_key in seen_paths:
+                continue
+            if prefixdir == self.prefixes_dir or catalog_key.startswith(scanned_root + os.sep):
+                del catalog[catalog_key]
+                catalog_changed = True
+
+        self.script_list = script_list
+
+        if catalog_changed:
+            self.save_charm_catalog(catalog)
+
+        print(f"Loaded {len(self.script_list)} scripts ({parsed_count} parsed, {len(scripts) - parsed_count} from catalog).")
+
+    def load_charm_entry(self, script_file, catalog):
+        #self.print_method_name()
+        """
+        Returns the script data for one .charm file, from the catalog index when its
+        mtime and size are unchanged, otherwise by parsing it (and updating the index).
+
+        Returns:
+            tuple: (script_data or None, True if the file was parsed and the index changed)
+        """
+        catalog_key = str(script_file)
+        stat = os.stat(script_file)
+        entry = catalog.get(catalog_key)
+        if (isinstance(entry, dict) and isinstance(entry.get('data'), dict)
+                and entry.get('mtime_ns') == stat.st_mtime_ns
+                and entry.get('size') == stat.st_size):
+            return dict(entry['data']), False
+
+        script_data = self.parse_charm_file(script_file)
+        if script_data is None:
+            catalog.pop(catalog_key, None)
+            return None, True
+
+        # parse_charm_file may have rewritten the file, so stat it again
+        stat = os.stat(script_file)
+        script_data['mtime'] = stat.st_mtime
+        catalog[catalog_key] = {
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'data': dict(script_data)
+        }
+        return script_data, True
 
-                # Set wineprefix to the parent directory of script_path if missing
-                if 'wineprefix' not in script_data or not script_data['wineprefix']:
-                    wineprefix = str(Path(script_file).parent)
-                    script_data['wineprefix'] = self.replace_home_with_tilde_in_path(wineprefix)
+    def parse_charm_file(self, script_file):
+        #self.print_method_name()
+        """
+        Parses a single .charm file, fixing up missing or home-relative fields and
+        regenerating sha256sum when absent. The file is rewritten if anything changed.
+
+        Returns:
+            dict: The script data, or None if the file could not be used.
+        """
+        try:
+            with open(script_file, 'r') as f:
+                script_data = yaml.safe_load(f)
+        except yaml.YAMLError as yaml_err:
+            print(f"YAML error in {script_file}: {yaml_err}")
+            return None
+
+        if not isinstance(script_data, dict):
+            print(f"Warning: Invalid format in {script_file}, skipping.")
+            return None
+
+        # Ensure required keys are present and correctly populated
+        updated = False
+        required_keys = ['exe_file', 'script_path', 'wineprefix', 'sha256sum']
+
+        # Initialize script_path to the current .charm file path if missing
+        if 'script_path' not in script_data:
+            script_data['script_path'] = self.replace_home_with_tilde_in_path(str(script_file))
+            updated = True
+            print(f"Warning: script_path missing in {script_file}. Added default value.")
+
+        # Set wineprefix to the parent directory of script_path if missing
+        if 'wineprefix' not in script_data or not script_data['wineprefix']:
+            wineprefix = str(Path(script_file).parent)
+            script_data['wineprefix'] = self.replace_home_with_tilde_in_path(wineprefix)
+            updated = True
+            print(f"Warning: wineprefix missing in {script_file}. Set to {wineprefix}.")
+
+        # Replace any $HOME occurrences with ~ in all string paths
+        for key in required_keys:
+            if isinstance(script_data.get(key), str) and script_data[key].startswith(os.getenv("HOME")):
+                new_value = self.replace_home_with_tilde_in_path(script_data[key])
+                if new_value != script_data[key]:
+                    script_data[key] = new_value
                     updated = True
-                    print(f"Warning: wineprefix missing in {script_file}. Set to {wineprefix}.")
-
-                # Replace any $HOME occurrences with ~ in all string paths
-                for key in required_keys:
-                    if isinstance(script_data.get(key), str) and script_data[key].startswith(os.getenv("HOME")):
-                        new_value = self.replace_home_with_tilde_in_path(script_data[key])
-                        if new_value != script_data[key]:
-                            script_data[key] = new_value
-                            updated = True
 
-                # Regenerate sha256sum if missing
-                should_generate_hash = False
-                if 'sha256sum' not in script_data or script_data['sha256sum'] == None:
-                    should_generate_hash = True
-
-                if should_generate_hash:
-                    if 'exe_file' in script_data and script_data['exe_file']:
-                        # Generate hash from exe_file if it exists
-                        exe_path = Path(script_data['exe_file']).expanduser().resolve()
-                        if os.path.exists(exe_path):
-                            sha256_hash = hashlib.sha256()
-                            with open(exe_path, "rb") as f:
-                                for byte_block in iter(lambda: f.read(4096), b""):
-                                    sha256_hash.update(byte_block)
-                            script_data['sha256sum'] = sha256_hash.hexdigest()
+        # Regenerate sha256sum if missing
+        should_generate_hash = False
+        if 'sha256sum' not in script_data or script_data['sha256sum'] == None:
+            should_generate_hash = True
+
+        if should_generate_hash:
+            if 'exe_file' in script_data and script_data['exe_file']:
+                # Generate hash from exe_file if it exists
+                exe_path = Path(script_data['exe_file']).expanduser().resolve()
+                if os.path.exists(exe_path):
+                    cached_hash = self.hash_cache.lookup(exe_path)
+                    if cached_hash:
+                        script_data['sha256sum'] = cached_hash
+                        updated = True
+                        print(f"Generated sha256sum from exe_file in {script_file}")
+                    elif script_data.get('fingerprint') or self.fingerprint_mode:
+                        # The fingerprint identifies the script; the full hash is filled in later
+                        if not script_data.get('fingerprint'):
+                            script_data['fingerprint'] = self.hash_cache.fingerprint(exe_path)
                             updated = True
-                            print(f"Generated sha256sum from exe_file in {script_file}")
-                        else:
-                            print(f"Warning: exe_file not found, not updating sha256sum from script file: {script_file}")
+                        self.schedule_full_hash(script_file, exe_path)
+                    else:
+                        # Never hash on the UI thread: the script shows up once the worker is done
+                        if script_file not in self.pending_charm_hashes:
+                            print(f"Hashing exe_file of {script_file} in the background")
+                            self.pending_charm_hashes.add(script_file)
+                            self.hash_cache.submit(
+                                exe_path,
+                                lambda path, digest, error: GLib.idle_add(self.on_charm_hash_ready, script_file, digest, error),
+                                is_cancelled=self.hash_cancel_event.is_set
+                            )
+                        return None
+                else:
+                    print(f"Warning: exe_file not found, not updating sha256sum from script file: {script_file}")
 
-                # If updates are needed, rewrite the file
-                if updated:
-                    with open(script_file, 'w') as f:
-                        yaml.safe_dump(script_data, f)
-                    print(f"Updated script file: {script_file}")
+        # If updates are needed, rewrite the file
+        if updated:
+            with open(script_file, 'w') as f:
+                yaml.safe_dump(script_data, f)
+            print(f"Updated script file: {script_file}")
 
-                # Store the actual file modification time
-                script_data['mtime'] = os.path.getmtime(script_file)
+        return script_data
 
-                # Use 'sha256sum' as the key in script_list
-                script_key = script_data['sha256sum']
-                if prefixdir == self.prefixes_dir:
-                    self.script_list[script_key] = script_data
+    def is_hash_cancelled(self):
+        #self.print_method_name()
+        """
+        Cancellation check for hashes done as part of an operation (importing an exe or
+        a .sh): true once the operation is cancelled or the app shuts down. Background
+        hashes of the catalog are not tied to an operation and stop only on shutdown.
+        """
+        return self.stop_processing or self.hash_cancel_event.is_set()
+
+    def get_script_key(self, script_data, default=None):
+        #self.print_method_name()
+        """
+        Returns the script_list key for a script: its sampled fingerprint in fingerprint
+        mode (if the .charm has one), otherwise the full sha256sum. A .charm whose full
+        hash has not been computed yet falls back to its fingerprint. A full sha256sum
+        that already is a script_list key always wins, so one exe never has two keys.
+        """
+        sha256sum = script_data.get('sha256sum')
+        if sha256sum and sha256sum in self.script_list:
+            return sha256sum
+        if self.fingerprint_mode and script_data.get('fingerprint'):
+            return script_data['fingerprint']
+        return script_data.get('sha256sum') or script_data.get('fingerprint') or default
+
+    def schedule_full_hash(self, script_file, exe_path):
+        self.print_method_name()
+        """
+        Computes the full SHA256 of exe_path in the hash worker pool and writes it into
+        script_file when done. Used for scripts created or loaded with only a fingerprint.
+        """
+        script_file = str(script_file)
+        if script_file in self.pending_charm_hashes:
+            return
+        self.pending_charm_hashes.add(script_file)
+        self.hash_cache.submit(
+            exe_path,
+            lambda path, digest, error: GLib.idle_add(self.on_full_hash_ready, script_file, digest, error),
+            is_cancelled=self.hash_cancel_event.is_set
+        )
+
+    def on_full_hash_ready(self, script_file, digest, error):
+        self.print_method_name()
+        """
+        Writes a lazily computed full SHA256 into the .charm file and the loaded script
+        data. The script keeps its current key for the rest of the session.
+        """
+        self.pending_charm_hashes.discard(script_file)
+        self.hash_cache.save()
+        if error or not digest:
+            print(f"Error computing full sha256sum for {script_file}: {error}")
+            return False
+
+        try:
+            with open(script_file, 'r') as f:
+                charm_data = yaml.safe_load(f)
+            if isinstance(charm_data, dict) and not charm_data.get('sha256sum'):
+                charm_data['sha256sum'] = digest
+                with open(script_file, 'w') as f:
+                    yaml.dump(charm_data, f, default_flow_style=False, width=1000)
+                print(f"Wrote full sha256sum to {script_file}")
+        except Exception as e:
+            print(f"Error writing sha256sum to {script_file}: {e}")
+            return False
+
+        resolved_script_file = Path(script_file).resolve()
+        for script_data in self.script_list.values():
+            if Path(script_data['script_path']).expanduser().resolve() == resolved_script_file:
+                script_data['sha256sum'] = digest
+                break
+        return False
+
+    def on_charm_hash_ready(self, script_file, digest, error):
+        self.print_method_name()
+        """
+        Called on the main thread when a background hash for a .charm file without
+        sha256sum finishes; the .charm is parsed again, now hitting the hash cache.
+        """
+        self.pending_charm_hashes.discard(script_file)
+        self.hash_cache.save()
+        if error or not digest:
+            print(f"Error hashing exe_file of {script_file}: {error}")
+            return False
+        # The new script reaches the view through the script change bus
+        self.load_script_list(Path(script_file).parent)
+        return False
+
+    def on_hash_progress(self, bytes_done, bytes_total):
+        #self.print_method_name()
+        """
+        Progress callback for hashing in worker threads. Like the other operations it
+        only updates self.progress, which sample_progress shows in the progress bar.
+        """
+        if self.progress.total != bytes_total:
+            self.progress.set_total(bytes_total)
+        self.progress.advance(bytes_done - self.progress.done)
+
+    def load_charm_catalog(self):
+        #self.print_method_name()
+        """
+        Returns the on-disk charm catalog index as {charm path: {mtime_ns, size, data}}.
+        A missing, unreadable or outdated index yields an empty dict, which makes
+        load_script_list fall back to a full rescan. The index is read from disk once
+        and then kept in memory.
+        """
+        if self.charm_catalog is not None:
+            return self.charm_catalog
+
+        self.charm_catalog = {}
+        try:
+            with open(self.charm_catalog_file, 'r') as f:
+                catalog = json.load(f)
+        except FileNotFoundError:
+            return self.charm_catalog
+        except Exception as e:
+            print(f"Charm catalog unreadable, rescanning all .charm files: {e}")
+            return self.charm_catalog
+
+        if (not isinstance(catalog, dict)
+                or catalog.get('version') != self.charm_catalog_version
+                or not isinstance(catalog.get('entries'), dict)):
+            print("Charm catalog outdated or corrupt, rescanning all .charm files.")
+            return self.charm_catalog
+
+        self.charm_catalog = catalog['entries']
+        return self.charm_catalog
+
+    def save_charm_catalog(self, entries):
+        #self.print_method_name()
+        """
+        Atomically writes the charm catalog index next to Settings.yaml.
+        """
+        temp_file = self.charm_catalog_file.with_name(self.charm_catalog_file.name + ".tmp")
+        try:
+            with open(temp_file, 'w') as f:
+                json.dump({'version': self.charm_catalog_version, 'entries': entries}, f, default=str)
+            os.replace(temp_file, self.charm_catalog_file)
+        except Exception as e:
+            print(f"Error saving charm catalog: {e}")
+            try:
+                temp_file.unlink()
+            except OSError:
+                pass
+
+########## .charm file monitoring
+    def start_charm_monitoring(self):
+        self.print_method_name()
+        """
+        Watches prefixes_dir and every prefix directory in it, so .charm files that are
+        added, removed or edited (by WineCharm, wine or an editor) are applied to
+        script_list and the script view one by one instead of by a full rescan.
+        """
+        # Events report paths below the resolved directory, like find_charm_files
+        self.charm_monitor_root = str(Path(self.prefixes_dir).expanduser().resolve())
+        self.watch_charm_directory(self.charm_monitor_root)
+        try:
+            for entry in os.scandir(self.charm_monitor_root):
+                if entry.is_dir(follow_symlinks=False):
+                    self.watch_charm_directory(entry.path)
+        except OSError as e:
+            print(f"Error scanning {self.prefixes_dir} for monitoring: {e}")
+
+    def watch_charm_directory(self, directory):
+        #self.print_method_name()
+        directory = str(directory)
+        if directory in self.charm_monitors:
+            return
+        try:
+            monitor = Gio.File.new_for_path(directory).monitor_directory(Gio.FileMonitorFlags.WATCH_MOVES, None)
+        except GLib.Error as e:
+            print(f"Error monitoring {directory}: {e}")
+            return
+        monitor.connect("changed", self.on_charm_monitor_changed)
+        self.charm_monitors[directory] = monitor
+
+    def unwatch_charm_directory(self, directory):
+        #self.print_method_name()
+        monitor = self.charm_monitors.pop(str(directory), None)
+        if monitor:
+            monitor.cancel()
+
+    def on_charm_monitor_changed(self, monitor, file, other_file, event_type):
+        #self.print_method_name()
+        """
+        Collects the .charm paths affected by a file monitor event. The changes are
+        applied together by apply_charm_changes shortly afterwards.
+        """
+        prefixes_dir = self.charm_monitor_root
+        gone_paths = []
+        new_paths = []
+        if event_type in (Gio.FileMonitorEvent.DELETED, Gio.FileMonitorEvent.MOVED_OUT):
+            gone_paths.append(file.get_path())
+        elif event_type == Gio.FileMonitorEvent.RENAMED:
+            gone_paths.append(file.get_path())
+            if other_file is not None:
+                new_paths.append(other_file.get_path())
+        elif event_type in (Gio.FileMonitorEvent.CREATED, Gio.FileMonitorEvent.MOVED_IN,
+                            Gio.FileMonitorEvent.CHANGES_DONE_HINT):
+            new_paths.append(file.get_path())
+        else:
+            return
+
+        for path in gone_paths:
+            if os.path.dirname(path) == prefixes_dir and path in self.charm_monitors:
+                # A whole prefix went away (deleted or renamed)
+                self.unwatch_charm_directory(path)
+                self.pending_charm_changes.update(
+                    charm_path for charm_path in self.script_keys_by_path
+                    if charm_path.startswith(path + os.sep)
+                )
+            elif path.endswith(".charm"):
+                self.pending_charm_changes.add(path)
+
+        for path in new_paths:
+            if os.path.dirname(path) == prefixes_dir and os.path.isdir(path):
+                # A new prefix appeared; watch it and pick up the .charm files already in it
+                self.watch_charm_directory(path)
+                self.pending_charm_changes.update(str(charm_file) for charm_file in Path(path).glob("*.charm"))
+            elif path.endswith(".charm"):
+                self.pending_charm_changes.add(path)
+
+        if self.pending_charm_changes and self.charm_changes_source_id is None:
+            self.charm_changes_source_id = GLib.timeout_add(200, self.apply_charm_changes)
+
+    def apply_charm_changes(self):
+        self.print_method_name()
+        """
+        Applies the collected .charm additions, removals and edits to script_list,
+        the catalog index and the script view.
+        """
+        self.charm_changes_source_id = None
+        paths = self.pending_charm_changes
+        self.pending_charm_changes = set()
+
+        catalog = self.load_charm_catalog()
+        catalog_changed = False
+        changed_keys = []
+        removed_keys = []
+
+        for path in paths:
+            old_key = self.script_keys_by_path.pop(path, None)
+            script_data = None
+            if os.path.isfile(path):
+                try:
+                    script_data, parsed = self.load_charm_entry(Path(path), catalog)
+                    catalog_changed = catalog_changed or parsed
+                except Exception as e:
+                    print(f"Error loading script {path}: {e}")
+            elif catalog.pop(path, None) is not None:
+                catalog_changed = True
+
+            new_key = self.get_script_key(script_data) if script_data else None
+            if old_key and old_key != new_key:
+                old_data = self.script_list.get(old_key)
+                if old_data and str(Path(old_data['script_path']).expanduser().resolve()) == path:
+                    del self.script_list[old_key]
+                    removed_keys.append(old_key)
+            if new_key:
+                self.script_keys_by_path[path] = new_key
+                if new_key in self.script_list:
+                    self.script_list[new_key] = script_data
                 else:
-                    self.script_list = {script_key: script_data, **self.script_list}
+                    self.script_list = {new_key: script_data, **self.script_list}
+                changed_keys.append(new_key)
 
-            except yaml.YAMLError as yaml_err:
-                print(f"YAML error in {script_file}: {yaml_err}")
-            except Exception as e:
-                print(f"Error loading script {script_file}: {e}")
+        if catalog_changed:
+            self.save_charm_catalog(catalog)
+
+        # The view is patched through the script change bus
+        print(f"Applied .charm changes: {len(changed_keys)} added/updated, {len(removed_keys)} removed")
+        return False
+
+    def on_script_changes(self, added_keys, changed_keys, removed_keys):
+        #self.print_method_name()
+        """
+        Receives the merged script_list changes of one frame from self.script_changes.
+        """
+        self.update_script_items(added_keys + changed_keys, removed_keys)
+
+    def update_script_items(self, changed_keys, removed_keys):
+        self.print_method_name()
+        """
+        Patches the script view for the given keys instead of rebuilding it: removed
+        scripts are dropped, changed ones rebound and new ones inserted at the top.
+        """
+        positions = {}
+        for position in range(self.script_store.get_n_items()):
+            positions[self.script_store.get_item(position).script_key] = position
+
+        for position in sorted((positions[key] for key in removed_keys if key in positions), reverse=True):
+            self.script_store.remove(position)
+        for key in removed_keys:
+            self.script_ui_data.pop(key, None)
+            self.search_index.remove(key)
+            self.script_facets.remove(key)
+            self.script_sort_keys.pop(key, None)
+
+        if removed_keys:
+            positions = {}
+            for position in range(self.script_store.get_n_items()):
+                positions[self.script_store.get_item(position).script_key] = position
+
+        added_keys = [key for key in changed_keys if key not in positions and key in self.script_list]
+        if len(added_keys) > self.script_batch_threshold:
+            self.queue_script_rows(added_keys)
+            changed_keys = [key for key in changed_keys if key in positions]
 
-        print(f"Loaded {len(self.script_list)} scripts.")
+        new_items = []
+        for key in changed_keys:
+            script_data = self.script_list.get(key)
+            if script_data is None:
+                continue
+            ui_state = self.script_ui_data.get(key)
+            if key in positions and ui_state:
+                # Replacing the item rebinds its cell with the new data
+                ui_state['script_path'] = Path(script_data['script_path']).expanduser()
+                self.index_script(key, script_data)
+                self.script_store.splice(positions[key], 1, [ScriptItem(key)])
+            elif key not in positions:
+                new_items.append(self.create_script_row(key, script_data))
+        if new_items:
+            self.script_store.splice(0, 0, new_items)
+
+        if self.sort_order and changed_keys:
+            self.sort_script_store()
+        # New scripts, and edited, renamed or restored ones that may point at another exe
+        self.check_exe_files(key for key in changed_keys if key in self.script_ui_data)
+
+        # Re-rank the active search and facets with the updated entries
+        if any(self.facet_selection.values()):
+            self.facet_matches = self.script_facets.query(self.facet_selection)
+        if self.search_ranks is not None:
+            self.filter_script_list(self.search_entry.get_text())
+        elif self.facet_matches is not None:
+            self.refresh_script_filter()
+
+    def request_catalog_refresh(self, prefixdir=None):
+        self.print_method_name()
+        """
+        Makes sure .charm changes on disk reach script_list. With the file monitors running
+        this is already handled incrementally; otherwise fall back to a rescan.
+        """
+        if self.charm_monitors:
+            return False
+        self.load_script_list(prefixdir)
+        return False
+########## /.charm file monitoring
 
 ##########################
 
@@ -6853,7 +9829,7 @@ class WineCharmApp(Gtk.Application):
         script = Path(script_data.get('script_path', '')).expanduser().resolve()
         progname = script_data.get('progname', '')
         script_args = script_data.get('args', '')
-        script_key = script_data.get('sha256sum', script_key)
+        script_key = self.get_script_key(script_data, script_key)
         env_vars = script_data.get('env_vars', '')
         wine_debug = script_data.get('wine_debug', '')
         exe_name = Path(exe_file).name
@@ -7258,6 +10234,7 @@ class WineCharmApp(Gtk.Application):
 
             # Update the script data with the new prefix path
             self.script_list[script_key]['wineprefix'] = str(new_wineprefix)
+            self.script_changes.emit('changed', script_key)
 
             print(f"Successfully renamed Wine prefix to '{new_name}'.")
 
@@ -7342,10 +10319,11 @@ class WineCharmApp(Gtk.Application):
 
             # Update the script list and any other relevant UI data
             self.script_list[script_key] = script_data
-            self.script_ui_data[script_key]['script_path'] = script_data['script_path']
+            if script_key in self.script_ui_data:
+                self.script_ui_data[script_key]['script_path'] = script_data['script_path']
 
-            # Reload script list from files
-            self.load_script_list()
+            # Pick up the moved .charm files
+            self.request_catalog_refresh()
 
     def wine_config(self, script, script_key, *args):
         self.print_method_name()
@@ -7361,7 +10339,7 @@ class WineCharmApp(Gtk.Application):
         script = Path(script_data.get('script_path', '')).expanduser().resolve()
         progname = script_data.get('progname', '')
         script_args = script_data.get('args', '')
-        script_key = script_data.get('sha256sum', script_key)
+        script_key = self.get_script_key(script_data, script_key)
         env_vars = script_data.get('env_vars', '')
         wine_debug = script_data.get('wine_debug', '')
         exe_name = Path(exe_file).name
@@ -7413,7 +10391,7 @@ class WineCharmApp(Gtk.Application):
         script = Path(script_data.get('script_path', '')).expanduser().resolve()
         progname = script_data.get('progname', '')
         script_args = script_data.get('args', '')
-        script_key = script_data.get('sha256sum', script_key)
+        script_key = self.get_script_key(script_data, script_key)
         env_vars = script_data.get('env_vars', '')
         wine_debug = script_data.get('wine_debug', '')
         exe_name = Path(exe_file).name
@@ -7531,6 +10509,7 @@ class WineCharmApp(Gtk.Application):
             ("Template Delete", "user-trash-symbolic", self.delete_template),
             ("Set Wine Arch", "preferences-system-symbolic", self.set_wine_arch),
             ("Single Prefix Mode", "folder-symbolic", self.single_prefix_mode),
+            ("Wineserver Pre-warm", "media-playback-start-symbolic", self.wineserver_prewarm_mode),
         ]
 
         # Initial population of options
@@ -7663,6 +10642,89 @@ class WineCharmApp(Gtk.Application):
             print("Reverting to multiple prefixes")
 ##################### / single prefix mode
 
+#####################  wineserver pre-warm
+
+    def wineserver_prewarm_mode(self):
+        self.print_method_name()
+        dialog = Adw.AlertDialog(
+            heading="Wineserver Pre-warm",
+            body="Start the wineserver of a game's prefix when the game is selected or hovered, "
+                 "so it starts faster. An unused wineserver exits after a minute."
+        )
+
+        prewarm_check = Gtk.CheckButton(label="Pre-warm wineserver")
+        prewarm_check.set_active(self.wineserver_prewarm)
+        dialog.set_extra_child(prewarm_check)
+
+        dialog.add_response("cancel", "Cancel")
+        dialog.add_response("apply", "Apply")
+        dialog.set_response_appearance("apply", Adw.ResponseAppearance.SUGGESTED)
+        dialog.set_default_response("cancel")
+
+        def on_response(dialog, response):
+            self.print_method_name()
+            if response == "apply" and prewarm_check.get_active() != self.wineserver_prewarm:
+                self.wineserver_prewarm = prewarm_check.get_active()
+                self.save_settings()
+                print(f"Wineserver pre-warm {'enabled' if self.wineserver_prewarm else 'disabled'}")
+            dialog.close()
+
+        dialog.connect("response", on_response)
+        dialog.present(self.window)
+
+    def prewarm_wineserver(self, script_key):
+        #self.print_method_name()
+        """
+        Starts the wineserver of a script's prefix in the background if pre-warming is
+        enabled, the script is not running and the prewarmer's limits allow it.
+        """
+        if not self.wineserver_prewarm or script_key in self.running_processes:
+            return
+        record = self.script_index.record(script_key)
+        if record is None or not record.wineprefix:
+            return
+        script_data = self.script_list.get(script_key, {})
+        env_vars = script_data.get('env_vars') or ''
+        uses_path_wine = (script_data.get('runner') or '').strip() in ("", "wine")
+
+        def warm():
+            # A launch runs the script's runner, or wine from PATH without one (see
+            # get_runner); the server has to be the one that runner would start
+            if not uses_path_wine:
+                wineserver = Path(record.runner).parent / "wineserver"
+                if not wineserver.exists():
+                    print(f"No wineserver next to {record.runner}, not pre-warming")
+                    return
+            else:
+                wineserver = shutil.which("wineserver")
+                if not wineserver:
+                    return
+            if self.wineserver_prewarmer.reserve(record.wineprefix):
+                self.wineserver_prewarmer.warm(record.wineprefix, wineserver, env_vars)
+
+        threading.Thread(target=warm, daemon=True).start()
+
+    def on_script_cell_enter(self, controller, x, y, overlay):
+        #self.print_method_name()
+        # Only a pointer resting on a cell counts, not one sweeping across the grid
+        if self.wineserver_prewarm and overlay.hover_source is None:
+            overlay.hover_source = GLib.timeout_add(400, self.on_script_cell_hovered, overlay)
+
+    def on_script_cell_leave(self, controller, overlay):
+        #self.print_method_name()
+        if overlay.hover_source is not None:
+            GLib.source_remove(overlay.hover_source)
+            overlay.hover_source = None
+
+    def on_script_cell_hovered(self, overlay):
+        #self.print_method_name()
+        overlay.hover_source = None
+        if overlay.script_key:
+            self.prewarm_wineserver(overlay.script_key)
+        return False
+
+##################### / wineserver pre-warm
+
     # Implement placeholders for each setting's callback function
     def set_default_runner(self, action=None):
         self.print_method_name()
@@ -8647,7 +11709,7 @@ class WineCharmApp(Gtk.Application):
             self.open_button.disconnect(self.open_button_handler_id)
             self.open_button_handler_id = self.open_button.connect("clicked", self.on_open_button_clicked)
         
-        self.flowbox.remove_all()
+        self.show_step_flowbox()
 
 
 
@@ -8835,7 +11897,7 @@ class WineCharmApp(Gtk.Application):
                 print(f"Backed up existing directory to: {backup_dir}")
 
             # Clear the flowbox and show progress spinner
-            GLib.idle_add(self.flowbox.remove_all)
+            GLib.idle_add(self.show_step_flowbox)
             self.show_processing_spinner(f"Restoring")
             #self.disconnect_open_button()
             #self.connect_open_button_with_import_wine_directory_cancel()
@@ -8848,6 +11910,8 @@ class WineCharmApp(Gtk.Application):
                     else:
                         restore_steps = self.get_restore_steps(file_path)
 
+                    self.total_steps = len(restore_steps)
+
                     # Perform restore steps
                     for step_text, step_func in restore_steps:
                         if self.stop_processing:
@@ -9029,12 +12093,8 @@ class WineCharmApp(Gtk.Application):
             """)
             # Regenerate sha256sum if missing
             if exe_file and not sha256sum:
-                sha256_hash = hashlib.sha256()
                 try:
-                    with open(exe_file, "rb") as f:
-                        for byte_block in iter(lambda: f.read(4096), b""):
-                            sha256_hash.update(byte_block)
-                    sha256sum = sha256_hash.hexdigest()
+                    sha256sum = self.hash_cache.sha256(exe_file, is_cancelled=self.is_hash_cancelled)
                     print(f"Warning: sha256sum missing in {exe_file}. Regenerated hash.")
                 except FileNotFoundError:
                     print(f"Error: {exe_file} not found. Cannot compute sha256sum.")
@@ -9069,7 +12129,7 @@ class WineCharmApp(Gtk.Application):
 
                         
                         ## Add the new script data directly to the script list
-                        self.new_scripts.add(Path(yml_path).stem)
+                        self.mark_script_new(Path(yml_path).stem)
                         print(f"Created {yml_path}")
                         created_charm_files = True  # Mark that at least one .charm file was created
                         
@@ -9226,7 +12286,7 @@ class WineCharmApp(Gtk.Application):
             yaml.dump(updated_lnk_files, file, default_flow_style=False)
 
         print(f"Saved {len(lnk_files)} .lnk files to {found_lnk_files_path}")
-        self.load_script_list(wineprefix)
+        self.request_catalog_refresh(wineprefix)
 
     def parse_info_file(self, file_path):
         self.print_method_name()
@@ -9268,13 +12328,13 @@ class WineCharmApp(Gtk.Application):
                         continue
 
                     # Extract the script key (e.g., sha256sum) from the loaded data
-                    script_key = script_data.get('sha256sum')
+                    script_key = self.get_script_key(script_data)
                     if not script_key:
                         print(f"Missing 'sha256sum' in {charm_file}, skipping...")
                         continue
 
                     # Add the new script data directly to self.script_list
-                    self.new_scripts.add(charm_file.stem)
+                    self.mark_script_new(charm_file.stem)
                     # Set 'script_path' to the charm file itself if not already set
                     script_data['script_path'] = str(charm_file.expanduser().resolve())
                     self.script_list = {script_key: script_data, **self.script_list}
@@ -9310,7 +12370,7 @@ class WineCharmApp(Gtk.Application):
 
 
         # Restore the script list in the flowbox
-        GLib.idle_add(self.create_script_list)
+        GLib.idle_add(self.show_script_list)
 
         print("Restore process completed and script list restored.")
 
@@ -9335,18 +12395,36 @@ class WineCharmApp(Gtk.Application):
             def preexec_function():
                 os.setpgrp()
 
-            # Extract the archive with process tracking
+            # Extract the archive with process tracking. The archive is fed to tar
+            # through stdin so the bytes written give a real fraction and ETA
             extract_process = subprocess.Popen(
-                ['tar', '-I', 'zstd -T0', '-xf', file_path, '-C', self.prefixes_dir,
+                ['tar', '-I', 'zstd -T0', '-xf', '-', '-C', self.prefixes_dir,
                  "--transform", rf"s|XOUSERXO|{current_username}|g", 
                  "--transform", rf"s|%USERNAME%|{current_username}|g"],
+                stdin=subprocess.PIPE,
                 preexec_fn=preexec_function
             )
             
             with self.process_lock:
                 self.current_process = extract_process
 
-            while extract_process.poll() is None:
+            self.progress.set_total(os.path.getsize(file_path))
+            with open(file_path, 'rb') as archive:
+                try:
+                    for chunk in iter(lambda: archive.read(1024 * 1024), b''):
+                        if self.stop_processing:
+                            break
+                        extract_process.stdin.write(chunk)
+                        self.progress.advance(len(chunk))
+                except BrokenPipeError:
+                    pass  # tar exited early; its return code says why
+                finally:
+                    try:
+                        extract_process.stdin.close()
+                    except BrokenPipeError:
+                        pass
+
+            while True:
                 if self.stop_processing:
                     print("Cancellation requested, terminating tar process...")
                     self._kill_current_process()
@@ -9357,6 +12435,8 @@ class WineCharmApp(Gtk.Application):
                         shutil.rmtree(extracted_prefix_dir, ignore_errors=True)
                     
                     raise Exception("Operation cancelled by user")
+                if extract_process.poll() is not None:
+                    break
                 time.sleep(0.1)
 
             if extract_process.returncode != 0:
@@ -9560,6 +12640,7 @@ class WineCharmApp(Gtk.Application):
             total_files = sum(1 for _, _, files in os.walk(directory) 
                             for _ in files)
             processed_files = 0
+            self.progress.set_total(total_files)
 
             for root, dirs, files in os.walk(directory):
                 if self.stop_processing:
@@ -9572,11 +12653,8 @@ class WineCharmApp(Gtk.Application):
                     processed_files += 1
                     file_path = Path(root) / file
 
-                    # Update progress
-                    if hasattr(self, 'progress_bar'):
-                        GLib.idle_add(
-                            lambda: self.progress_bar.set_fraction(processed_files / total_files)
-                        )
+                    # Update progress; sampled by the UI, so this is cheap
+                    self.progress.advance()
 
                     # Skip binary files
                     if self.is_binary_file(file_path):
@@ -9895,7 +12973,6 @@ class WineCharmApp(Gtk.Application):
                 GLib.idle_add(self.show_initializing_step, step_text)
                 step_func()
                 GLib.idle_add(self.mark_step_as_done, step_text)
-                GLib.idle_add(lambda: self.progress_bar.set_fraction(index / self.total_steps))
 
             GLib.idle_add(self.show_info_dialog, "Success", 
                         f"Template '{dst.name}' imported successfully")
@@ -10012,7 +13089,6 @@ class WineCharmApp(Gtk.Application):
                 GLib.idle_add(self.show_initializing_step, step_text)
                 step_func()
                 GLib.idle_add(self.mark_step_as_done, step_text)
-                GLib.idle_add(lambda: self.progress_bar.set_fraction(index / self.total_steps))
 
             GLib.idle_add(self.show_info_dialog, "Success", 
                         f"Runner '{dst.name}' imported successfully")
@@ -10423,7 +13499,7 @@ class WineCharmApp(Gtk.Application):
                 print(f"Backed up existing template directory to: {backup_dir}")
 
             # UI setup
-            GLib.idle_add(self.flowbox.remove_all)
+            GLib.idle_add(self.show_step_flowbox)
             self.show_processing_spinner("Restoring Template")
             self.connect_open_button_with_restore_backup_cancel()
 
@@ -10822,167 +13898,45 @@ class WineCharmApp(Gtk.Application):
 
 
 
-def parse_args():
-    WineCharmApp().print_method_name()
-    """
-    Parse command-line arguments.
-    """
-    parser = argparse.ArgumentParser(description="WineCharm GUI application or headless mode for .charm files")
-    parser.add_argument('file', nargs='?', help="Path to the .exe, .msi, .charm, .bottle, .prefix, or .wzt file")
-    return parser.parse_args()
+if TRACER.enabled:
+    TRACER.instrument(WineCharmApp)
 
-def main():
 
-    WineCharmApp().print_method_name()
-    args = parse_args()
+def main(args=None):
+    """
+    Starts the GUI. Cases that need no window are handled by run_without_gui
+    before gi is imported, so only one WineCharmApp is ever constructed.
+    """
+    if args is None:
+        args = parse_args()
+        if run_without_gui(args):
+            return
 
     # Create an instance of WineCharmApp
     app = WineCharmApp()
 
     # If a file is provided, handle it appropriately
     if args.file:
-        file_path = Path(args.file).expanduser().resolve()
-        file_extension = file_path.suffix.lower()
-
-        # If it's a .charm file, launch it without GUI
-        if file_extension == '.charm':
-            try:
-                # Load the .charm file data
-                with open(file_path, 'r', encoding='utf-8') as file:
-                    script_data = yaml.safe_load(file)
-
-                exe_file = script_data.get("exe_file")
-                if not exe_file:
-                    print("Error: No executable file defined in the .charm script.")
-                    sys.exit(1)
-
-                # Prepare to launch the executable
-                exe_path = Path(exe_file).expanduser().resolve()
-                if not exe_path.exists():
-                    print(f"Error: Executable '{exe_path}' not found.")
-                    sys.exit(1)
-
-                # Extract additional environment and arguments
-
-                # if .charm file has script_path use it
-                wineprefix_path_candidate = script_data.get('script_path')
-
-                if not wineprefix_path_candidate:  # script_path not found
-                    # if .charm file has wineprefix in it, then use it
-                    wineprefix_path_candidate = script_data.get('wineprefix')
-                    if not wineprefix_path_candidate:  # if wineprefix not found
-                        wineprefix_path_candidate = file_path  # use the current .charm file's path
-
-                # Resolve the final wineprefix path
-                wineprefix = Path(wineprefix_path_candidate).parent.expanduser().resolve()
-
-                env_vars = script_data.get("env_vars", "").strip()
-                script_args = script_data.get("args", "").strip()
-                runner = script_data.get("runner", "wine")
-
-                # Resolve runner path
-                if runner:
-                    runner = Path(runner).expanduser().resolve()
-                    runner_dir = str(runner.parent.expanduser().resolve())
-                    path_env = f'export PATH="{runner_dir}:$PATH"'
-                else:
-                    runner = "wine"
-                    runner_dir = ""  # Or set a specific default if required
-                    path_env = ""
-
-                # Prepare the command safely using shlex for quoting
-                exe_parent = shlex.quote(str(exe_path.parent.resolve()))
-                wineprefix = shlex.quote(str(wineprefix))
-                runner = shlex.quote(str(runner))
-
-                # Construct the command parts
-                command_parts = []
-
-                # Add path to runner if it exists
-                if path_env:
-                    command_parts.append(f"{path_env}")
-
-                # Change to the executable's directory
-                command_parts.append(f"cd {exe_parent}")
-
-                # Add environment variables if present
-                if env_vars:
-                    command_parts.append(f"{env_vars}")
-
-                # Add wineprefix and runner
-                command_parts.append(f"WINEPREFIX={wineprefix} {runner} {shlex.quote(str(exe_path))}")
-
-                # Add script arguments if present
-                if script_args:
-                    command_parts.append(f"{script_args}")
-
-                # Join all the command parts
-                command = " && ".join(command_parts)
-
-                print(f"Executing: {command}")
-                subprocess.run(command, shell=True)
-
-                # Exit after headless execution to ensure no GUI elements are opened
-                sys.exit(0)
-
-            except Exception as e:
-                print(f"Error: Unable to launch the .charm script: {e}")
-                sys.exit(1)
+        file_extension = Path(args.file).suffix.lower()
 
         # For .exe, .msi, .bottle, .prefix, or .wzt files, handle via GUI mode
-        elif file_extension in ['.exe', '.msi', '.bottle', '.prefix', '.wzt']:
-            if app.SOCKET_FILE.exists():
-                try:
-                    # Send the file to an existing running instance
-                    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
-                        client.connect(str(app.SOCKET_FILE))
-                        message = f"process_file||{args.file}"
-                        client.sendall(message.encode())
-                        print(f"Sent file path to existing instance: {args.file}")
-                    return
-                except ConnectionRefusedError:
-                    print("No existing instance found, starting a new one.")
-
-            # If no existing instance is running, proceed with normal startup and processing
+        if file_extension in GUI_FILE_EXTENSIONS:
             app.command_line_file = args.file
-
         else:
-            # Check if it's a supported backup file type
-            if file_extension in ['.bottle', '.prefix', '.wzt']:
-                app.command_line_file = args.file
-            else:
-                # Invalid file type, print error and handle accordingly
-                print(f"Invalid file type: {file_extension}. Only .exe, .msi, .charm, .bottle, .prefix, or .wzt files are allowed.")
-
-                # If no instance is running, start WineCharmApp and show the error dialog directly
-                if not app.SOCKET_FILE.exists():
-                    app.start_socket_server()
-                    GLib.timeout_add_seconds(1.5, app.show_info_dialog, "Invalid File Type", f"Only .exe, .msi, .charm, .bottle, .prefix, or .wzt files are allowed. You provided: {file_extension}")
-                    app.run(sys.argv)
-
-                    # Clean up the socket file
-                    if app.SOCKET_FILE.exists():
-                        app.SOCKET_FILE.unlink()
-                else:
-                    # If an instance is running, send the error message to the running instance
-                    try:
-                        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
-                            client.connect(str(app.SOCKET_FILE))
-                            message = f"show_dialog||Invalid file type: {file_extension}||Only .exe, .msi, .charm, .bottle, .prefix, or .wzt files are allowed."
-                            client.sendall(message.encode())
-                        return
-                    except ConnectionRefusedError:
-                        print("No existing instance found, starting a new one.")
+            # No instance is running, start WineCharmApp and show the error dialog directly
+            app.start_socket_server()
+            GLib.timeout_add_seconds(1.5, app.show_info_dialog, "Invalid File Type", f"{INVALID_FILE_TYPE_MESSAGE} You provided: {file_extension}")
+            app.run(sys.argv)
 
-                # Return early to skip further processing
-                return
+            # Clean up the socket file
+            if app.SOCKET_FILE.exists():
+                app.SOCKET_FILE.unlink()
+            return
 
     # Start the socket server and run the application (GUI mode)
-    if args.file and file_extension in ['.bottle', '.prefix', '.wzt']:
-        app.command_line_file = args.file
     app.start_socket_server()
     app.run(sys.argv)
 
 
 if __name__ == "__main__":
-    main()
+    main(cli_args)
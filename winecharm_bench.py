@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the WineCharm script library at scale.
+
+Generates a synthetic library (prefixes, .charm files, PNG icons and dummy .exe files)
+in a temporary HOME, then times find_charm_files, load_script_list (cold and warm
+catalog), building the script view the way startup does (with the longest main loop
+block), filter_script_list and sorting on a WineCharmApp that is never shown.
+Results are printed as JSON so runs can be compared across commits.
+
+GTK needs a display to create widgets; on a machine without one run it under
+xvfb-run (or GDK_BACKEND=broadway). The window is never presented.
+
+    ./winecharm_bench.py --scripts 5000 --prefixes 50 --output bench.json
+"""
+
+import argparse
+import atexit
+import contextlib
+import hashlib
+import io
+import json
+import os
+import platform
+import random
+import resource
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import zlib
+from pathlib import Path
+
+SEARCH_QUERIES = ["setup", "game", "no", "launcher 1", "edtior", "zzz"]
+
+
+def make_png(size, rgb):
+    """Returns the bytes of a solid-color RGB PNG of size x size pixels."""
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xffffffff)
+
+    row = b"\x00" + bytes(rgb) * size
+    return (b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", struct.pack(">IIBBBBB", size, size, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(row * size))
+            + chunk(b"IEND", b""))
+
+
+def generate_library(prefixes_dir, scripts, prefixes, seed):
+    """
+    Creates prefixes with drive_c, dummy executables, .charm files and icons.
+    The same seed always produces the same library.
+    """
+    rng = random.Random(seed)
+    words = ["game", "setup", "editor", "launcher", "studio", "player", "tool", "notepad", "office", "viewer"]
+    runners = ["", "~/.var/app/io.github.fastrizwaan.WineCharm/data/winecharm/Runners/wine-9.0/bin/wine"]
+    icon = make_png(128, (120, 40, 200))
+
+    for index in range(scripts):
+        prefix = prefixes_dir / f"Prefix-{index % prefixes:04d}"
+        exe_dir = prefix / "drive_c" / "Program Files" / f"App{index}"
+        exe_dir.mkdir(parents=True, exist_ok=True)
+
+        progname = f"{rng.choice(words).title()} {rng.choice(words)} {index}"
+        exe_file = exe_dir / f"{progname.replace(' ', '_').lower()}.exe"
+        exe_bytes = b"MZ" + rng.randbytes(rng.randint(1024, 8192))
+        exe_file.write_bytes(exe_bytes)
+
+        script_path = prefix / f"{progname.replace(' ', '_')}.charm"
+        script_data = {
+            'exe_file': str(exe_file),
+            'script_path': str(script_path),
+            'wineprefix': str(prefix),
+            'progname': progname,
+            'args': "",
+            'sha256sum': hashlib.sha256(exe_bytes).hexdigest(),
+            'runner': rng.choice(runners),
+            'wine_debug': "WINEDEBUG=fixme-all DXVK_LOG_LEVEL=none",
+            'env_vars': ""
+        }
+        with open(script_path, 'w') as f:
+            json.dump(script_data, f)  # JSON is valid YAML and much faster to write
+        if index % 3:
+            script_path.with_suffix(".png").write_bytes(icon)
+
+
+def rss_kb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=Path(__file__).parent,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+class Bench:
+    def __init__(self, quiet=True):
+        self.stages = {}
+        self.quiet = quiet
+
+    def run(self, name, func, items):
+        """Times func, which handles `items` things, and records its throughput."""
+        output = io.StringIO()
+        redirect = contextlib.redirect_stdout(output) if self.quiet else contextlib.nullcontext()
+        begin = time.perf_counter()
+        with redirect:
+            result = func()
+        seconds = time.perf_counter() - begin
+        self.stages[name] = {
+            'seconds': round(seconds, 6),
+            'items': items,
+            'items_per_second': round(items / seconds, 1) if seconds else None,
+            'peak_rss_kb': rss_kb()
+        }
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark WineCharm library loading and filtering.")
+    parser.add_argument("--scripts", type=int, default=2000, help="number of .charm files to generate")
+    parser.add_argument("--prefixes", type=int, default=20, help="number of prefixes to spread them over")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the generated library")
+    parser.add_argument("--output", help="write the JSON report to this file as well")
+    parser.add_argument("--keep", action="store_true", help="keep the generated library")
+    parser.add_argument("--verbose", action="store_true", help="show WineCharm's own output")
+    args = parser.parse_args()
+
+    home = Path(tempfile.mkdtemp(prefix="winecharm-bench-"))
+    # WineCharm derives all of its directories from HOME; set it before importing
+    os.environ["HOME"] = str(home)
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    if not args.keep:
+        # Registered first so it runs after WineCharm's own exit handlers
+        atexit.register(shutil.rmtree, home, True)
+
+    bench = Bench(quiet=not args.verbose)
+    try:
+        import winecharm
+        from gi.repository import GLib, Gio
+
+        app = bench.run("init", winecharm.WineCharmApp, 1)
+        # Registering emits "startup", which builds the (hidden) window; the deferred
+        # startup phases need a running main loop and are measured separately below
+        app.set_flags(app.get_flags() | Gio.ApplicationFlags.NON_UNIQUE)
+        bench.run("startup-critical-ui", lambda: app.register(None), 1)
+        bench.run("generate", lambda: generate_library(app.prefixes_dir, args.scripts, args.prefixes, args.seed),
+                  args.scripts)
+
+        charm_files = bench.run("find_charm_files", app.find_charm_files, args.scripts)
+        assert len(charm_files) == args.scripts, f"found {len(charm_files)} of {args.scripts} .charm files"
+
+        bench.run("load_script_list-cold", app.load_script_list, args.scripts)
+        # A new session reads the catalog written by the cold load
+        app.charm_catalog = None
+        bench.run("load_script_list-warm", app.load_script_list, args.scripts)
+
+        longest_block = 0.0
+
+        def create_all():
+            # The startup path: the catalog has been loaded into script_list (emitting
+            # 'added' for every script) and the script view step builds the list. Rows
+            # after the first screenful are added from idle callbacks
+            nonlocal longest_block
+            begin = time.perf_counter()
+            app.on_startup_catalog_loaded()
+            longest_block = time.perf_counter() - begin
+            context = GLib.MainContext.default()
+            while app.script_list_source_id is not None:
+                begin = time.perf_counter()
+                context.iteration(True)
+                longest_block = max(longest_block, time.perf_counter() - begin)
+        bench.run("create_script_list", create_all, args.scripts)
+        # What the user feels: the longest time the main loop was kept busy at once
+        bench.stages["create_script_list"]['longest_block_ms'] = round(longest_block * 1000, 3)
+
+        def filter_all():
+            for query in SEARCH_QUERIES:
+                app.filter_script_list(query)
+            app.filter_script_list("")
+        bench.run("filter_script_list", filter_all, len(SEARCH_QUERIES) + 1)
+
+        def sort_all():
+            for param in ("progname::False", "wineprefix::True", "mtime::True"):
+                app.on_sort(None, GLib.Variant.new_string(param))
+        bench.run("sort", sort_all, 3)
+
+        report = {
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'scripts': args.scripts,
+            'prefixes': args.prefixes,
+            'seed': args.seed,
+            'stages': bench.stages,
+            'peak_rss_kb': rss_kb()
+        }
+    finally:
+        if args.keep:
+            print(f"Library kept in {home}", file=sys.stderr)
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+
+
+if __name__ == "__main__":
+    main()